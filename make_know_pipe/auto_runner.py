@@ -7,11 +7,15 @@ contextual SOURCE_ANALYSIS.md before running knowledge extraction.
 
 Usage:
     python auto_runner.py data/apps "I have 500 JSON API docs for make.com integrations"
+    python auto_runner.py data/apps "Full app catalog" --map-reduce --concurrency 16
+    python auto_runner.py data/apps "Full app catalog" --base HEAD~1   # reuse the last run for unchanged files
+    python auto_runner.py --resume <run-id>
 """
 
 import asyncio
 import sys
 from pathlib import Path
+from typing import Dict, List, Optional
 import logging
 
 # Set up logging
@@ -23,17 +27,32 @@ logger = logging.getLogger(__name__)
 
 # Import our modules
 from extractors.llm_router import LLMRouter
-from extractors.data_discovery import DataDiscovery
+from extractors.data_discovery import DataDiscovery, DataPattern
 from extractors.code_analyzer import CodeAnalyzer
 from extractors.doc_processor import DocProcessor
 from extractors.multimodal_processor import MultimodalProcessor
+from extractors.app_catalog import CatalogMapReduce
+from extractors.doc_processor import DocumentationInsight
+from extractors.git_diff import files_changed_since
 from generators.source_analysis_generator import SourceAnalysisGenerator
 from generators.tutorial_generator import TutorialGenerator
+from stage_graph import StageGraph
+from run_journal import RunJournal
+
+# Stages whose journal units are per input file, keyed by its path
+PER_FILE_STAGES = ('code_patterns', 'app_results', 'doc_insights')
 
 class AutoMakeKnowPipe:
     """Enhanced orchestrator with automatic data discovery and SOURCE_ANALYSIS generation"""
     
-    def __init__(self):
+    def __init__(self, stream: bool = False, llm_stage_limit: int = 3, journal: Optional[RunJournal] = None,
+                 map_reduce: bool = False, concurrency: int = 8, base_revision: Optional[str] = None):
+        self.stream = stream  # Write guides as knowledge is extracted instead of after all phases
+        self.llm_stage_limit = llm_stage_limit  # LLM-bound stages allowed to run at once
+        self.journal = journal  # Checkpoints finished stages and work units so a run can resume
+        self.map_reduce = map_reduce  # Extract every app and doc instead of a sample
+        self.concurrency = concurrency  # LLM calls in flight across app and doc extraction in map-reduce mode
+        self.base_revision = base_revision  # Git revision of the last completed run; unchanged files reuse its results
         self.llm_router = LLMRouter()
         
         # Initialize discovery and generation
@@ -44,6 +63,7 @@ class AutoMakeKnowPipe:
         self.code_analyzer = CodeAnalyzer(self.llm_router)
         self.doc_processor = DocProcessor(self.llm_router)
         self.multimodal_processor = MultimodalProcessor(self.llm_router)
+        self.catalog = CatalogMapReduce(self.llm_router, concurrency=concurrency)
         
         # Initialize generator
         self.tutorial_generator = TutorialGenerator()
@@ -64,51 +84,76 @@ class AutoMakeKnowPipe:
             return False
         
         try:
-            # Phase 0: Auto-discover data patterns
+            if self.base_revision and self.journal:
+                self._carry_over_unchanged(data_dir)
+            
+            # Discovery feeds every stage; the generated analysis and the extraction
+            # branches only share it, so they run concurrently
+            graph = self._build_graph(data_dir, use_case_description)
+            results = await graph.run()
+            data_patterns = results['data_patterns']
+            analysis_file = results['analysis_file']
+            generated_guides = results['guides']
+            source_paths = self._create_source_paths_from_patterns(data_dir, data_patterns)
+            
+            # Summary
+            logger.info("✅ Auto Make Know Pipe completed successfully!")
+            logger.info(f"📊 Generated {len(generated_guides)} tutorial guides "
+                        f"({self.tutorial_generator.unchanged_count} unchanged)")
+            
+            # Display results
+            self._display_auto_results(generated_guides, data_patterns, source_paths, analysis_file)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Auto pipeline failed: {e}")
+            logger.exception("Full error details:")
+            return False
+    
+    def _build_graph(self, data_dir: str, use_case_description: str) -> StageGraph:
+        """Pipeline stages: discovery, then analysis generation alongside JSON and doc extraction, then guides"""
+        generator = self.tutorial_generator
+        graph = StageGraph(limits={'llm': self.llm_stage_limit}, journal=self.journal)
+        on_patterns = None
+        if self.stream:
+            # Pattern guides are written as each file is processed
+            generator.begin_stream()
+            on_patterns = generator.add_patterns
+        
+        async def discover():
             logger.info("🔍 Phase 0: Auto-discovering data patterns...")
             data_patterns = await self.data_discovery.discover_data_patterns(data_dir)
-            
             if not data_patterns:
-                logger.error("❌ No data patterns discovered")
-                return False
-            
+                raise ValueError("No data patterns discovered")
             logger.info(f"✅ Discovered patterns in {len(data_patterns)} data types")
-            
-            # Phase 0.5: Generate contextual SOURCE_ANALYSIS.md
+            return data_patterns
+        
+        async def generate_analysis(data_patterns):
             logger.info("🎯 Phase 0.5: Generating contextual SOURCE_ANALYSIS.md...")
             source_analysis_content = await self.source_analysis_generator.generate_source_analysis(
                 data_patterns, data_dir, use_case_description
             )
-            
-            # Save generated analysis
             analysis_file = await self.source_analysis_generator.save_generated_analysis(
                 source_analysis_content, "./intake/auto_generated_analysis.md"
             )
-            
             logger.info(f"✅ Generated contextual SOURCE_ANALYSIS.md")
-            
-            # Phase 1: Parse the generated analysis and extract knowledge
-            logger.info("📋 Phase 1: Processing with generated analysis...")
-            
-            # Create source paths based on discovered patterns
-            source_paths = self._create_source_paths_from_patterns(data_dir, data_patterns)
-            
-            # Extract knowledge from sources
-            logger.info("🔍 Extracting knowledge from discovered sources...")
-            
+            return analysis_file
+        
+        async def process_json(data_patterns):
             code_patterns = {}
-            doc_insights = {}
-            multimodal_insights = {}
-            
-            # Process based on discovered data types
             if 'json_api_docs' in data_patterns:
                 logger.info("💻 Processing JSON API documentation...")
                 # Treat JSON API docs as structured data
-                json_paths = [str(Path(data_dir).rglob('*.json'))]
                 code_patterns['api_documentation'] = await self._process_json_as_structured_data(
-                    list(Path(data_dir).rglob('*.json'))[:50]  # Limit to 50 files
+                    list(Path(data_dir).rglob('*.json'))[:50],  # Limit to 50 files
+                    on_patterns,
+                    self.journal.units('code_patterns') if self.journal else None
                 )
-            
+            return code_patterns
+        
+        async def process_docs(data_patterns):
+            doc_insights = {}
             if 'markdown_docs' in data_patterns or 'text_docs' in data_patterns:
                 logger.info("📚 Processing documentation files...")
                 doc_paths = []
@@ -118,28 +163,109 @@ class AutoMakeKnowPipe:
                     doc_paths.extend([str(f) for f in Path(data_dir).rglob('*.txt')])
                 
                 if doc_paths:
-                    doc_insights = await self.doc_processor.extract_documentation_knowledge(doc_paths[:20])
-            
-            # Phase 2: Generate tutorial library
+                    doc_insights = await self.doc_processor.extract_documentation_knowledge(
+                        doc_paths if self.map_reduce else doc_paths[:20],
+                        self.journal.units('doc_insights') if self.journal else None
+                    )
+            # In map-reduce mode architecture guides also wait for the catalog syntheses
+            if self.stream and not self.map_reduce:
+                await generator.close_documentation(doc_insights)
+            return doc_insights
+        
+        async def map_apps(data_patterns):
+            if 'json_api_docs' not in data_patterns:
+                return []
+            logger.info("🗺️  Map: extracting every app definition...")
+            return await self.catalog.map_apps(
+                sorted(Path(data_dir).rglob('*.json')), on_patterns,
+                self.journal.units('app_results') if self.journal else None
+            )
+        
+        async def group_patterns(app_results):
+            # One how-to-build guide per app category
+            code_patterns = {}
+            for result in app_results:
+                code_patterns.setdefault(result.category, []).append(result.pattern)
+            return code_patterns
+        
+        async def reduce_categories(app_results):
+            if not app_results:
+                return {}
+            logger.info("🧩 Reduce: synthesizing app categories...")
+            return await self.catalog.reduce_categories(
+                app_results, self.journal.units('category_insights') if self.journal else None
+            )
+        
+        async def reduce_catalog(category_insights):
+            if not category_insights:
+                return None
+            logger.info("🧩 Reduce: synthesizing the whole catalog...")
+            return await self.catalog.reduce_corpus(category_insights)
+        
+        async def generate_guides(code_patterns, doc_insights, category_insights=None, catalog_insight=None):
+            multimodal_insights = {}
+            if self.map_reduce:
+                doc_insights = dict(doc_insights)
+                if category_insights:
+                    doc_insights['app_categories'] = list(category_insights.values())
+                if catalog_insight:
+                    doc_insights['app_catalog'] = [catalog_insight]
+                if self.stream:
+                    await generator.close_documentation(doc_insights)
+            if self.stream:
+                logger.info("📝 Finalizing cross-cutting guides...")
+                return await generator.finish_stream(multimodal_insights)
             logger.info("📝 Phase 2: Generating contextual tutorial library...")
-            
-            generated_guides = await self.tutorial_generator.generate_all_tutorials(
+            return await generator.generate_all_tutorials(
                 code_patterns, doc_insights, multimodal_insights
             )
-            
-            # Summary
-            logger.info("✅ Auto Make Know Pipe completed successfully!")
-            logger.info(f"📊 Generated {len(generated_guides)} tutorial guides")
-            
-            # Display results
-            self._display_auto_results(generated_guides, data_patterns, source_paths, analysis_file)
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Auto pipeline failed: {e}")
-            logger.exception("Full error details:")
-            return False
+        
+        # Discovery and the generated analysis are checkpointed whole; extraction stages per file
+        pattern_codec = (
+            lambda patterns: {data_type: [p.__dict__ for p in found] for data_type, found in patterns.items()},
+            lambda stored: {data_type: [DataPattern(**p) for p in found] for data_type, found in stored.items()}
+        )
+        graph.add('data_patterns', discover, uses=['llm'], codec=pattern_codec)
+        graph.add('analysis_file', generate_analysis, inputs=['data_patterns'], uses=['llm'],
+                  codec=(str, str))
+        graph.add('doc_insights', process_docs, inputs=['data_patterns'], uses=['llm'])
+        if not self.map_reduce:
+            graph.add('code_patterns', process_json, inputs=['data_patterns'])
+            graph.add('guides', generate_guides, inputs=['code_patterns', 'doc_insights'])
+            return graph
+        
+        # Map every app, then reduce per category and across the catalog. Catalog and
+        # documentation stages run side by side, so one limiter bounds all their LLM calls
+        limiter = asyncio.Semaphore(self.concurrency)
+        self.catalog.semaphore = limiter
+        self.doc_processor.limiter = limiter
+        insight_codec = (
+            lambda insight: insight.__dict__ if insight else None,
+            lambda stored: DocumentationInsight(**stored) if stored else None
+        )
+        graph.add('app_results', map_apps, inputs=['data_patterns'], uses=['llm'])
+        graph.add('code_patterns', group_patterns, inputs=['app_results'])
+        graph.add('category_insights', reduce_categories, inputs=['app_results'], uses=['llm'])
+        graph.add('catalog_insight', reduce_catalog, inputs=['category_insights'], uses=['llm'],
+                  codec=insight_codec)
+        graph.add('guides', generate_guides,
+                  inputs=['code_patterns', 'doc_insights', 'category_insights', 'catalog_insight'])
+        return graph
+    
+    def _carry_over_unchanged(self, data_dir: str):
+        """Seed this run with the last completed run's per-file results for files unchanged since the base"""
+        previous = self.journal.latest_run('completed', data_dir=data_dir, map_reduce=self.map_reduce)
+        if not previous:
+            logger.info(f"No completed run of {data_dir} to reuse; analyzing every file")
+            return
+        files = [str(f) for pattern in ('*.json', '*.md', '*.txt') for f in Path(data_dir).rglob(pattern)]
+        changed = files_changed_since(self.base_revision, files)
+        if changed is None:
+            logger.warning(f"Could not diff {data_dir} against {self.base_revision}; analyzing every file")
+            return
+        carried = self.journal.carry_units(previous, PER_FILE_STAGES, changed)
+        logger.info(f"Reusing {carried} file results from run {previous}; "
+                    f"{len(changed)} files changed since {self.base_revision}")
     
     def _create_source_paths_from_patterns(self, data_dir: str, data_patterns: Dict) -> Dict[str, List[str]]:
         """Create source paths based on discovered patterns"""
@@ -160,19 +286,25 @@ class AutoMakeKnowPipe:
         
         return source_paths
     
-    async def _process_json_as_structured_data(self, json_files: List[Path]) -> List:
-        """Process JSON files as structured API documentation data"""
+    async def _process_json_as_structured_data(self, json_files: List[Path], on_patterns=None, units=None) -> List:
+        """Process JSON files as structured API documentation data, passing each pattern to on_patterns"""
+        from extractors.code_analyzer import CodePattern
         patterns = []
         
         # Sample a few JSON files to understand structure
         for json_file in json_files[:10]:  # Process max 10 files
+            if units is not None and str(json_file) in units:
+                pattern = CodePattern.from_dict(units.get(str(json_file)))
+                patterns.append(pattern)
+                if on_patterns:
+                    await on_patterns('api_documentation', [pattern])
+                continue
             try:
                 with open(json_file, 'r', encoding='utf-8') as f:
                     # Read first 2000 characters to understand structure
                     sample_content = f.read(2000)
                 
                 # Create a pattern-like object for JSON API docs
-                from extractors.code_analyzer import CodePattern
                 pattern = CodePattern(
                     name=f"API Documentation - {json_file.stem}",
                     description=f"API documentation structure from {json_file.name}",
@@ -182,6 +314,10 @@ class AutoMakeKnowPipe:
                     file_path=str(json_file)
                 )
                 patterns.append(pattern)
+                if units is not None:
+                    units.record(str(json_file), pattern.to_dict())
+                if on_patterns:
+                    await on_patterns('api_documentation', [pattern])
                 
             except Exception as e:
                 logger.warning(f"Could not process JSON file {json_file}: {e}")
@@ -217,6 +353,8 @@ class AutoMakeKnowPipe:
                 print(f"     - {guide.title}")
             if len(type_guides) > 2:
                 print(f"     - ... and {len(type_guides) - 2} more")
+        if self.tutorial_generator.unchanged_count:
+            print(f"   • Unchanged since the last run: {self.tutorial_generator.unchanged_count} guides")
         
         print(f"\\n📁 OUTPUT LOCATIONS:")
         print(f"   • Generated Analysis: {analysis_file}")
@@ -236,31 +374,96 @@ async def main():
     print("-" * 70)
     
     # Parse command line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python auto_runner.py <data_directory> [use_case_description]")
-        print("\\nExample:")
+    stream = '--stream' in sys.argv
+    map_reduce = '--map-reduce' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in ('--stream', '--map-reduce')]
+    concurrency = 8
+    if '--concurrency' in args:
+        position = args.index('--concurrency')
+        value = args[position + 1] if position + 1 < len(args) else ''
+        args = args[:position] + args[position + 2:]
+        if not value.isdigit() or int(value) < 1:
+            print("Usage: --concurrency <positive number of LLM calls in flight>")
+            sys.exit(1)
+        concurrency = int(value)
+    base_revision = None
+    if '--base' in args:
+        position = args.index('--base')
+        base_revision = args[position + 1] if position + 1 < len(args) else None
+        args = args[:position] + args[position + 2:]
+        if not base_revision:
+            print("Usage: --base <git revision of the last completed run>")
+            sys.exit(1)
+    resume_id = None
+    if '--resume' in args:
+        position = args.index('--resume')
+        resume_id = args[position + 1] if position + 1 < len(args) else None
+        args = args[:position] + args[position + 2:]
+        if not resume_id:
+            print("Usage: python auto_runner.py --resume <run-id>")
+            sys.exit(1)
+    if not args and not resume_id:
+        print("Usage: python auto_runner.py <data_directory> [use_case_description] [--stream] [--map-reduce [--concurrency N]] [--base <rev>]")
+        print("       python auto_runner.py --resume <run-id>")
+        print("\nExample:")
         print("  python auto_runner.py data/apps 'JSON API docs for make.com integrations'")
         sys.exit(1)
     
-    data_dir = sys.argv[1]
-    use_case_description = sys.argv[2] if len(sys.argv) > 2 else ""
+    journal = RunJournal()
+    if resume_id:
+        try:
+            run_args = journal.resume(resume_id)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            journal.close()
+            sys.exit(1)
+        data_dir = run_args['data_dir']
+        use_case_description = run_args['use_case_description']
+        stream = run_args['stream']
+        map_reduce = run_args.get('map_reduce', False)
+        concurrency = run_args.get('concurrency', concurrency)
+        base_revision = run_args.get('base_revision')
+        run_id = resume_id
+    else:
+        data_dir = args[0]
+        use_case_description = args[1] if len(args) > 1 else ""
+        run_id = journal.start({'data_dir': data_dir, 'use_case_description': use_case_description,
+                                'stream': stream, 'map_reduce': map_reduce, 'concurrency': concurrency,
+                                'base_revision': base_revision})
     
     print(f"📂 Data Directory: {data_dir}")
     print(f"🎯 Use Case: {use_case_description}")
+    if map_reduce:
+        print(f"🗺️  Map-reduce over the full catalog, {concurrency} app and doc LLM calls in flight")
+    if base_revision:
+        print(f"🔁 Reusing the last completed run for files unchanged since {base_revision}")
+    print(f"🧾 Run ID: {run_id} (resume with --resume {run_id})")
     print("-" * 70)
     
     # Initialize and run auto pipeline
-    pipeline = AutoMakeKnowPipe()
-    success = await pipeline.run_auto_pipeline(data_dir, use_case_description)
+    pipeline = AutoMakeKnowPipe(stream=stream, journal=journal, map_reduce=map_reduce,
+                                concurrency=concurrency, base_revision=base_revision)
+    try:
+        success = await pipeline.run_auto_pipeline(data_dir, use_case_description)
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        # Ctrl-C: every finished unit is already committed; mark the run and checkpoint the WAL
+        journal.close('interrupted')
+        print(f"\n⏸️  Interrupted. Resume with: python auto_runner.py --resume {run_id}")
+        raise
+    journal.close('completed' if success else 'failed')
     
     if success:
-        print("\\n🎉 Auto knowledge discovery completed successfully!")
+        print("\n🎉 Auto knowledge discovery completed successfully!")
         print("Check the knowledge_library/ directory for your generated tutorials.")
         print("Review intake/auto_generated_analysis.md for the contextual analysis.")
     else:
-        print("\\n❌ Auto pipeline failed. Check the logs above for details.")
+        print("\n❌ Auto pipeline failed. Check the logs above for details.")
+        print(f"Resume with: python auto_runner.py --resume {run_id}")
         sys.exit(1)
 
 if __name__ == "__main__":
     # Run the async main function
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        sys.exit(130)
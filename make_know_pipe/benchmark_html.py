@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+HTML Conversion Benchmark
+
+Times html_to_markdown's streaming converter on synthetic pages of 1 and
+10 MB (100 MB on request) with deep nesting, large tables and many code
+blocks, plus the committed developer docs. Those are already Markdown, so
+that fixture measures the tokenizer on plain text, not HTML conversion.
+Reports throughput, p50/p99 time per file and peak traced memory per
+fixture, and compares them with a stored baseline.
+
+Synthetic pages are generated once into benchmarks/fixtures/. Timings are
+only compared on the host that saved the baseline (by fingerprint); peak
+memory is compared everywhere.
+
+Usage:
+    python benchmark_html.py                      # compare with the stored baseline
+    python benchmark_html.py --sizes 1,10,100 --repeat 10
+    python benchmark_html.py --save-baseline
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+from html_to_markdown import convert_stream
+
+PIPE_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(PIPE_DIR, 'benchmarks')
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'html_baseline.json')
+# Real files by fixture name; developerdocs.md was converted long ago and is plain Markdown now
+TEXT_FIXTURES = {'developerdocs-plaintext': os.path.join(PIPE_DIR, 'intake', 'data', 'developerdocs.md')}
+FIXTURE_VERSION = 1
+DEFAULT_SIZES = '1,10'  # 100 MB takes minutes; pass --sizes 1,10,100 for it
+
+# Metric -> True when larger is better
+METRICS = {'mb_per_s': True, 'p50_s': False, 'p99_s': False, 'peak_mb': False}
+# Timings of fixtures this fast are mostly noise
+MIN_COMPARED_SECONDS = 0.01
+
+WORDS = ("pipeline extractor guide pattern module config request response cache "
+         "index token parser stream batch worker schema record handler").split()
+
+def host_fingerprint() -> str:
+    """Identifies the machine and interpreter timings were measured on"""
+    description = '|'.join([platform.node(), platform.system(), platform.machine(), platform.processor(),
+                            str(os.cpu_count()), platform.python_implementation(), platform.python_version()])
+    return hashlib.sha256(description.encode('utf-8')).hexdigest()[:16]
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+def _nested_block(rng: random.Random, depth: int) -> str:
+    """Lists inside divs inside lists, depth levels deep"""
+    if depth == 0:
+        return f"<p>{_sentence(rng)} <strong>{rng.choice(WORDS)}</strong> <a href=\"/docs/{rng.choice(WORDS)}\">link</a></p>"
+    tag = 'ol' if depth % 2 else 'ul'
+    items = ''.join(f"<li><div>{_sentence(rng, 5)}</div>{_nested_block(rng, depth - 1)}</li>"
+                    for _ in range(2 if depth > 3 else 3))
+    return f"<div class=\"level-{depth}\"><{tag}>{items}</{tag}></div>"
+
+def _table(rng: random.Random, rows: int = 200, columns: int = 8) -> str:
+    head = ''.join(f"<th>{rng.choice(WORDS)}</th>" for _ in range(columns))
+    body = ''.join('<tr>' + ''.join(f"<td>{_sentence(rng, 3)} &amp; {rng.randint(0, 999)}</td>"
+                                    for _ in range(columns)) + '</tr>' for _ in range(rows))
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+def _code_blocks(rng: random.Random, count: int = 20) -> str:
+    blocks = []
+    for _ in range(count):
+        lines = '\n'.join(f"    {rng.choice(WORDS)} = {rng.choice(WORDS)}({rng.randint(0, 99)}) &lt; {rng.randint(0, 99)}"
+                          for _ in range(rng.randint(5, 25)))
+        blocks.append(f"<pre><code class=\"language-python\">def {rng.choice(WORDS)}():\n{lines}\n</code></pre>")
+    return ''.join(blocks)
+
+def synthetic_fixture(size_mb: int) -> str:
+    """Path of a generated page of roughly size_mb, built once and reused"""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    path = os.path.join(FIXTURE_DIR, f"synthetic-v{FIXTURE_VERSION}-{size_mb}mb.html")
+    if os.path.exists(path):
+        return path
+
+    rng = random.Random(size_mb)
+    target = size_mb * 1024 * 1024
+    written = 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("<html><head><title>Synthetic docs</title><style>body { margin: 0 }</style></head><body>\n")
+        section = 0
+        while written < target:
+            section += 1
+            chunk = (f"<h2>Section {section}: {_sentence(rng, 4)}</h2>"
+                     + _nested_block(rng, 8)
+                     + _table(rng)
+                     + _code_blocks(rng)
+                     + f"<blockquote><p>{_sentence(rng, 30)}</p></blockquote>\n")
+            f.write(chunk)
+            written += len(chunk.encode('utf-8'))
+        f.write("</body></html>\n")
+    os.replace(tmp_path, path)
+    return path
+
+def _convert(path: str) -> int:
+    """Stream a file through the converter into a discarding sink"""
+    written = [0]
+
+    def sink(text):
+        written[0] += len(text)
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as source:
+        convert_stream(source, sink)
+    return written[0]
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+def run_fixture(path: str, repeat: int) -> Dict[str, float]:
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _convert(path)
+        timings.append(time.perf_counter() - start)
+
+    # Memory in its own run: tracing slows conversion down severalfold
+    tracemalloc.start()
+    _convert(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'size_mb': round(size_mb, 3),
+        'mb_per_s': round(size_mb * len(timings) / sum(timings), 3),
+        'p50_s': round(_percentile(timings, 50), 4),
+        'p99_s': round(_percentile(timings, 99), 4),
+        'peak_mb': round(peak / (1024 * 1024), 3),
+    }
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float,
+            compare_timings: bool = True) -> List[str]:
+    """Regressions beyond tolerance, as readable lines; without compare_timings only memory is checked"""
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        timed = compare_timings and reference.get('p50_s', 0) >= MIN_COMPARED_SECONDS
+        for metric, higher_is_better in METRICS.items():
+            old, new = reference.get(metric), metrics[metric]
+            if not old or (not timed and metric != 'peak_mb'):
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{name} {metric}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML to Markdown conversion")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f"Synthetic page sizes in MB (default: {DEFAULT_SIZES})")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per fixture (default: 5)")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="Allowed regression (default: 0.15)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    args = parser.parse_args()
+
+    fixtures = {name: path for name, path in TEXT_FIXTURES.items() if os.path.exists(path)}
+    for size in (int(size) for size in args.sizes.split(',') if size.strip()):
+        print(f"Preparing {size} MB synthetic page...")
+        fixtures[f"synthetic-{size}mb"] = synthetic_fixture(size)
+
+    results = {}
+    print(f"\n{'fixture':<24}{'MB':>9}{'MB/s':>9}{'p50 s':>9}{'p99 s':>9}{'peak MB':>9}")
+    for name, path in fixtures.items():
+        metrics = run_fixture(path, args.repeat)
+        results[name] = metrics
+        print(f"{name:<24}{metrics['size_mb']:>9.2f}{metrics['mb_per_s']:>9.2f}"
+              f"{metrics['p50_s']:>9.3f}{metrics['p99_s']:>9.3f}{metrics['peak_mb']:>9.2f}")
+
+    host = host_fingerprint()
+    stored = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+
+    if args.save_baseline:
+        # Fixtures not re-run keep their numbers only when they came from this host
+        fixtures_saved = stored.get('fixtures', {}) if stored.get('host') == host else {}
+        fixtures_saved.update(results)
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'host': host, 'fixtures': fixtures_saved}, f, indent=2, sort_keys=True)
+        print(f"\n✅ Baseline saved: {BASELINE_PATH} (host {host})")
+        return
+
+    if not stored:
+        print("\nNo baseline stored yet; run with --save-baseline")
+        return
+    same_host = stored.get('host') == host
+    if not same_host:
+        print(f"\nBaseline was saved on another host ({stored.get('host')}); comparing peak memory only")
+
+    regressions = compare(results, stored.get('fixtures', {}), args.tolerance, compare_timings=same_host)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%} against {BASELINE_PATH}")
+
+if __name__ == "__main__":
+    main()
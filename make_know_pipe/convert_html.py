@@ -1,88 +1,50 @@
 #!/usr/bin/env python3
-import re
-
-# Read the HTML file
-with open('intake/data/developerdocs.md', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-print('Processing HTML content...')
-
-# Remove CSS styles and scripts
-content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-
-# Convert headings
-content = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1', content, flags=re.DOTALL)
-content = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1', content, flags=re.DOTALL) 
-content = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1', content, flags=re.DOTALL)
-content = re.sub(r'<h4[^>]*>(.*?)</h4>', r'#### \1', content, flags=re.DOTALL)
-content = re.sub(r'<h5[^>]*>(.*?)</h5>', r'##### \1', content, flags=re.DOTALL)
-content = re.sub(r'<h6[^>]*>(.*?)</h6>', r'###### \1', content, flags=re.DOTALL)
-
-# Convert paragraphs
-content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', content, flags=re.DOTALL)
-
-# Convert lists
-content = re.sub(r'<ul[^>]*>', '', content)
-content = re.sub(r'</ul>', '\n', content)
-content = re.sub(r'<ol[^>]*>', '', content)
-content = re.sub(r'</ol>', '\n', content)
-content = re.sub(r'<li[^>]*>(.*?)</li>', r'- \1', content, flags=re.DOTALL)
-
-# Convert links  
-content = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', content, flags=re.DOTALL)
-
-# Convert emphasis
-content = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', content, flags=re.DOTALL)
-content = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', content, flags=re.DOTALL)
-content = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', content, flags=re.DOTALL)
-content = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', content, flags=re.DOTALL)
-
-# Convert code
-content = re.sub(r'<code[^>]*>(.*?)</code>', r'`\1`', content, flags=re.DOTALL)
-content = re.sub(r'<pre[^>]*>(.*?)</pre>', r'```\n\1\n```', content, flags=re.DOTALL)
-
-# Convert time elements
-content = re.sub(r'<time[^>]*datetime="([^"]*)"[^>]*>[^<]*</time>', r'**Date: \1**', content)
-
-# Remove remaining HTML tags
-content = re.sub(r'<[^>]+>', '', content)
-
-# Clean up HTML entities
-entities = {
-    '&nbsp;': ' ',
-    '&amp;': '&',
-    '&lt;': '<', 
-    '&gt;': '>',
-    '&quot;': '"',
-    '&#39;': "'",
-    '&mdash;': '—',
-    '&ndash;': '–',
-    '&hellip;': '…'
-}
-
-for entity, replacement in entities.items():
-    content = content.replace(entity, replacement)
-
-# Clean up whitespace
-content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-content = re.sub(r'^\s+', '', content, flags=re.MULTILINE)
-content = content.strip()
-
-# Add header
-header = '''# Developer Documentation
-
-*Converted from HTML to Markdown*
-
----
-
-'''
-
-final_content = header + content
-
-# Write back to file
-with open('intake/data/developerdocs.md', 'w', encoding='utf-8') as f:
-    f.write(final_content)
-
-print('✅ HTML to Markdown conversion completed!')
-print('File saved: intake/data/developerdocs.md')
\ No newline at end of file
+"""
+Batch HTML to Markdown Conversion
+
+Converts files, directories (every .html / .htm below them) and globs in
+parallel on a process pool. Each page is written beside its input as .md,
+or mirrored under --out. Outputs newer than their inputs, and inputs that
+are already Markdown, are skipped.
+
+Usage:
+    python convert_html.py                           # intake/data/developerdocs.md in place, if still HTML
+    python convert_html.py scraped_site/ --out intake/data/site
+    python convert_html.py "exports/**/*.html" --workers 8 --force
+"""
+
+import argparse
+import sys
+
+from html_to_markdown import convert_batch, convert_file
+
+DEFAULT_INPUT = 'intake/data/developerdocs.md'
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert HTML pages to Markdown in parallel")
+    parser.add_argument('paths', nargs='*', help="Files, directories or glob patterns")
+    parser.add_argument('--out', help="Directory to mirror converted pages into")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Convert even when the output is up to date")
+    args = parser.parse_args()
+
+    if not args.paths:
+        # The original single export, converted in place
+        print('Processing HTML content...')
+        if not convert_file(DEFAULT_INPUT):
+            sys.exit(1)
+        return
+
+    summary = convert_batch(args.paths, output_dir=args.out, workers=args.workers, force=args.force)
+
+    seconds = max(summary['seconds'], 1e-9)
+    megabytes = summary['bytes'] / (1024 * 1024)
+    print(f"\n✅ Converted {summary['converted']} files "
+          f"({summary['skipped']} skipped as up to date or already Markdown, {summary['failed']} failed) in {summary['seconds']:.2f}s")
+    print(f"   {summary['converted'] / seconds:.1f} files/s, {megabytes / seconds:.2f} MB/s")
+
+    if summary['failed']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,16 @@ Knowledge extraction modules for different source types:
 - doc_processor: Process documentation and specs
 - api_analyzer: Analyze API structures and usage
 - multimodal_processor: Handle images, PDFs, logs
+- symbol_digest: Local AST digest of Python sources
+- source_walker: Single-walk source discovery with ignore rules
+- import_graph: Import graph centrality for key file selection
+- source_chunker: Split large source files at top-level boundaries
+- result_store: Content-hash store of per-file analysis results
+- git_diff: Changed symbol ranges for incremental analysis
+- pdf_text: Streaming PDF text extraction
+- log_miner: Streaming log template mining
+- log_incidents: Error and latency burst detection for logs
+- image_hash: Perceptual hashing to cluster near-duplicate images
+- vector_graphics: Local text extraction from SVG and draw.io diagrams
+- app_catalog: Map-reduce extraction over a full catalog of app definitions
 """
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+App Catalog - Map-reduce extraction over a full catalog of app definitions
+
+Map: every app JSON is digested locally (base URL, auth, modules by type,
+RPCs, webhooks, docs) and summarized by one LLM call into a category and
+a pattern; the app's own metadata category wins when it has one.
+Reduce: app summaries are synthesized per category, then the category
+syntheses into a corpus-level overview. All LLM calls share one bounded
+concurrency limit, so throughput grows with the limit instead of being
+capped by sampling.
+"""
+
+import asyncio
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+from .llm_router import LLMRouter, ContentType
+from .code_analyzer import CodePattern, PatternCallback
+from .doc_processor import DocumentationInsight
+
+logger = logging.getLogger(__name__)
+
+MODULE_TYPES = {1: 'trigger', 4: 'action', 9: 'search', 10: 'instant trigger', 11: 'responder', 12: 'universal'}
+
+# Category vocabulary; the map prompt asks the LLM to pick one of these keys
+CATEGORIES = ['ai', 'communication', 'email', 'marketing', 'crm_and_sales', 'ecommerce_and_payments',
+              'developer_tools', 'files_and_documents', 'productivity', 'databases', 'analytics',
+              'enterprise', 'other']
+
+# Fallback when neither the app nor the LLM names a category: whole name/label tokens, first match wins
+CATEGORY_KEYWORDS = {
+    'ai': {'ai', 'gpt', 'openai', 'llm', 'ml', 'anthropic', 'claude', 'gemini', 'mistral', 'vision', 'speech',
+           'tts', 'transcription', 'translate', 'translation', 'embeddings'},
+    'communication': {'chat', 'slack', 'discord', 'telegram', 'whatsapp', 'sms', 'messenger', 'teams', 'meet',
+                      'zoom', 'voip', 'webinar', 'threads', 'twitter', 'instagram', 'social'},
+    'email': {'email', 'mail', 'gmail', 'outlook', 'imap', 'smtp', 'inbox'},
+    'marketing': {'newsletter', 'campaign', 'campaigns', 'marketing', 'mailchimp', 'ads', 'advertising', 'seo'},
+    'crm_and_sales': {'crm', 'sales', 'leads', 'lead', 'hubspot', 'salesforce', 'pipedrive', 'deals'},
+    'ecommerce_and_payments': {'shop', 'shopify', 'store', 'commerce', 'ecommerce', 'woocommerce', 'stripe',
+                               'paypal', 'payments', 'invoice', 'invoices', 'billing', 'checkout'},
+    'developer_tools': {'github', 'gitlab', 'bitbucket', 'git', 'jira', 'api', 'http', 'webhook', 'webhooks',
+                        'json', 'ci', 'docker', 'aws', 'cloud'},
+    'files_and_documents': {'drive', 'dropbox', 'box', 'files', 'file', 'storage', 's3', 'pdf', 'docs',
+                            'document', 'documents', 'ocr', 'parser'},
+    'productivity': {'calendar', 'tasks', 'todo', 'notes', 'notion', 'trello', 'asana', 'forms', 'form',
+                     'survey', 'scheduling', 'project'},
+    'databases': {'database', 'db', 'sql', 'mysql', 'postgres', 'postgresql', 'mongodb', 'airtable', 'sheets',
+                  'table', 'tables'},
+    'analytics': {'analytics', 'metrics', 'tracking', 'dashboard', 'reporting'},
+    'enterprise': {'sap', 'oracle', 'erp', 'servicenow', 'workday', 'dynamics'},
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+def _category(name: str, label: str, categories: Optional[List[str]]) -> str:
+    """Category from app metadata, else from whole tokens of its name and label"""
+    if categories:
+        return str(categories[0]).lower().replace(' ', '_')
+    tokens = set(TOKEN_PATTERN.findall(f"{name} {label}".lower()))
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if tokens & keywords:
+            return category
+    return 'other'
+
+def _llm_category(lines: List[str]) -> Optional[str]:
+    """A category the LLM picked from CATEGORIES, if its answer names one"""
+    for line in lines:
+        answer = line.strip('`*. ').lower().replace(' ', '_').replace('-', '_')
+        if answer in CATEGORIES:
+            return answer
+    return None
+
+SECTION_PATTERN = re.compile(r'^#+\s*(.+?)\s*$')
+
+def _sections(text: str) -> Dict[str, List[str]]:
+    """Markdown response -> lowercased heading -> bullet points (or paragraph lines)"""
+    sections: Dict[str, List[str]] = {}
+    current = ''
+    for line in text.split('\n'):
+        line = line.strip()
+        heading = SECTION_PATTERN.match(line)
+        if heading:
+            current = heading.group(1).lower()
+            sections.setdefault(current, [])
+        elif line:
+            point = line[2:].strip() if line.startswith(('- ', '* ')) else line
+            sections.setdefault(current, []).append(point)
+    return sections
+
+def _find(sections: Dict[str, List[str]], *names: str) -> List[str]:
+    for heading, lines in sections.items():
+        if any(name in heading for name in names):
+            return lines
+    return []
+
+class AppDigest:
+    """Compact, local description of one app definition"""
+    def __init__(self, path: str, name: str, label: str, category: str, text: str, module_counts: Dict[str, int],
+                 has_metadata_category: bool = False):
+        self.path = path
+        self.name = name
+        self.label = label
+        self.category = category
+        self.has_metadata_category = has_metadata_category  # From the app's own 'categories' field
+        self.text = text
+        self.module_counts = module_counts
+
+def digest_app(path: Path, docs_chars: int = 1500, max_modules: int = 40) -> AppDigest:
+    """Read a whole app definition and keep what describes its integration design"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    name = data.get('name') or path.stem
+    label = data.get('label') or name
+    base = data.get('base') or {}
+    accounts = data.get('_accounts') or {}
+    modules = data.get('_modules') or {}
+
+    module_counts = Counter(MODULE_TYPES.get(module.get('typeId'), 'module')
+                            for module in modules.values() if isinstance(module, dict))
+    lines = [f"App: {label} ({name}), version {data.get('version', '?')}",
+             f"Base URL: {base.get('baseUrl', 'n/a')}"]
+    if accounts:
+        auth = ', '.join(sorted({str(account.get('type')) for account in accounts.values() if isinstance(account, dict)}))
+        lines.append(f"Connections ({len(accounts)}): {auth}")
+    if base.get('response', {}).get('error'):
+        lines.append("Shared error handling in base response")
+    if base.get('log', {}).get('sanitize'):
+        lines.append(f"Sanitized log fields: {', '.join(base['log']['sanitize'])}")
+
+    lines.append(f"Modules ({len(modules)}): " + ', '.join(f"{count} {kind}" for kind, count in module_counts.most_common()))
+    for module in list(modules.values())[:max_modules]:
+        if not isinstance(module, dict):
+            continue
+        kind = MODULE_TYPES.get(module.get('typeId'), 'module')
+        description = ' '.join(str(module.get('description') or '').split())[:160]
+        lines.append(f"- {module.get('label') or module.get('name')} [{kind}]" + (f": {description}" if description else ''))
+    if len(modules) > max_modules:
+        lines.append(f"- ... and {len(modules) - max_modules} more modules")
+
+    for key, title in (('_rpcs', 'RPCs'), ('_hooks', 'Webhooks'), ('_functions', 'Functions')):
+        if data.get(key):
+            lines.append(f"{title}: {', '.join(list(data[key])[:20])}")
+
+    docs = (data.get('docs') or '').strip()
+    if docs:
+        lines.append(f"Docs:\n{docs[:docs_chars]}")
+
+    category = _category(name, label, data.get('categories'))
+    return AppDigest(str(path), name, label, category, '\n'.join(lines), dict(module_counts),
+                     has_metadata_category=bool(data.get('categories')))
+
+class AppResult:
+    """Map output for one app: its category, a one-paragraph summary and an integration pattern"""
+    def __init__(self, path: str, label: str, category: str, summary: str, pattern: CodePattern):
+        self.path = path
+        self.label = label
+        self.category = category
+        self.summary = summary
+        self.pattern = pattern
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'path': self.path, 'label': self.label, 'category': self.category,
+                'summary': self.summary, 'pattern': self.pattern.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AppResult':
+        return cls(data['path'], data['label'], data['category'], data['summary'],
+                   CodePattern.from_dict(data['pattern']))
+
+class CatalogMapReduce:
+    """Per-app extraction (map) and category/corpus synthesis (reduce) with bounded concurrency"""
+
+    def __init__(self, llm_router: LLMRouter, concurrency: int = 8, reduce_batch_size: int = 40):
+        self.llm_router = llm_router
+        self.concurrency = concurrency
+        self.reduce_batch_size = reduce_batch_size  # App summaries per synthesis prompt
+        self.semaphore: Optional[asyncio.Semaphore] = None  # May be shared with other extractors
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        return self.semaphore
+
+    async def _analyze(self, content: str, prompt: str) -> str:
+        async with self._limit():
+            return await self.llm_router.analyze_content(content, ContentType.API, prompt)
+
+    # Map
+
+    async def map_apps(self, json_files: List[Path], on_patterns: Optional[PatternCallback] = None,
+                       units=None) -> List[AppResult]:
+        """
+        Extract every app, at most `concurrency` LLM calls at a time
+
+        Args:
+            json_files: App definition files
+            on_patterns: Called with (category, [pattern]) as each app finishes
+            units: Optional run journal unit log; apps it already holds are not re-analyzed
+
+        Returns:
+            App results in input order; unreadable files are skipped
+        """
+        logger.info(f"Mapping {len(json_files)} apps with concurrency {self.concurrency}")
+        done = [0]
+
+        async def map_one(json_file: Path) -> Optional[AppResult]:
+            key = str(json_file)
+            if units is not None and key in units:
+                result = AppResult.from_dict(units.get(key))
+            else:
+                result = await self._map_app(json_file, units)
+                if result is None:
+                    return None
+            if on_patterns:
+                await on_patterns(result.category, [result.pattern])
+            done[0] += 1
+            if done[0] % 25 == 0:
+                logger.info(f"Mapped {done[0]}/{len(json_files)} apps")
+            return result
+
+        results = await asyncio.gather(*[map_one(json_file) for json_file in json_files])
+        return [result for result in results if result]
+
+    async def _map_app(self, json_file: Path, units=None) -> Optional[AppResult]:
+        """Digest one app off the event loop and analyze it, holding one concurrency slot"""
+        prompt = f"""Analyze this integration app definition for a no-code automation platform.
+
+Respond in markdown with exactly these sections:
+## Category
+Exactly one of: {', '.join(CATEGORIES)}
+## Summary
+One paragraph: what the app integrates, its auth approach and how its modules are organized.
+## Implementation Guidance
+3-6 bullet points on how to build an integration like this (auth, pagination, webhooks, error handling, module design).
+"""
+        async with self._limit():
+            try:
+                digest = await asyncio.to_thread(digest_app, json_file)
+            except Exception as e:
+                logger.warning(f"Could not read app definition {json_file}: {e}")
+                return None
+            analysis = await self.llm_router.analyze_content(digest.text, ContentType.API, prompt)
+        failed = self.llm_router.is_failure(analysis)
+        sections = {} if failed else _sections(analysis)
+        summary = ' '.join(_find(sections, 'summary')) or digest.text.split('\n', 1)[0]
+        guidance = _find(sections, 'implementation', 'guidance')
+        # The app's own metadata wins, then the LLM's pick, then the name keywords
+        category = digest.category
+        if not digest.has_metadata_category:
+            category = _llm_category(_find(sections, 'category')) or category
+
+        pattern = CodePattern(
+            name=f"{digest.label} Integration",
+            description=summary,
+            code_example=digest.text,
+            implementation_guide='\n'.join(f"- {point}" for point in guidance) or
+                                 f"Integration structure of {digest.label}: see the definition digest.",
+            file_path=digest.path
+        )
+        result = AppResult(digest.path, digest.label, category, summary, pattern)
+        # Failed calls (e.g. quota errors) stay unrecorded so a resumed run retries them
+        if units is not None and not failed:
+            units.record(digest.path, result.to_dict())
+        return result
+
+    # Reduce
+
+    async def reduce_categories(self, results: List[AppResult], units=None) -> Dict[str, DocumentationInsight]:
+        """Synthesize each category's apps, all categories concurrently"""
+        by_category: Dict[str, List[AppResult]] = {}
+        for result in results:
+            by_category.setdefault(result.category, []).append(result)
+
+        async def reduce_one(category: str, apps: List[AppResult]) -> DocumentationInsight:
+            if units is not None and category in units:
+                return DocumentationInsight(**units.get(category))
+            lines = [f"- {app.label}: {app.summary}" for app in apps]
+            insight = await self._synthesize(f"{category.replace('_', ' ').title()} Apps", category, lines)
+            if units is not None and not self.llm_router.is_failure(insight.content):
+                units.record(category, insight.__dict__)
+            return insight
+
+        categories = sorted(by_category)
+        logger.info(f"Reducing {len(results)} apps into {len(categories)} categories")
+        insights = await asyncio.gather(*[reduce_one(category, by_category[category]) for category in categories])
+        return dict(zip(categories, insights))
+
+    async def reduce_corpus(self, category_insights: Dict[str, DocumentationInsight]) -> DocumentationInsight:
+        """Synthesize the category syntheses into one catalog-wide overview"""
+        lines = []
+        for category, insight in category_insights.items():
+            points = insight.architectural_insights[:5] + insight.implementation_guidance[:5]
+            lines.append(f"- {category}: " + '; '.join(points))
+        return await self._synthesize("App Catalog", 'catalog', lines)
+
+    async def _synthesize(self, title: str, source: str, lines: List[str]) -> DocumentationInsight:
+        """Tree-reduce summary lines in batches until one synthesis remains"""
+        prompt = f"""These are summaries from the "{title}" part of an integration app catalog.
+
+Respond in markdown with exactly these sections:
+## Architectural Insights
+Bullet points on shared architecture, auth and module design across these apps.
+## Implementation Guidance
+Bullet points on how to build apps like these, including recurring pitfalls.
+"""
+        while True:
+            batches = [lines[i:i + self.reduce_batch_size] for i in range(0, len(lines), self.reduce_batch_size)] or [[]]
+            analyses = await asyncio.gather(*[self._analyze('\n'.join(batch), prompt) for batch in batches])
+            if len(analyses) == 1:
+                break
+            # Partial syntheses become the next level's input; cap it so the reduction always converges
+            merged = [point for analysis in analyses if not self.llm_router.is_failure(analysis)
+                      for points in _sections(analysis).values() for point in points]
+            if not merged:
+                logger.warning(f"Every partial synthesis of {title} failed")
+                return DocumentationInsight(
+                    doc_type='app_catalog',
+                    title=title,
+                    content=f"Error analyzing content: every partial synthesis of {title} failed",
+                    architectural_insights=[],
+                    implementation_guidance=[],
+                    source_file=source
+                )
+            lines = merged if len(merged) < len(lines) else merged[:self.reduce_batch_size]
+
+        analysis = analyses[0]
+        sections = {} if self.llm_router.is_failure(analysis) else _sections(analysis)
+        return DocumentationInsight(
+            doc_type='app_catalog',
+            title=title,
+            content=analysis,
+            architectural_insights=_find(sections, 'architect'),
+            implementation_guidance=_find(sections, 'implementation', 'guidance'),
+            source_file=source
+        )
@@ -5,15 +5,24 @@ Focuses on extracting "how to build" knowledge rather than just documenting what
 """
 
 import os
-import ast
+import asyncio
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 import logging
 
 from .llm_router import LLMRouter, ContentType
+from .symbol_digest import build_python_digest
+from .source_walker import SourceFile, discover_source_files
+from .import_graph import ImportScanner
+from .source_chunker import split_into_chunks
+from .result_store import ResultStore, content_hash
+from .git_diff import FileDiff, collect_changed_files, file_at_revision, select_changed_units, snippet_in_units
 
 logger = logging.getLogger(__name__)
 
+# Bump when the analysis prompt or content preparation changes to invalidate stored results
+PATTERN_PROMPT_VERSION = "1"
+
 class CodePattern:
     """Represents an extracted code pattern"""
     def __init__(self, name: str, description: str, code_example: str, 
@@ -23,12 +32,29 @@ class CodePattern:
         self.code_example = code_example
         self.implementation_guide = implementation_guide
         self.file_path = file_path
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            'name': self.name,
+            'description': self.description,
+            'code_example': self.code_example,
+            'implementation_guide': self.implementation_guide,
+            'file_path': self.file_path
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'CodePattern':
+        return cls(**data)
+
+# Receives (feature_name, patterns) as each file's patterns are parsed
+PatternCallback = Callable[[str, List[CodePattern]], Awaitable[None]]
 
 class CodeAnalyzer:
     """Extract implementation knowledge from source code"""
     
-    def __init__(self, llm_router: LLMRouter):
+    def __init__(self, llm_router: LLMRouter, cache_dir: str = "./.cache"):
         self.llm_router = llm_router
+        self.cache_dir = Path(cache_dir)
         self.supported_extensions = {
             '.py': 'Python',
             '.js': 'JavaScript', 
@@ -41,13 +67,41 @@ class CodeAnalyzer:
             '.rb': 'Ruby',
             '.php': 'PHP'
         }
+        
+        # Size limits: files up to max_raw_file_size go to the LLM whole, larger
+        # Python files are digested and anything else is chunked at top-level boundaries
+        self.max_raw_file_size = 50000
+        self.max_file_size = 1000000
+        self.digest_body_budget = 12000
+        self.chunk_token_budget = 8000
+        self.chunk_concurrency = 4
+        
+        # Stat results kept from discovery so key file selection doesn't stat again
+        self.discovered_files: Dict[str, SourceFile] = {}
+        
+        # Import graph centrality used to rank key files, cached between runs
+        self.import_scanner = ImportScanner(str(self.cache_dir / "import_graph.json"))
+        self.file_centrality: Dict[str, float] = {}
+        
+        # Per-file results keyed by content hash, prompt version and feature
+        self.result_store = ResultStore(str(self.cache_dir / "code_patterns"), PATTERN_PROMPT_VERSION)
+        
+        # Set per run when a base revision is given: changed files and their line ranges
+        self.base_revision: Optional[str] = None
+        self.changed_files: Dict[str, FileDiff] = {}
     
-    async def extract_implementation_patterns(self, source_paths: List[str]) -> Dict[str, List[CodePattern]]:
+    async def extract_implementation_patterns(self, source_paths: List[str],
+                                              base_revision: Optional[str] = None,
+                                              on_patterns: Optional[PatternCallback] = None) -> Dict[str, List[CodePattern]]:
         """
         Extract implementation patterns organized by feature/system
         
         Args:
             source_paths: List of source directories or files
+            base_revision: Optional git revision of a previous run; files changed since
+                then only have their changed symbols re-analyzed
+            on_patterns: Optional coroutine called with (feature_name, patterns) as soon
+                as each file's patterns are parsed
             
         Returns:
             Dictionary mapping feature names to implementation patterns
@@ -61,6 +115,13 @@ class CodeAnalyzer:
         
         logger.info(f"Found {len(all_files)} source files")
         
+        # Rank files by how central they are in the import graph
+        self.file_centrality = self._compute_file_centrality(all_files)
+        
+        # Find changed line ranges so changed files can be analyzed incrementally
+        self.base_revision = base_revision
+        self.changed_files = collect_changed_files(base_revision, all_files) if base_revision else {}
+        
         # Group files by likely feature/system
         feature_groups = self._group_files_by_feature(all_files)
         
@@ -68,25 +129,32 @@ class CodeAnalyzer:
         results = {}
         for feature_name, files in feature_groups.items():
             logger.info(f"Extracting patterns for {feature_name}")
-            patterns = await self._extract_feature_patterns(feature_name, files)
+            patterns = await self._extract_feature_patterns(feature_name, files, on_patterns)
             if patterns:
                 results[feature_name] = patterns
         
+        logger.info(f"Result store: {self.result_store.hits} files reused, "
+                    f"{self.result_store.misses} files analyzed")
         return results
     
     def _find_source_files(self, path: str) -> List[str]:
-        """Find all source files in a path"""
-        path_obj = Path(path)
-        files = []
-        
-        if path_obj.is_file():
-            if path_obj.suffix.lower() in self.supported_extensions:
-                files.append(str(path_obj))
-        elif path_obj.is_dir():
-            for ext in self.supported_extensions.keys():
-                files.extend([str(f) for f in path_obj.rglob(f'*{ext}')])
-        
-        return files
+        """Find all source files in a path with a single pruned walk"""
+        found = discover_source_files(path, set(self.supported_extensions))
+        self.discovered_files.update(found)
+        return list(found)
+    
+    def _compute_file_centrality(self, files: List[str]) -> Dict[str, float]:
+        """PageRank of each file in the local import graph"""
+        file_stats = {}
+        for file_path in files:
+            source_file = self.discovered_files.get(file_path)
+            if source_file and source_file.size < self.max_file_size:
+                file_stats[file_path] = (source_file.size, source_file.mtime)
+        
+        graph = self.import_scanner.build_graph(file_stats)
+        edge_count = sum(len(targets) for targets in graph.edges.values())
+        logger.info(f"Import graph: {len(graph.files)} files, {edge_count} edges")
+        return graph.pagerank()
     
     def _group_files_by_feature(self, files: List[str]) -> Dict[str, List[str]]:
         """Group files by likely feature or system"""
@@ -142,7 +210,8 @@ class CodeAnalyzer:
         else:
             return 'general'
     
-    async def _extract_feature_patterns(self, feature_name: str, files: List[str]) -> List[CodePattern]:
+    async def _extract_feature_patterns(self, feature_name: str, files: List[str],
+                                        on_patterns: Optional[PatternCallback] = None) -> List[CodePattern]:
         """Extract implementation patterns for a specific feature"""
         patterns = []
         
@@ -157,10 +226,35 @@ class CodeAnalyzer:
                 if len(content.strip()) < 50:  # Skip very small files
                     continue
                 
+                # Reuse results for files whose content hasn't changed
+                file_hash = content_hash(content)
+                stored = self.result_store.load(file_hash, feature_name)
+                if stored is not None:
+                    file_patterns = []
+                    for data in stored:
+                        data['file_path'] = file_path
+                        file_patterns.append(CodePattern.from_dict(data))
+                    patterns.extend(file_patterns)
+                    if on_patterns and file_patterns:
+                        await on_patterns(feature_name, file_patterns)
+                    continue
+                
+                # Re-analyze only the changed symbols when the previous results are known
+                file_patterns = None
+                if file_path in self.changed_files:
+                    file_patterns = await self._analyze_changed_symbols(file_path, content, feature_name)
+                
                 # Extract patterns from this file
-                file_patterns = await self._analyze_file_for_patterns(file_path, content, feature_name)
+                if file_patterns is None:
+                    file_patterns = await self._analyze_full_file(file_path, content, feature_name)
                 patterns.extend(file_patterns)
                 
+                # Empty results are not stored so failed analyses are retried next run
+                if file_patterns:
+                    self.result_store.save(file_hash, feature_name, [p.to_dict() for p in file_patterns])
+                    if on_patterns:
+                        await on_patterns(feature_name, file_patterns)
+                
             except Exception as e:
                 logger.warning(f"Could not analyze file {file_path}: {e}")
         
@@ -168,21 +262,129 @@ class CodeAnalyzer:
     
     def _select_key_files(self, files: List[str]) -> List[str]:
         """Select the most important files for analysis"""
-        # Sort by file size (larger files likely more important) and take top files
         file_sizes = []
         for file_path in files:
             try:
-                size = Path(file_path).stat().st_size
+                source_file = self.discovered_files.get(file_path)
+                size = source_file.size if source_file else Path(file_path).stat().st_size
                 file_sizes.append((file_path, size))
             except Exception:
                 continue
         
-        # Sort by size, but not too large (skip generated files)
-        file_sizes = [(f, s) for f, s in file_sizes if 100 < s < 50000]
-        file_sizes.sort(key=lambda x: x[1], reverse=True)
+        # Rank by import graph centrality, then size, skipping tiny and oversized files
+        file_sizes = [(f, s) for f, s in file_sizes if 100 < s < self.max_file_size]
+        file_sizes.sort(key=lambda x: (self.file_centrality.get(x[0], 0.0), x[1]), reverse=True)
         
         return [f[0] for f in file_sizes]
     
+    def _prepare_analysis_content(self, file_path: str, content: str, feature_name: str) -> str:
+        """Replace large Python files with a symbol digest plus their most relevant bodies"""
+        if Path(file_path).suffix.lower() != '.py' or len(content) <= self.digest_body_budget:
+            return content
+        
+        digest = build_python_digest(content)
+        if digest is None:
+            # Unparseable files fall back to the raw text and get chunked if too large
+            return content
+        
+        keywords = feature_name.lower().split('_')
+        digested = digest.build_context(keywords, self.digest_body_budget)
+        if len(digested) > self.max_raw_file_size:
+            # Too many symbols for a useful digest, chunk the source instead
+            return content
+        logger.info(f"Digested {Path(file_path).name}: {len(content)} -> {len(digested)} characters")
+        return digested
+    
+    async def _analyze_full_file(self, file_path: str, content: str, feature_name: str) -> List[CodePattern]:
+        """Analyze a whole file, digested or chunked when it is large"""
+        content = self._prepare_analysis_content(file_path, content, feature_name)
+        if len(content) > self.max_raw_file_size:
+            return await self._analyze_file_in_chunks(file_path, content, feature_name)
+        return await self._analyze_file_for_patterns(file_path, content, feature_name)
+    
+    async def _analyze_changed_symbols(self, file_path: str, content: str, feature_name: str) -> Optional[List[CodePattern]]:
+        """
+        Analyze only the symbols changed since the base revision and splice the
+        results into the file's previous patterns
+        
+        Returns:
+            Spliced patterns, or None when the previous results are unavailable
+        """
+        file_diff = self.changed_files[file_path]
+        previous_content = file_at_revision(file_diff, self.base_revision)
+        if previous_content is None:
+            return None
+        
+        previous = self.result_store.load(content_hash(previous_content), feature_name)
+        if previous is None:
+            return None
+        
+        units = select_changed_units(file_path, content, file_diff.ranges)
+        # Previous patterns quoting code from changed or deleted units are stale, whatever
+        # name their re-analysis comes back under
+        old_units = select_changed_units(file_path, previous_content, file_diff.old_ranges)
+        previous_patterns = [
+            CodePattern.from_dict(dict(data, file_path=file_path)) for data in previous
+            if not snippet_in_units(data.get('code_example', ''), previous_content, old_units)
+        ]
+        if not units:
+            return previous_patterns
+        
+        lines = content.split('\n')
+        sections = [f"# Changed symbols of {Path(file_path).name} since {self.base_revision}"]
+        for start, end in units:
+            sections.append(f"\n# Lines {start}-{end}\n" + '\n'.join(lines[start - 1:end]))
+        changed_content = '\n'.join(sections)
+        logger.info(f"Re-analyzing {len(units)} changed symbols in {Path(file_path).name}")
+        
+        if len(changed_content) > self.max_raw_file_size:
+            new_patterns = await self._analyze_file_in_chunks(file_path, changed_content, feature_name)
+        else:
+            new_patterns = await self._analyze_file_for_patterns(file_path, changed_content, feature_name)
+        
+        # New patterns also replace previous ones of the same name, the rest are kept
+        return self._merge_chunk_patterns([new_patterns, previous_patterns], replace=True)
+    
+    async def _analyze_file_in_chunks(self, file_path: str, content: str, feature_name: str) -> List[CodePattern]:
+        """Analyze a large file as concurrent chunks split at top-level boundaries"""
+        chunks = split_into_chunks(file_path, content, self.chunk_token_budget * 4)  # ~4 chars per token
+        logger.info(f"Analyzing {Path(file_path).name} in {len(chunks)} chunks")
+        
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+        
+        async def analyze_chunk(chunk) -> List[CodePattern]:
+            async with semaphore:
+                chunk_content = f"# Lines {chunk.start_line}-{chunk.end_line} of {Path(file_path).name}\n\n{chunk.text}"
+                return await self._analyze_file_for_patterns(file_path, chunk_content, feature_name)
+        
+        chunk_results = await asyncio.gather(*[analyze_chunk(chunk) for chunk in chunks])
+        return self._merge_chunk_patterns(chunk_results)
+    
+    def _merge_chunk_patterns(self, chunk_results: List[List[CodePattern]], replace: bool = False) -> List[CodePattern]:
+        """
+        Merge pattern lists for one file by name
+        
+        Patterns sharing a name are combined, or with replace=True the first
+        occurrence wins and later ones are dropped.
+        """
+        merged: Dict[str, CodePattern] = {}
+        
+        for chunk_patterns in chunk_results:
+            for pattern in chunk_patterns:
+                key = pattern.name.strip().lower()
+                if key not in merged:
+                    merged[key] = pattern
+                    continue
+                if replace:
+                    continue
+                
+                existing = merged[key]
+                existing.implementation_guide += '\n\n' + pattern.implementation_guide
+                if existing.code_example == "See implementation guide for details":
+                    existing.code_example = pattern.code_example
+        
+        return list(merged.values())
+    
     async def _analyze_file_for_patterns(self, file_path: str, content: str, feature_name: str) -> List[CodePattern]:
         """Analyze a single file for implementation patterns"""
         
@@ -205,6 +407,8 @@ Focus on patterns that are:
 File: {Path(file_path).name}
 Feature: {feature_name}
 
+Large Python files are given as a symbol digest (signatures, docstrings, decorators, imports and call edges) followed by the source of the most relevant symbols.
+
 Make your response educational - someone should be able to follow your guidance to implement similar functionality."""
 
         try:
@@ -212,6 +416,10 @@ Make your response educational - someone should be able to follow your guidance
                 content, ContentType.CODE, prompt
             )
             
+            if self.llm_router.is_failure(result):
+                logger.warning(f"No analysis for {file_path}: {result}")
+                return []
+            
             # Parse the result into CodePattern objects
             patterns = self._parse_pattern_analysis(result, file_path)
             return patterns
@@ -5,6 +5,7 @@ Processes README files, API docs, architecture documents to understand
 system design decisions and implementation approaches.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -31,6 +32,8 @@ class DocProcessor:
     
     def __init__(self, llm_router: LLMRouter):
         self.llm_router = llm_router
+        self.analysis_concurrency = 1  # Documents analyzed at once within a doc type
+        self.limiter: Optional[asyncio.Semaphore] = None  # Limit shared with other extractors, if set
         
         # Documentation file patterns
         self.doc_patterns = {
@@ -42,12 +45,13 @@ class DocProcessor:
             'contributing': ['CONTRIBUTING.md', 'DEVELOPMENT.md', 'developer.md']
         }
     
-    async def extract_documentation_knowledge(self, doc_paths: List[str]) -> Dict[str, List[DocumentationInsight]]:
+    async def extract_documentation_knowledge(self, doc_paths: List[str], units=None) -> Dict[str, List[DocumentationInsight]]:
         """
         Extract knowledge from documentation sources
         
         Args:
             doc_paths: List of documentation directories or files
+            units: Optional run journal unit log; documents it already holds are not re-analyzed
             
         Returns:
             Dictionary mapping doc types to insights
@@ -68,7 +72,7 @@ class DocProcessor:
         results = {}
         for doc_type, files in doc_groups.items():
             logger.info(f"Processing {doc_type} documentation")
-            insights = await self._extract_doc_type_insights(doc_type, files)
+            insights = await self._extract_doc_type_insights(doc_type, files, units)
             if insights:
                 results[doc_type] = insights
         
@@ -149,27 +153,36 @@ class DocProcessor:
         
         return 'general'
     
-    async def _extract_doc_type_insights(self, doc_type: str, files: List[str]) -> List[DocumentationInsight]:
+    async def _extract_doc_type_insights(self, doc_type: str, files: List[str], units=None) -> List[DocumentationInsight]:
         """Extract insights from a specific type of documentation"""
-        insights = []
+        semaphore = self.limiter or asyncio.Semaphore(self.analysis_concurrency)
         
-        for file_path in files:
+        async def extract(file_path: str) -> Optional[DocumentationInsight]:
+            if units is not None and file_path in units:
+                return DocumentationInsight(**units.get(file_path))
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                if len(content.strip()) < 50:  # Skip very small files
-                    continue
-                
-                # Extract insights from this document
-                insight = await self._analyze_document(file_path, content, doc_type)
-                if insight:
-                    insights.append(insight)
+                # Read inside the limit so only in-flight documents are held in memory
+                async with semaphore:
+                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                    
+                    if len(content.strip()) < 50:  # Skip very small files
+                        return None
+                    
+                    # Extract insights from this document
+                    insight = await self._analyze_document(file_path, content, doc_type)
+                # Failed analyses (e.g. quota errors) stay unrecorded so a resumed run retries them
+                if insight and units is not None and not self.llm_router.is_failure(insight.content):
+                    units.record(file_path, insight.__dict__)
+                return insight
                     
             except Exception as e:
                 logger.warning(f"Could not analyze document {file_path}: {e}")
+                return None
         
-        return insights
+        # Results keep file order whatever order the analyses finish in
+        insights = await asyncio.gather(*[extract(file_path) for file_path in files])
+        return [insight for insight in insights if insight]
     
     async def _analyze_document(self, file_path: str, content: str, doc_type: str) -> Optional[DocumentationInsight]:
         """Analyze a single document for implementation insights"""
@@ -0,0 +1,213 @@
+"""
+Git Diff - Changed line ranges and symbol selection for incremental analysis
+
+Uses plain `git diff` against a base revision to find which lines of which
+files changed, and maps those lines onto the functions, methods and other
+top-level units that contain them.
+"""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from .source_chunker import find_unit_boundaries
+from .symbol_digest import build_python_digest
+
+logger = logging.getLogger(__name__)
+
+HUNK_PATTERN = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+# Snippet lines shorter than this (braces, "return", "else:") match too much to locate anything
+MIN_SNIPPET_LINE = 12
+
+class FileDiff:
+    """Lines of a file changed since a base revision"""
+    def __init__(self, path: str, repo_root: str, rel_path: str, ranges: List[Tuple[int, int]],
+                 old_ranges: Optional[List[Tuple[int, int]]] = None):
+        self.path = path
+        self.repo_root = repo_root
+        self.rel_path = rel_path
+        self.ranges = ranges  # 1-based inclusive line ranges in the current file
+        self.old_ranges = old_ranges or []  # The same hunks in the file at the base revision
+
+def _git(args: List[str], cwd: str) -> Optional[str]:
+    try:
+        result = subprocess.run(['git'] + args, cwd=cwd, capture_output=True, text=True,
+                                encoding='utf-8', errors='ignore')
+    except OSError as e:
+        logger.warning(f"Could not run git: {e}")
+        return None
+    if result.returncode != 0:
+        logger.warning(f"git {' '.join(args[:2])} failed in {cwd}: {result.stderr.strip()}")
+        return None
+    return result.stdout
+
+def find_repo_root(directory: str, cache: Optional[Dict[str, Optional[str]]] = None) -> Optional[str]:
+    """Nearest ancestor of directory containing a .git entry, memoized per directory"""
+    if cache is None:
+        cache = {}
+    directory = os.path.realpath(directory)
+    visited = []
+    root = None
+
+    while True:
+        if directory in cache:
+            root = cache[directory]
+            break
+        visited.append(directory)
+        if os.path.exists(os.path.join(directory, '.git')):
+            root = directory
+            break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+    for path in visited:
+        cache[path] = root
+    return root
+
+def _hunk_range(start: str, count: Optional[str]) -> Tuple[int, int]:
+    start_line = int(start)
+    line_count = int(count) if count is not None else 1
+    # Pure insertions and deletions touch the line at that point
+    return (start_line, start_line + max(line_count, 1) - 1)
+
+def parse_diff_ranges(diff_output: str) -> Dict[str, Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]]:
+    """
+    Changed line ranges per file from `git diff --unified=0` output
+
+    Expects the default a/ and b/ prefixes, which collect_changed_files forces.
+
+    Returns:
+        Mapping of path to (ranges in the current file, ranges in the base file)
+    """
+    ranges: Dict[str, Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]] = {}
+    current = None
+
+    for line in diff_output.split('\n'):
+        if line.startswith('+++ '):
+            target = line[4:].strip()
+            current = target[2:] if target.startswith('b/') else None
+            if current:
+                ranges.setdefault(current, ([], []))
+        elif current and line.startswith('@@'):
+            match = HUNK_PATTERN.match(line)
+            if match:
+                ranges[current][1].append(_hunk_range(match.group(1), match.group(2)))
+                ranges[current][0].append(_hunk_range(match.group(3), match.group(4)))
+
+    return ranges
+
+def collect_changed_files(base_revision: str, files: List[str]) -> Dict[str, FileDiff]:
+    """
+    Diff the repositories containing the given files against a base revision
+
+    Args:
+        base_revision: Any revision git understands, e.g. a commit or "origin/main"
+        files: Discovered file paths to match diff entries against
+
+    Returns:
+        Mapping of discovered file path to its FileDiff, for changed files only
+    """
+    by_real_path = {os.path.realpath(f): f for f in files}
+    root_cache: Dict[str, Optional[str]] = {}
+    roots = set()
+    for file_path in files:
+        root = find_repo_root(os.path.dirname(file_path) or '.', root_cache)
+        if root:
+            roots.add(root)
+
+    changed = {}
+    for root in sorted(roots):
+        # Explicit prefixes override diff.noprefix / diff.mnemonicPrefix in the user's config
+        output = _git(['diff', '--unified=0', '--no-color', '--no-ext-diff', '--src-prefix=a/',
+                       '--dst-prefix=b/', base_revision, '--'], root)
+        if output is None:
+            continue
+        for rel_path, (file_ranges, old_ranges) in parse_diff_ranges(output).items():
+            path = by_real_path.get(os.path.realpath(os.path.join(root, rel_path)))
+            if path:
+                changed[path] = FileDiff(path, root, rel_path, file_ranges, old_ranges)
+
+    logger.info(f"{len(changed)} analyzed files changed since {base_revision}")
+    return changed
+
+def files_changed_since(base_revision: str, files: List[str]) -> Optional[Set[str]]:
+    """
+    Files modified, added or untracked since a base revision
+
+    Returns:
+        The changed subset of files, or None when that cannot be determined (a file
+        outside any git repository, an unknown revision or a failing git command)
+    """
+    by_real_path = {os.path.realpath(f): f for f in files}
+    root_cache: Dict[str, Optional[str]] = {}
+    roots = set()
+    for file_path in files:
+        root = find_repo_root(os.path.dirname(file_path) or '.', root_cache)
+        if root is None:
+            return None
+        roots.add(root)
+
+    changed: Set[str] = set()
+    for root in sorted(roots):
+        if _git(['rev-parse', '--verify', '--quiet', f"{base_revision}^{{commit}}"], root) is None:
+            return None
+        # -z keeps paths unquoted; --no-relative keeps them relative to the repository root
+        diffed = _git(['diff', '--name-only', '-z', '--no-relative', '--no-ext-diff', base_revision, '--'], root)
+        untracked = _git(['ls-files', '--others', '--exclude-standard', '-z', '--full-name'], root)
+        if diffed is None or untracked is None:
+            return None
+        for rel_path in (diffed + untracked).split('\0'):
+            path = by_real_path.get(os.path.realpath(os.path.join(root, rel_path))) if rel_path else None
+            if path:
+                changed.add(path)
+    return changed
+
+def file_at_revision(file_diff: FileDiff, revision: str) -> Optional[str]:
+    """Content of a changed file at the base revision, None if it did not exist"""
+    return _git(['show', f"{revision}:{file_diff.rel_path}"], file_diff.repo_root)
+
+def _overlaps(start: int, end: int, ranges: List[Tuple[int, int]]) -> bool:
+    return any(start <= range_end and range_start <= end for range_start, range_end in ranges)
+
+def snippet_in_units(snippet: str, content: str, units: List[Tuple[int, int]]) -> bool:
+    """True when a verbatim line of snippet occurs in content inside one of the units"""
+    wanted = {line.strip() for line in snippet.split('\n') if len(line.strip()) >= MIN_SNIPPET_LINE}
+    if not wanted or not units:
+        return False
+    for number, line in enumerate(content.split('\n'), 1):
+        if line.strip() in wanted and _overlaps(number, number, units):
+            return True
+    return False
+
+def select_changed_units(file_path: str, content: str, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """1-based line ranges of the functions, methods or top-level units touched by a diff"""
+    lines = content.split('\n')
+    units: List[Tuple[int, int]] = []
+
+    if Path(file_path).suffix.lower() == '.py':
+        digest = build_python_digest(content)
+        if digest:
+            units = [(s.start_line, s.end_line) for s in digest.symbols if s.kind != 'class']
+
+    # Top-level units cover changes outside functions and non-Python files
+    starts = find_unit_boundaries(file_path, content, lines)
+    top_level = [(start + 1, end) for start, end in zip(starts, starts[1:] + [len(lines)]) if start < end]
+    covered = [u for u in units if _overlaps(u[0], u[1], ranges)]
+    uncovered_ranges = [r for r in ranges if not any(u[0] <= r[0] and r[1] <= u[1] for u in covered)]
+    covered.extend(u for u in top_level
+                   if _overlaps(u[0], u[1], uncovered_ranges)
+                   and not any(c[0] <= u[0] and u[1] <= c[1] for c in covered))
+
+    # Drop units nested inside other selected units
+    covered.sort()
+    selected: List[Tuple[int, int]] = []
+    for start, end in covered:
+        if selected and start >= selected[-1][0] and end <= selected[-1][1]:
+            continue
+        selected.append((start, end))
+    return selected
@@ -0,0 +1,103 @@
+"""
+Image Hash - Perceptual hashing and near-duplicate clustering of images
+
+Computes aHash/dHash fingerprints with Pillow and groups images whose
+fingerprints are within a small Hamming distance, so only one image per
+cluster needs a vision call. Without Pillow, exact duplicates are still
+grouped by content hash.
+"""
+
+import hashlib
+from typing import List, Optional, Tuple
+import logging
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+def average_hash(image, hash_size: int = 8) -> int:
+    """aHash: bits set where a pixel is brighter than the mean of a downscaled grayscale image"""
+    pixels = list(image.convert('L').resize((hash_size, hash_size)).getdata())
+    mean = sum(pixels) / len(pixels)
+    bits = 0
+    for pixel in pixels:
+        bits = (bits << 1) | (pixel > mean)
+    return bits
+
+def difference_hash(image, hash_size: int = 8) -> int:
+    """dHash: bits set where a pixel is brighter than its right-hand neighbour"""
+    pixels = list(image.convert('L').resize((hash_size + 1, hash_size)).getdata())
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+class ImageFingerprint:
+    """Perceptual or exact fingerprint of one image"""
+    def __init__(self, path: str, ahash: Optional[int], dhash: Optional[int], digest: str):
+        self.path = path
+        self.ahash = ahash
+        self.dhash = dhash
+        self.digest = digest
+
+    def is_near_duplicate(self, other: 'ImageFingerprint', max_distance: int) -> bool:
+        if self.digest == other.digest:
+            return True
+        if self.dhash is None or other.dhash is None:
+            return False
+        return (hamming_distance(self.dhash, other.dhash) <= max_distance
+                and hamming_distance(self.ahash, other.ahash) <= max_distance)
+
+def fingerprint_image(path: str) -> ImageFingerprint:
+    """Fingerprint an image, falling back to a content digest when it can't be decoded"""
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+
+    ahash = dhash = None
+    if Image is not None:
+        try:
+            with Image.open(path) as image:
+                image.draft('L', (64, 64))  # Let JPEG decode at reduced size
+                ahash = average_hash(image)
+                dhash = difference_hash(image)
+        except Exception as e:
+            logger.debug(f"No perceptual hash for {path}: {e}")
+
+    return ImageFingerprint(path, ahash, dhash, digest)
+
+def cluster_images(paths: List[str], max_distance: int = 6) -> List[List[str]]:
+    """
+    Group near-identical images
+
+    Args:
+        paths: Image files to cluster
+        max_distance: Largest aHash and dHash Hamming distance (of 64 bits) treated as a duplicate
+
+    Returns:
+        Clusters of paths, largest first; the first path of each is its representative
+    """
+    clusters: List[Tuple[ImageFingerprint, List[str]]] = []
+
+    for path in paths:
+        try:
+            fingerprint = fingerprint_image(path)
+        except OSError as e:
+            logger.warning(f"Could not read image {path}: {e}")
+            continue
+
+        for representative, members in clusters:
+            if fingerprint.is_near_duplicate(representative, max_distance):
+                members.append(path)
+                break
+        else:
+            clusters.append((fingerprint, [path]))
+
+    return sorted((members for _, members in clusters), key=len, reverse=True)
@@ -0,0 +1,289 @@
+"""
+Import Graph - Local dependency graph and centrality ranking for source files
+
+Detects imports (Python via ast, JavaScript/TypeScript and Go via regex),
+resolves them to files in the analyzed tree and ranks files by PageRank so
+the modules everything else depends on are analyzed first.
+"""
+
+import ast
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from .result_store import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+JS_EXTENSIONS = ['.js', '.ts', '.jsx', '.tsx', '.mjs', '.cjs']
+
+JS_IMPORT_PATTERN = re.compile(
+    r"""(?:import\s+(?:[^'"]*?\s+from\s+)?|export\s+[^'"]*?\s+from\s+|require\s*\(\s*|import\s*\(\s*)['"]([^'"]+)['"]"""
+)
+GO_IMPORT_BLOCK_PATTERN = re.compile(r'import\s*\(([^)]*)\)', re.DOTALL)
+GO_IMPORT_LINE_PATTERN = re.compile(r'import\s+(?:[\w.]+\s+)?"([^"]+)"')
+GO_QUOTED_PATTERN = re.compile(r'"([^"]+)"')
+GO_MODULE_PATTERN = re.compile(r'^module\s+"?([^"\s]+)"?', re.MULTILINE)
+
+def extract_python_imports(content: str) -> List[str]:
+    """Module names imported by Python source, relative imports keep their leading dots"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return []
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = '.' * node.level + (node.module or '')
+            imports.append(module)
+            # "from pkg import module" may name submodules rather than attributes
+            imports.extend(f"{module}.{alias.name}" if node.module else module + alias.name
+                           for alias in node.names if alias.name != '*')
+    return imports
+
+def extract_js_imports(content: str) -> List[str]:
+    """Module specifiers from import/export/require statements"""
+    return JS_IMPORT_PATTERN.findall(content)
+
+def extract_go_imports(content: str) -> List[str]:
+    """Import paths from single-line and grouped Go import declarations"""
+    imports = GO_IMPORT_LINE_PATTERN.findall(content)
+    for block in GO_IMPORT_BLOCK_PATTERN.findall(content):
+        imports.extend(GO_QUOTED_PATTERN.findall(block))
+    return imports
+
+def extract_imports(file_path: str, content: str) -> List[str]:
+    """Raw import specifiers for any supported language"""
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.py':
+        return extract_python_imports(content)
+    if suffix in JS_EXTENSIONS:
+        return extract_js_imports(content)
+    if suffix == '.go':
+        return extract_go_imports(content)
+    return []
+
+class ImportGraph:
+    """Directed file dependency graph, edges point from importer to imported file"""
+
+    def __init__(self, files: List[str]):
+        self.files = list(files)
+        self.edges: Dict[str, Set[str]] = {f: set() for f in self.files}
+        self._file_set = set(self.files)
+        self._package_dirs: Dict[Path, bool] = {}
+        self._package_roots: Dict[str, Path] = {}
+        self._python_modules = self._index_python_modules()
+        self._go_modules: Dict[Path, Optional[Tuple[str, Path]]] = {}
+        self._go_packages: Dict[str, List[str]] = {}
+        self._go_suffixes: Dict[str, List[str]] = {}
+        self._index_go_packages()
+
+    def _is_package(self, directory: Path) -> bool:
+        """True when a directory holds an __init__.py, analyzed or not"""
+        if directory not in self._package_dirs:
+            init_file = directory / '__init__.py'
+            self._package_dirs[directory] = str(init_file) in self._file_set or init_file.is_file()
+        return self._package_dirs[directory]
+
+    def _index_python_modules(self) -> Dict[str, List[str]]:
+        """Map each Python file's full module name, relative to its package root, to the file"""
+        modules: Dict[str, List[str]] = {}
+        for file_path in self.files:
+            path = Path(file_path)
+            if path.suffix != '.py':
+                continue
+            parts = [] if path.stem == '__init__' else [path.stem]
+            directory = path.parent
+            # The package root is the first ancestor that is not itself a package
+            while self._is_package(directory) and directory.name:
+                parts.insert(0, directory.name)
+                directory = directory.parent
+            if parts:
+                modules.setdefault('.'.join(parts), []).append(file_path)
+                self._package_roots[file_path] = directory
+        return modules
+
+    def _resolve_python_absolute(self, file_path: str, specifier: str) -> List[str]:
+        """Resolve "import a.b" like sys.path would: the script's directory, then package roots"""
+        local = self._python_module_files(Path(file_path).parent, specifier)
+        if local:
+            return local
+        candidates = self._python_modules.get(specifier, [])
+        if len(candidates) < 2:
+            return candidates
+        # Same module name under several roots: keep the roots enclosing the importer
+        importer = Path(file_path).parent
+        enclosing = [c for c in candidates
+                     if self._package_roots[c] == importer or self._package_roots[c] in importer.parents]
+        if not enclosing:
+            return []  # Ambiguous, e.g. unrelated scripts each with their own utils.py
+        deepest = max(len(self._package_roots[c].parts) for c in enclosing)
+        return [c for c in enclosing if len(self._package_roots[c].parts) == deepest]
+
+    def _python_module_files(self, base: Path, module: str) -> List[str]:
+        """Files of a dotted module below a directory, as a module or a package"""
+        target = base.joinpath(*module.split('.')) if module else base
+        candidates = [str(target) + '.py', str(target / '__init__.py')]
+        return [c for c in candidates if c in self._file_set]
+
+    def _index_go_packages(self):
+        """Map Go package directories to their files, and every trailing path of a directory to it"""
+        for file_path in self.files:
+            if file_path.endswith('.go'):
+                self._go_packages.setdefault(str(Path(file_path).parent), []).append(file_path)
+        for package_dir in self._go_packages:
+            path = Path(package_dir)
+            parts = path.parts[1:] if path.anchor else path.parts
+            # Whole path segments only: "foo/bar" must not match "xfoo/bar"
+            for start in range(len(parts)):
+                self._go_suffixes.setdefault('/'.join(parts[start:]), []).append(package_dir)
+
+    def _go_module(self, directory: Path) -> Optional[Tuple[str, Path]]:
+        """(module path, module root) from the nearest go.mod at or above a directory"""
+        if directory not in self._go_modules:
+            module = None
+            go_mod = directory / 'go.mod'
+            try:
+                match = GO_MODULE_PATTERN.search(go_mod.read_text(encoding='utf-8', errors='ignore'))
+                if match:
+                    module = (match.group(1), directory)
+            except OSError:
+                if directory.parent != directory:
+                    module = self._go_module(directory.parent)
+            self._go_modules[directory] = module
+        return self._go_modules[directory]
+
+    def _resolve_go(self, file_path: str, specifier: str) -> List[str]:
+        """Resolve a Go import path to a package in the tree"""
+        module = self._go_module(Path(file_path).parent)
+        if module:
+            module_path, module_root = module
+            if specifier == module_path or specifier.startswith(module_path + '/'):
+                target = module_root.joinpath(*specifier[len(module_path):].split('/')[1:])
+                return self._go_packages.get(str(target), [])
+        # Without a domain the first segment names a standard library package ("fmt", "net/http")
+        if '.' not in specifier.split('/')[0]:
+            return []
+        package_dirs = self._go_suffixes.get(specifier, [])
+        if len(package_dirs) != 1:
+            return []  # Not in the tree, or ambiguous (several vendored copies)
+        return self._go_packages[package_dirs[0]]
+
+    def _resolve(self, file_path: str, specifier: str) -> List[str]:
+        """Resolve an import specifier to files in the graph"""
+        suffix = Path(file_path).suffix.lower()
+
+        if suffix == '.py':
+            if specifier.startswith('.'):
+                level = len(specifier) - len(specifier.lstrip('.'))
+                base = Path(file_path).parent
+                for _ in range(level - 1):
+                    base = base.parent
+                return self._python_module_files(base, specifier[level:])
+            return self._resolve_python_absolute(file_path, specifier)
+
+        if suffix in JS_EXTENSIONS:
+            if not specifier.startswith('.'):
+                return []
+            target = os.path.normpath(os.path.join(os.path.dirname(file_path), specifier))
+            candidates = [target] + [target + ext for ext in JS_EXTENSIONS]
+            candidates += [os.path.join(target, 'index' + ext) for ext in JS_EXTENSIONS]
+            return [c for c in candidates if c in self._file_set][:1]
+
+        if suffix == '.go':
+            return self._resolve_go(file_path, specifier)
+        return []
+
+    def add_imports(self, file_path: str, specifiers: List[str]):
+        """Add edges for the raw import specifiers found in a file"""
+        for specifier in specifiers:
+            for target in self._resolve(file_path, specifier):
+                if target != file_path:
+                    self.edges[file_path].add(target)
+
+    def pagerank(self, damping: float = 0.85, iterations: int = 30) -> Dict[str, float]:
+        """PageRank over the import graph, imported files accumulate rank"""
+        count = len(self.files)
+        if not count:
+            return {}
+
+        rank = {f: 1.0 / count for f in self.files}
+        for _ in range(iterations):
+            # Files without imports spread their rank evenly
+            dangling = sum(rank[f] for f in self.files if not self.edges[f])
+            base = (1 - damping) / count + damping * dangling / count
+            new_rank = {f: base for f in self.files}
+            for source, targets in self.edges.items():
+                if targets:
+                    share = damping * rank[source] / len(targets)
+                    for target in targets:
+                        new_rank[target] += share
+            rank = new_rank
+
+        return rank
+
+class ImportScanner:
+    """Build import graphs, caching each file's import specifiers between runs"""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.cache: Dict[str, Dict] = {}
+        self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load import graph cache {self.cache_file}: {e}")
+            self.cache = {}
+
+    def _save_cache(self):
+        if not self.cache_file:
+            return
+        try:
+            write_json_atomic(self.cache_file, self.cache)
+        except Exception as e:
+            logger.warning(f"Could not save import graph cache {self.cache_file}: {e}")
+
+    def _file_imports(self, file_path: str, size: int, mtime: float) -> List[str]:
+        cached = self.cache.get(file_path)
+        if cached and cached['size'] == size and cached['mtime'] == mtime:
+            return cached['imports']
+
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                imports = extract_imports(file_path, f.read())
+        except Exception as e:
+            logger.warning(f"Could not scan imports in {file_path}: {e}")
+            imports = []
+
+        self.cache[file_path] = {'size': size, 'mtime': mtime, 'imports': imports}
+        return imports
+
+    def build_graph(self, file_stats: Dict[str, tuple]) -> ImportGraph:
+        """
+        Build the import graph for a set of files
+
+        Args:
+            file_stats: Mapping of file path to (size, mtime)
+
+        Returns:
+            ImportGraph with edges resolved within the given files
+        """
+        graph = ImportGraph(list(file_stats))
+        for file_path, (size, mtime) in file_stats.items():
+            graph.add_imports(file_path, self._file_imports(file_path, size, mtime))
+
+        # Drop entries for files that no longer exist in the analyzed tree
+        self.cache = {f: entry for f, entry in self.cache.items() if f in file_stats}
+        self._save_cache()
+        return graph
@@ -7,8 +7,10 @@ Routes different content types to appropriate LLMs:
 """
 
 import os
+import re
 import base64
-from typing import Any, Dict, Optional
+import mimetypes
+from typing import Any, Dict, List, Optional
 from enum import Enum
 import logging
 
@@ -26,6 +28,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Prefixes of the placeholder strings returned instead of an analysis
+FAILURE_PREFIXES = (
+    "Image analysis not available",
+    "Text analysis not available",
+    "Error analyzing image:",
+    "Error analyzing content:",
+)
+
+IMAGE_SECTION_PATTERN = re.compile(r'^\W*IMAGE\s+(\d+)\W*$', re.IGNORECASE | re.MULTILINE)
+
 class ContentType(Enum):
     """Content types for processing"""
     CODE = "code"
@@ -43,6 +55,10 @@ class LLMRouter:
         self.groq_client = None
         self.gemini_client = None
         
+        # Vision model and the most images it accepts in one request
+        self.vision_model = "meta-llama/llama-4-scout-17b-16e-instruct"
+        self.max_images_per_request = 5
+        
         # Initialize clients if API keys are available
         if os.environ.get("GROQ_API_KEY") and Groq:
             try:
@@ -75,16 +91,24 @@ class LLMRouter:
         else:
             return await self._analyze_text(content, prompt, content_type)
     
+    def _image_part(self, image_path: str) -> Dict[str, Any]:
+        """Encode an image file as a data URL message part"""
+        mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
+        with open(image_path, "rb") as image_file:
+            base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:{mime_type};base64,{base64_image}",
+            },
+        }
+    
     async def _analyze_image(self, image_path: str, prompt: str) -> str:
         """Analyze image using Groq vision"""
         if not self.groq_client:
             return "Image analysis not available - Groq client not initialized"
         
         try:
-            # Encode image
-            with open(image_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-            
             # Create completion
             chat_completion = self.groq_client.chat.completions.create(
                 messages=[
@@ -92,16 +116,11 @@ class LLMRouter:
                         "role": "user",
                         "content": [
                             {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}",
-                                },
-                            },
+                            self._image_part(image_path),
                         ],
                     }
                 ],
-                model="meta-llama/llama-4-scout-17b-16e-instruct",
+                model=self.vision_model,
                 max_tokens=4096,
                 temperature=0.1,
             )
@@ -112,6 +131,63 @@ class LLMRouter:
             logger.error(f"Error analyzing image: {e}")
             return f"Error analyzing image: {str(e)}"
     
+    async def analyze_images(self, image_paths: List[str], prompt: str, context: str = "") -> Optional[List[str]]:
+        """
+        Analyze several related images in one vision request
+        
+        Args:
+            image_paths: Images to analyze together, at most max_images_per_request
+            prompt: Analysis prompt applied to every image
+            context: How the images relate, e.g. "frames of one UI flow"
+            
+        Returns:
+            One analysis per image in input order, or None if the request failed
+            or the response could not be split per image
+        """
+        if not self.groq_client:
+            return None
+        
+        if len(image_paths) > self.max_images_per_request:
+            raise ValueError(f"At most {self.max_images_per_request} images per request, got {len(image_paths)}")
+        
+        batch_prompt = (
+            f"You are given {len(image_paths)} related images in order{f' ({context})' if context else ''}. "
+            f"Read them together, then analyze each one.\n\n{prompt}\n\n"
+            f"Start the analysis of each image with a line of the form '=== IMAGE n ===', "
+            f"numbering images from 1 to {len(image_paths)} in the order given."
+        )
+        
+        try:
+            content = [{"type": "text", "text": batch_prompt}]
+            for image_path in image_paths:
+                content.append(self._image_part(image_path))
+            
+            chat_completion = self.groq_client.chat.completions.create(
+                messages=[{"role": "user", "content": content}],
+                model=self.vision_model,
+                max_tokens=min(8192, 2048 * len(image_paths)),
+                temperature=0.1,
+            )
+            
+            return self._split_image_sections(chat_completion.choices[0].message.content, len(image_paths))
+            
+        except Exception as e:
+            logger.error(f"Error analyzing image batch: {e}")
+            return None
+    
+    def _split_image_sections(self, response: str, image_count: int) -> Optional[List[str]]:
+        """Split a multi-image response on its '=== IMAGE n ===' markers"""
+        markers = list(IMAGE_SECTION_PATTERN.finditer(response))
+        sections: Dict[int, str] = {}
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(response)
+            sections[int(marker.group(1))] = response[marker.end():end].strip()
+        
+        if sorted(sections) != list(range(1, image_count + 1)):
+            logger.warning(f"Could not split batched image analysis into {image_count} sections")
+            return None
+        return [sections[n] for n in range(1, image_count + 1)]
+    
     async def _analyze_text(self, content: str, prompt: str, content_type: ContentType) -> str:
         """Analyze text content using Gemini"""
         if not self.gemini_client:
@@ -148,6 +224,11 @@ class LLMRouter:
             logger.error(f"Error analyzing text content: {e}")
             return f"Error analyzing content: {str(e)}"
     
+    @staticmethod
+    def is_failure(result: str) -> bool:
+        """Check if a result is an error or unavailable placeholder rather than an analysis"""
+        return result.startswith(FAILURE_PREFIXES)
+    
     def is_available(self) -> bool:
         """Check if at least one LLM client is available"""
         return self.groq_client is not None or self.gemini_client is not None
\ No newline at end of file
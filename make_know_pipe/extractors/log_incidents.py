@@ -0,0 +1,215 @@
+"""
+Log Incidents - Streaming error and latency burst detection for logs
+
+Parses timestamps, severity and latencies as a log streams by, finds bursts
+of errors or slow requests with a sliding-window detector and keeps the
+context lines around each burst. Memory is bounded by size-capped ring
+buffers and a fixed number of retained incidents.
+"""
+
+import heapq
+import re
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .log_miner import split_timestamp
+
+SEVERITY_PATTERN = re.compile(
+    r'\b(TRACE|DEBUG|INFO|NOTICE|WARN|WARNING|ERROR|ERR|CRITICAL|CRIT|FATAL|SEVERE|PANIC)\b',
+    re.IGNORECASE
+)
+LATENCY_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s?(ms|s)\b')
+
+ERROR_SEVERITIES = {'ERROR', 'ERR', 'CRITICAL', 'CRIT', 'FATAL', 'SEVERE', 'PANIC'}
+
+def parse_timestamp(timestamp: str) -> Optional[float]:
+    """Seconds since the epoch for ISO-8601 or syslog style timestamps"""
+    try:
+        return datetime.fromisoformat(timestamp.replace(',', '.')).timestamp()
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.strptime(timestamp, '%b %d %H:%M:%S')
+        return parsed.replace(year=datetime.now().year).timestamp()
+    except ValueError:
+        return None
+
+def parse_severity(message: str) -> Optional[str]:
+    """Severity keyword near the start of a log message"""
+    match = SEVERITY_PATTERN.search(message[:80])
+    return match.group(1).upper() if match else None
+
+def parse_latency_ms(message: str) -> Optional[float]:
+    """First duration in a message, in milliseconds"""
+    match = LATENCY_PATTERN.search(message)
+    if not match:
+        return None
+    value = float(match.group(1))
+    return value if match.group(2) == 'ms' else value * 1000
+
+class Incident:
+    """A burst of error or latency events with its surrounding log lines"""
+    def __init__(self, kind: str, start_line: int, start_time: Optional[str], before: List[str]):
+        self.kind = kind  # "error" or "latency"
+        self.start_line = start_line
+        self.end_line = start_line
+        self.start_time = start_time
+        self.end_time = start_time
+        self.event_count = 0
+        self.lines = list(before)
+        self.after_remaining = 0
+
+    def to_text(self, max_lines: int) -> str:
+        span = f"{self.start_time} - {self.end_time}" if self.start_time else f"lines {self.start_line}-{self.end_line}"
+        header = f"### {self.kind.title()} burst: {self.event_count} events, {span}"
+        lines = self.lines if len(self.lines) <= max_lines else (
+            self.lines[:max_lines // 2] + ['...'] + self.lines[-max_lines // 2:])
+        return header + '\n```\n' + '\n'.join(lines) + '\n```'
+
+class _BurstWindow:
+    """Sliding window counter that opens a burst above a threshold and closes below half of it"""
+    def __init__(self, window: float, threshold: int):
+        self.window = window
+        self.threshold = threshold
+        self.events: Deque[float] = deque()
+        self.active = False
+
+    def update(self, clock: float, is_event: bool) -> Tuple[bool, bool]:
+        """Advance the window, returning (burst_opened, burst_closed)"""
+        if is_event:
+            self.events.append(clock)
+        while self.events and clock - self.events[0] > self.window:
+            self.events.popleft()
+
+        if not self.active and len(self.events) >= self.threshold:
+            self.active = True
+            return True, False
+        if self.active and len(self.events) < max(1, self.threshold // 2):
+            self.active = False
+            return False, True
+        return False, False
+
+class IncidentDetector:
+    """Streaming detector for error and latency bursts"""
+
+    def __init__(self, window_seconds: float = 60.0, window_lines: int = 500,
+                 error_threshold: int = 10, latency_threshold: int = 10,
+                 latency_floor_ms: float = 1000.0, context_lines: int = 20,
+                 max_incident_lines: int = 200, max_incidents: int = 20):
+        self.window_seconds = window_seconds
+        self.window_lines = window_lines
+        self.error_threshold = error_threshold
+        self.latency_threshold = latency_threshold
+        self.latency_floor_ms = latency_floor_ms
+        self.context_lines = context_lines
+        self.max_incident_lines = max_incident_lines
+        self.max_incidents = max_incidents
+
+        self.recent: Deque[str] = deque(maxlen=context_lines)
+        self.windows: Dict[str, _BurstWindow] = {}
+        self.open: Dict[str, Incident] = {}
+        self.closing: List[Incident] = []
+        self.incidents: List[Tuple[int, int, str, Incident]] = []  # min-heap by event count
+        self.severity_counts: Dict[str, int] = {}
+        self.latency_baseline: Optional[float] = None
+        self.line_number = 0
+        self.uses_timestamps: Optional[bool] = None
+        self.clock = 0.0
+
+    def _window(self, kind: str, threshold: int) -> _BurstWindow:
+        if kind not in self.windows:
+            window = self.window_seconds if self.uses_timestamps else self.window_lines
+            self.windows[kind] = _BurstWindow(window, threshold)
+        return self.windows[kind]
+
+    def _is_slow(self, latency: Optional[float]) -> bool:
+        """Slow relative to an exponentially weighted baseline, and above a floor"""
+        if latency is None:
+            return False
+        baseline = self.latency_baseline
+        self.latency_baseline = latency if baseline is None else 0.99 * baseline + 0.01 * latency
+        return latency >= self.latency_floor_ms and (baseline is None or latency >= 3 * baseline)
+
+    def _retain(self, incident: Incident):
+        """Keep only the largest incidents"""
+        entry = (incident.event_count, incident.start_line, incident.kind, incident)
+        if len(self.incidents) < self.max_incidents:
+            heapq.heappush(self.incidents, entry)
+        elif entry[:3] > self.incidents[0][:3]:
+            heapq.heapreplace(self.incidents, entry)
+
+    def add_line(self, line: str):
+        """Feed one log line to the detector"""
+        line = line.rstrip('\n')
+        if not line.strip():
+            return
+        self.line_number += 1
+
+        timestamp, message = split_timestamp(line.strip())
+        seconds = parse_timestamp(timestamp) if timestamp else None
+        if self.uses_timestamps is None:
+            self.uses_timestamps = seconds is not None
+        # Lines without a timestamp (e.g. stack traces) share the previous line's time
+        if not self.uses_timestamps:
+            self.clock = float(self.line_number)
+        elif seconds is not None:
+            self.clock = seconds
+
+        severity = parse_severity(message)
+        if severity:
+            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+
+        # Lines after a closed burst finish its trailing context
+        for incident in self.closing:
+            incident.lines.append(line)
+            incident.after_remaining -= 1
+        for incident in [i for i in self.closing if i.after_remaining <= 0]:
+            self.closing.remove(incident)
+            self._retain(incident)
+
+        events = {
+            'error': (severity in ERROR_SEVERITIES, self.error_threshold),
+            'latency': (self._is_slow(parse_latency_ms(message)), self.latency_threshold)
+        }
+        for kind, (is_event, threshold) in events.items():
+            window = self._window(kind, threshold)
+            opened, closed = window.update(self.clock, is_event)
+            if opened:
+                incident = Incident(kind, self.line_number, timestamp, list(self.recent))
+                # Count the events already in the window that triggered the burst
+                incident.event_count = len(window.events) - (1 if is_event else 0)
+                self.open[kind] = incident
+            incident = self.open.get(kind)
+            if incident:
+                if is_event:
+                    incident.event_count += 1
+                incident.end_line = self.line_number
+                incident.end_time = timestamp or incident.end_time
+                if len(incident.lines) < self.max_incident_lines:
+                    incident.lines.append(line)
+            if closed and incident:
+                del self.open[kind]
+                incident.after_remaining = self.context_lines
+                self.closing.append(incident)
+
+        self.recent.append(line)
+
+    def finish(self) -> List[Incident]:
+        """Close any open bursts and return retained incidents, largest first"""
+        for incident in list(self.open.values()) + self.closing:
+            self._retain(incident)
+        self.open = {}
+        self.closing = []
+        return [entry[3] for entry in sorted(self.incidents, key=lambda e: (-e[0], e[1]))]
+
+    def to_text(self, incidents: List[Incident], max_lines: int = 40) -> str:
+        """Markdown summary of severities and incidents"""
+        severities = ', '.join(f"{name}: {count}" for name, count in
+                               sorted(self.severity_counts.items(), key=lambda item: -item[1]))
+        parts = [f"Severity counts: {severities or 'none detected'}"]
+        if not incidents:
+            parts.append("No error or latency bursts detected.")
+        for incident in incidents:
+            parts.append(incident.to_text(max_lines))
+        return '\n\n'.join(parts)
@@ -0,0 +1,163 @@
+"""
+Log Miner - Streaming Drain-style log template mining
+
+Reads a log line by line in constant memory and groups lines into templates
+(variable tokens replaced by <*>) with counts, first/last timestamps and
+example values, so a whole log can be summarized as a compact table.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+WILDCARD = '<*>'
+
+TIMESTAMP_PATTERN = re.compile(
+    r'^\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?'
+    r'|[A-Z][a-z]{2} +\d{1,2} \d{2}:\d{2}:\d{2})\]?\s*'
+)
+
+# Tokens that are almost certainly variables are masked before clustering
+VARIABLE_PATTERN = re.compile(
+    r'^(?:[-+]?\d+(?:\.\d+)?(?:ms|s|kb|mb|gb|%)?'
+    r'|0x[0-9a-fA-F]+'
+    r'|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?'
+    r'|[0-9a-fA-F]{16,})[,.;:)]?$'
+)
+
+def split_timestamp(line: str) -> Tuple[Optional[str], str]:
+    """Separate a leading timestamp from the rest of a log line"""
+    match = TIMESTAMP_PATTERN.match(line)
+    if not match:
+        return None, line
+    return match.group(1), line[match.end():]
+
+class LogTemplate:
+    """A cluster of log lines sharing the same constant tokens"""
+    def __init__(self, tokens: List[str], timestamp: Optional[str], max_examples: int):
+        self.tokens = tokens
+        self.count = 0
+        self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self.max_examples = max_examples
+        self.examples: Dict[int, List[str]] = {}
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.tokens)
+
+    def similarity(self, tokens: List[str]) -> Tuple[float, int]:
+        """Share of positions with identical constant tokens, and the wildcard count"""
+        same = 0
+        wildcards = 0
+        for template_token, token in zip(self.tokens, tokens):
+            if template_token == WILDCARD:
+                wildcards += 1
+            elif template_token == token:
+                same += 1
+        return same / len(tokens), wildcards
+
+    def absorb(self, tokens: List[str], raw_tokens: List[str], timestamp: Optional[str]):
+        """Add a line, generalizing differing positions and recording example values"""
+        self.count += 1
+        if timestamp:
+            if not self.first_timestamp:
+                self.first_timestamp = timestamp
+            self.last_timestamp = timestamp
+
+        for position, (template_token, token) in enumerate(zip(self.tokens, tokens)):
+            if template_token != WILDCARD and template_token != token:
+                self.tokens[position] = WILDCARD
+            if self.tokens[position] == WILDCARD:
+                values = self.examples.setdefault(position, [])
+                value = raw_tokens[position]
+                if len(values) < self.max_examples and value not in values:
+                    values.append(value)
+
+class LogTemplateMiner:
+    """Drain-style fixed-depth parse tree for online log clustering"""
+
+    def __init__(self, depth: int = 4, similarity_threshold: float = 0.5,
+                 max_children: int = 100, max_templates: int = 2000, max_examples: int = 3):
+        self.depth = max(depth, 3)
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.max_templates = max_templates
+        self.max_examples = max_examples
+        self.tree: Dict = {}
+        self.templates: List[LogTemplate] = []
+        self.line_count = 0
+        self.unclustered = 0
+
+    def add_line(self, line: str) -> Optional[LogTemplate]:
+        """Cluster one log line, returning the template it was assigned to"""
+        line = line.strip()
+        if not line:
+            return None
+        self.line_count += 1
+
+        timestamp, message = split_timestamp(line)
+        raw_tokens = message.split()
+        if not raw_tokens:
+            return None
+        tokens = [WILDCARD if VARIABLE_PATTERN.match(t) else t for t in raw_tokens]
+
+        leaf = self._leaf_for(tokens)
+        best, best_key = None, (-1.0, -1)
+        for template in leaf:
+            similarity, wildcards = template.similarity(tokens)
+            if (similarity, wildcards) > best_key:
+                best, best_key = template, (similarity, wildcards)
+
+        if best is None or best_key[0] < self.similarity_threshold:
+            if len(self.templates) >= self.max_templates:
+                # Bounded memory: count the line but don't grow the table
+                self.unclustered += 1
+                return None
+            best = LogTemplate(list(tokens), timestamp, self.max_examples)
+            leaf.append(best)
+            self.templates.append(best)
+
+        best.absorb(tokens, raw_tokens, timestamp)
+        return best
+
+    def _leaf_for(self, tokens: List[str]) -> List[LogTemplate]:
+        """Walk the tree by token count then leading tokens, creating nodes as needed"""
+        node = self.tree.setdefault(len(tokens), {})
+        for token in tokens[:self.depth - 2]:
+            if any(char.isdigit() for char in token):
+                token = WILDCARD
+            if token not in node:
+                token = token if len(node) < self.max_children else WILDCARD
+            node = node.setdefault(token, {})
+        return node.setdefault('__templates__', [])
+
+    def mine_file(self, log_path: str) -> 'LogTemplateMiner':
+        """Stream an entire log file through the miner"""
+        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                self.add_line(line)
+        return self
+
+    def to_table(self, max_rows: int = 200) -> str:
+        """Markdown table of the most frequent templates"""
+        rows = [
+            f"Lines: {self.line_count}, templates: {len(self.templates)}"
+            + (f", unclustered lines: {self.unclustered}" if self.unclustered else ""),
+            "",
+            "| Count | First seen | Last seen | Template | Example values |",
+            "|---|---|---|---|---|"
+        ]
+
+        ranked = sorted(self.templates, key=lambda t: t.count, reverse=True)
+        for template in ranked[:max_rows]:
+            examples = '; '.join(', '.join(values) for _, values in sorted(template.examples.items()))
+            row = [str(template.count), template.first_timestamp or '', template.last_timestamp or '',
+                   template.text, examples]
+            rows.append('| ' + ' | '.join(cell.replace('|', '\\|') for cell in row) + ' |')
+
+        if len(ranked) > max_rows:
+            rest = sum(t.count for t in ranked[max_rows:])
+            rows.append(f"| {rest} | | | ({len(ranked) - max_rows} rarer templates) | |")
+
+        return '\n'.join(rows)
@@ -6,11 +6,18 @@ implementation insights and architectural knowledge.
 """
 
 import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 
 from .llm_router import LLMRouter, ContentType
+from . import pdf_text
+from .log_miner import LogTemplateMiner
+from .log_incidents import IncidentDetector
+from .image_hash import cluster_images
+from .vector_graphics import VECTOR_EXTENSIONS, describe_vector_file
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +39,24 @@ class MultimodalProcessor:
         self.llm_router = llm_router
         
         # Supported file types
-        self.image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.svg'}
+        self.image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
+        self.vector_extensions = set(VECTOR_EXTENSIONS)  # Parsed locally, analyzed as text
         self.pdf_extensions = {'.pdf'}
         self.log_extensions = {'.log', '.txt', '.out'}
+        
+        # PDF extraction limits, pages are extracted in a process pool across PDFs
+        self.pdf_page_char_cap = 20000
+        self.pdf_chunk_token_budget = 8000
+        self.pdf_workers = os.cpu_count() or 1
+        self.analysis_concurrency = 4
+        self.pdf_chunk_budget = 40  # PDF chunk analyses (LLM calls) per run, across all PDFs
+        
+        # Vision calls per run, spread over clusters of near-duplicate images
+        self.image_budget = 10
+        self.image_duplicate_distance = 6
+        
+        # Log template table size sent to the LLM
+        self.log_template_rows = 200
     
     async def process_multimodal_sources(self, source_paths: List[str]) -> Dict[str, List[MultimodalInsight]]:
         """
@@ -50,6 +72,7 @@ class MultimodalProcessor:
         
         # Categorize files by type
         images = []
+        vectors = []
         pdfs = []
         logs = []
         
@@ -58,6 +81,8 @@ class MultimodalProcessor:
             if path_obj.is_file():
                 if path_obj.suffix.lower() in self.image_extensions:
                     images.append(str(path_obj))
+                elif path_obj.suffix.lower() in self.vector_extensions:
+                    vectors.append(str(path_obj))
                 elif path_obj.suffix.lower() in self.pdf_extensions:
                     pdfs.append(str(path_obj))
                 elif path_obj.suffix.lower() in self.log_extensions:
@@ -66,22 +91,28 @@ class MultimodalProcessor:
                 # Find files in directory
                 for ext in self.image_extensions:
                     images.extend([str(f) for f in path_obj.rglob(f'*{ext}')])
+                for ext in self.vector_extensions:
+                    vectors.extend([str(f) for f in path_obj.rglob(f'*{ext}')])
                 for ext in self.pdf_extensions:
                     pdfs.extend([str(f) for f in path_obj.rglob(f'*{ext}')])
                 for ext in self.log_extensions:
                     logs.extend([str(f) for f in path_obj.rglob(f'*{ext}')])
         
-        logger.info(f"Found {len(images)} images, {len(pdfs)} PDFs, {len(logs)} log files")
+        logger.info(f"Found {len(images)} images, {len(vectors)} vector diagrams, {len(pdfs)} PDFs, {len(logs)} log files")
         
         results = {}
         
         # Process images
         if images:
-            results['images'] = await self._process_images(images[:10])  # Limit to 10 images
+            results['images'] = await self._process_images(images)
+        
+        # Process vector diagrams through the text path
+        if vectors:
+            results['diagrams'] = await self._process_vector_diagrams(vectors)
         
         # Process PDFs
         if pdfs:
-            results['pdfs'] = await self._process_pdfs(pdfs[:5])  # Limit to 5 PDFs
+            results['pdfs'] = await self._process_pdfs(pdfs)
         
         # Process logs
         if logs:
@@ -93,20 +124,49 @@ class MultimodalProcessor:
         """Process images for architectural and implementation insights"""
         insights = []
         
-        for image_path in image_paths:
+        # Analyze one representative per cluster of near-identical images
+        clusters = await asyncio.to_thread(cluster_images, image_paths, self.image_duplicate_distance)
+        selected = clusters[:self.image_budget]
+        logger.info(f"Clustered {len(image_paths)} images into {len(clusters)} distinct groups, "
+                    f"analyzing {len(selected)}")
+        
+        # Related images (same folder) are sent together so the model reads them in context
+        for batch in self._batch_image_clusters(selected):
+            representatives = [cluster[0] for cluster in batch]
             try:
-                insight = await self._analyze_image(image_path)
+                if len(batch) > 1:
+                    batch_insights = await self._analyze_image_batch(representatives)
+                else:
+                    batch_insights = [await self._analyze_image(representatives[0])]
+            except Exception as e:
+                logger.warning(f"Could not process images {representatives}: {e}")
+                continue
+            
+            for cluster, insight in zip(batch, batch_insights):
                 if insight:
+                    if len(cluster) > 1:
+                        insight.title = f"{insight.title} (+{len(cluster) - 1} similar)"
                     insights.append(insight)
-            except Exception as e:
-                logger.warning(f"Could not process image {image_path}: {e}")
         
         return insights
     
-    async def _analyze_image(self, image_path: str) -> Optional[MultimodalInsight]:
-        """Analyze a single image for implementation insights"""
+    def _batch_image_clusters(self, clusters: List[List[str]]) -> List[List[List[str]]]:
+        """Group clusters by the folder of their representative, in filename order, up to the request limit"""
+        by_folder: Dict[str, List[List[str]]] = {}
+        for cluster in clusters:
+            by_folder.setdefault(str(Path(cluster[0]).parent), []).append(cluster)
         
-        prompt = """Analyze this image and extract insights that would help someone build a similar system.
+        batch_size = self.llm_router.max_images_per_request
+        batches = []
+        for folder_clusters in by_folder.values():
+            folder_clusters.sort(key=lambda cluster: Path(cluster[0]).name)
+            for i in range(0, len(folder_clusters), batch_size):
+                batches.append(folder_clusters[i:i + batch_size])
+        return batches
+    
+    def _get_image_prompt(self) -> str:
+        """Prompt for analyzing architecture diagrams, screenshots and mockups"""
+        return """Analyze this image and extract insights that would help someone build a similar system.
 
 Focus on:
 
@@ -125,6 +185,27 @@ Focus on:
 7. **Implementation Gotchas**: What potential challenges or pitfalls does this reveal?
 
 Provide practical insights that would guide someone building a similar system. If this is a UI mockup, focus on implementation approaches. If it's an architecture diagram, focus on system design decisions."""
+    
+    async def _analyze_image_batch(self, image_paths: List[str]) -> List[Optional[MultimodalInsight]]:
+        """Analyze related images in one multi-image request, one insight per image"""
+        folder = Path(image_paths[0]).parent.name or "."
+        analyses = await self.llm_router.analyze_images(
+            image_paths, self._get_image_prompt(), context=f"images from the '{folder}' folder, in filename order"
+        )
+        
+        if analyses is None:
+            # Batch failed or couldn't be split per image, analyze individually instead
+            return [await self._analyze_image(image_path) for image_path in image_paths]
+        
+        return [
+            self._parse_multimodal_analysis(analysis, image_path, 'image', Path(image_path).name)
+            for image_path, analysis in zip(image_paths, analyses)
+        ]
+    
+    async def _analyze_image(self, image_path: str) -> Optional[MultimodalInsight]:
+        """Analyze a single image for implementation insights"""
+        
+        prompt = self._get_image_prompt()
         
         try:
             result = await self.llm_router.analyze_content(
@@ -139,32 +220,121 @@ Provide practical insights that would guide someone building a similar system. I
             logger.error(f"Error analyzing image {image_path}: {e}")
             return None
     
-    async def _process_pdfs(self, pdf_paths: List[str]) -> List[MultimodalInsight]:
-        """Process PDFs for implementation knowledge"""
+    async def _process_vector_diagrams(self, diagram_paths: List[str]) -> List[MultimodalInsight]:
+        """Describe SVG/draw.io diagrams locally and analyze the descriptions as text"""
         insights = []
+        semaphore = asyncio.Semaphore(self.analysis_concurrency)
         
-        for pdf_path in pdf_paths:
-            try:
-                # Extract text from PDF (simplified - would use proper PDF extraction)
-                text_content = self._extract_pdf_text(pdf_path)
-                if text_content:
-                    insight = await self._analyze_pdf_content(pdf_path, text_content)
-                    if insight:
-                        insights.append(insight)
-            except Exception as e:
-                logger.warning(f"Could not process PDF {pdf_path}: {e}")
+        async def analyze(diagram_path: str) -> Optional[MultimodalInsight]:
+            description = await asyncio.to_thread(describe_vector_file, diagram_path)
+            if not description:
+                return None
+            async with semaphore:
+                return await self._analyze_diagram_description(diagram_path, description)
+        
+        for insight in await asyncio.gather(*[analyze(path) for path in diagram_paths]):
+            if insight:
+                insights.append(insight)
         
         return insights
     
-    def _extract_pdf_text(self, pdf_path: str) -> Optional[str]:
-        """Extract text from PDF (simplified implementation)"""
+    async def _analyze_diagram_description(self, diagram_path: str, description: str) -> Optional[MultimodalInsight]:
+        """Analyze the extracted structure of a vector diagram"""
+        
+        prompt = ("The content below is the structure of a vector diagram extracted from its source file: "
+                  "its text labels, nodes, groups and connectors (source -> target).\n\n"
+                  + self._get_image_prompt().replace("this image", "this diagram", 1))
+        
         try:
-            # This is a placeholder - in a real implementation, you'd use PyPDF2 or similar
-            logger.info(f"PDF text extraction not fully implemented for {pdf_path}")
-            return f"PDF content from {Path(pdf_path).name} - text extraction would be implemented here"
+            result = await self.llm_router.analyze_content(
+                description, ContentType.TEXT, prompt
+            )
+            
+            return self._parse_multimodal_analysis(
+                result, diagram_path, 'diagram', Path(diagram_path).name
+            )
+            
         except Exception as e:
-            logger.error(f"Error extracting PDF text from {pdf_path}: {e}")
+            logger.error(f"Error analyzing diagram {diagram_path}: {e}")
+            return None
+    
+    async def _process_pdfs(self, pdf_paths: List[str]) -> List[MultimodalInsight]:
+        """Process PDFs for implementation knowledge"""
+        if not pdf_text.is_available():
+            logger.warning("PyPDF2 not installed - skipping PDF processing")
+            return []
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.analysis_concurrency)
+        chunk_chars = self.pdf_chunk_token_budget * 4  # ~4 chars per token
+        budget = self.pdf_chunk_budget
+        analyses: Dict[str, asyncio.Task] = {}
+        
+        async def analyze_chunk(pdf_path: str, chunk: str) -> Optional[MultimodalInsight]:
+            async with semaphore:
+                return await self._analyze_pdf_content(pdf_path, chunk)
+        
+        async def analyze_pdf(pdf_path: str, chunks: List[str]) -> Optional[MultimodalInsight]:
+            chunk_insights = await asyncio.gather(*[analyze_chunk(pdf_path, c) for c in chunks])
+            return self._merge_insights([i for i in chunk_insights if i])
+        
+        pool = ProcessPoolExecutor(max_workers=min(self.pdf_workers, len(pdf_paths)))
+        try:
+            extractions = {
+                loop.run_in_executor(pool, pdf_text.extract_pdf_chunks, pdf_path,
+                                     self.pdf_page_char_cap, chunk_chars): pdf_path
+                for pdf_path in pdf_paths
+            }
+            
+            # Start each PDF's analysis as soon as its text is extracted, overlapping
+            # analysis of earlier PDFs with extraction of later ones
+            pending = set(extractions)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pdf_path = extractions[future]
+                    try:
+                        chunks = future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not process PDF {pdf_path}: {e}")
+                        continue
+                    
+                    if not chunks:
+                        logger.info(f"No extractable text in {pdf_path}")
+                        continue
+                    
+                    if len(chunks) > budget:
+                        logger.info(f"PDF chunk budget reached: analyzing {budget} of {len(chunks)} chunks of {pdf_path}")
+                        chunks = chunks[:budget]
+                    budget -= len(chunks)
+                    if chunks:
+                        analyses[pdf_path] = asyncio.ensure_future(analyze_pdf(pdf_path, chunks))
+                
+                if budget <= 0 and pending:
+                    logger.info(f"PDF chunk budget of {self.pdf_chunk_budget} spent, skipping {len(pending)} PDFs")
+                    for future in pending:
+                        future.cancel()
+                    break
+        finally:
+            # Never wait on the pool from the event loop: drop extractions skipped by the
+            # budget and let any still running finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        results = await asyncio.gather(*analyses.values())
+        
+        return [insight for insight in results if insight]
+    
+    def _merge_insights(self, insights: List[MultimodalInsight]) -> Optional[MultimodalInsight]:
+        """Combine insights from chunks of the same source into one"""
+        if not insights:
             return None
+        
+        merged = insights[0]
+        for insight in insights[1:]:
+            merged.insights.extend(insight.insights)
+            merged.implementation_notes.extend(insight.implementation_notes)
+            merged.gotchas.extend(insight.gotchas)
+        return merged
     
     async def _analyze_pdf_content(self, pdf_path: str, content: str) -> Optional[MultimodalInsight]:
         """Analyze PDF content for implementation insights"""
@@ -206,11 +376,10 @@ Provide actionable insights that would help someone implement the described syst
         
         for log_path in log_paths:
             try:
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    # Read a sample of the log file (to avoid overwhelming the LLM)
-                    content = f.read(50000)  # First 50KB
+                # Mine the whole log into templates off the event loop
+                content = await asyncio.to_thread(self._summarize_log, log_path)
                 
-                if content.strip():
+                if content:
                     insight = await self._analyze_log_content(log_path, content)
                     if insight:
                         insights.append(insight)
@@ -220,6 +389,28 @@ Provide actionable insights that would help someone implement the described syst
         
         return insights
     
+    def _summarize_log(self, log_path: str) -> Optional[str]:
+        """Stream a log once through the template miner and the incident detector"""
+        miner = LogTemplateMiner()
+        detector = IncidentDetector()
+        
+        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                miner.add_line(line)
+                detector.add_line(line)
+        
+        if not miner.templates:
+            return None
+        
+        incidents = detector.finish()
+        logger.info(f"Mined {miner.line_count} lines of {Path(log_path).name} into "
+                    f"{len(miner.templates)} templates and {len(incidents)} incidents")
+        return (f"Summary of {Path(log_path).name}, covering the entire log.\n\n"
+                f"## Incidents\n\nError and latency bursts with surrounding context, largest first.\n\n"
+                + detector.to_text(incidents)
+                + "\n\n## Templates\n\nVariable tokens are shown as <*>.\n\n"
+                + miner.to_table(self.log_template_rows))
+    
     async def _analyze_log_content(self, log_path: str, content: str) -> Optional[MultimodalInsight]:
         """Analyze log content for implementation insights and gotchas"""
         
@@ -241,6 +432,8 @@ Focus on:
 
 7. **Common Pitfalls**: What mistakes or issues should be avoided in similar implementations?
 
+The logs are given as detected incidents (error and latency bursts with context) followed by a table of line templates. Base the pitfalls on the incidents first.
+
 Provide practical insights that would help someone build a more robust system and avoid common pitfalls."""
         
         try:
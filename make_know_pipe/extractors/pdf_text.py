@@ -0,0 +1,73 @@
+"""
+PDF Text - Streaming page-by-page PDF text extraction
+
+Extracts text one page at a time with PyPDF2, capping characters per page,
+skipping blank pages and packing pages into chunks that fit a token budget.
+Functions here are module-level so they can run in a process pool.
+"""
+
+from typing import Iterator, List, Tuple
+import logging
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+def is_available() -> bool:
+    """Check if PDF extraction is possible"""
+    return PdfReader is not None
+
+def iter_pdf_pages(pdf_path: str, page_char_cap: int) -> Iterator[Tuple[int, str]]:
+    """Yield (page_number, text) for each non-blank page, one page at a time"""
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for page_number, page in enumerate(reader.pages, 1):
+            try:
+                text = page.extract_text() or ''
+            except Exception as e:
+                logger.warning(f"Could not extract page {page_number} of {pdf_path}: {e}")
+                continue
+
+            text = text.strip()
+            if text:
+                yield page_number, text[:page_char_cap]
+
+def extract_pdf_chunks(pdf_path: str, page_char_cap: int, chunk_chars: int) -> List[str]:
+    """
+    Extract a PDF's text as chunks of whole pages
+
+    Args:
+        pdf_path: PDF file to read
+        page_char_cap: Maximum characters kept from any single page
+        chunk_chars: Character budget per chunk
+
+    Returns:
+        Chunks of text, each prefixed with the page range it covers
+    """
+    if PdfReader is None:
+        return []
+
+    chunks = []
+    pages: List[str] = []
+    first_page = last_page = 0
+    size = 0
+
+    def flush():
+        if pages:
+            chunks.append(f"[Pages {first_page}-{last_page}]\n\n" + '\n\n'.join(pages))
+
+    for page_number, text in iter_pdf_pages(pdf_path, page_char_cap):
+        if pages and size + len(text) > chunk_chars:
+            flush()
+            pages, size = [], 0
+        if not pages:
+            first_page = page_number
+        pages.append(text)
+        last_page = page_number
+        size += len(text)
+
+    flush()
+    return chunks
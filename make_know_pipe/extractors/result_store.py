@@ -0,0 +1,76 @@
+"""
+Result Store - Persist per-file analysis results keyed by content hash
+
+Stores each file's extracted results as a small JSON file whose name is
+derived from the file's content hash, the prompt version and the feature
+name, so unchanged files can be loaded instead of re-analyzed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+def content_hash(content: str) -> str:
+    """SHA-256 of file content"""
+    return hashlib.sha256(content.encode('utf-8', errors='ignore')).hexdigest()
+
+def write_json_atomic(path: Path, data: Any):
+    """Write JSON through a temp file and os.replace so readers never see a torn file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+class ResultStore:
+    """Content-addressed store of per-file analysis results"""
+
+    def __init__(self, store_dir: str, prompt_version: str):
+        self.store_dir = Path(store_dir)
+        self.prompt_version = prompt_version
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, file_hash: str, feature_name: str) -> Path:
+        key = hashlib.sha256(f"{self.prompt_version}\0{feature_name}\0{file_hash}".encode('utf-8')).hexdigest()
+        return self.store_dir / key[:2] / f"{key}.json"
+
+    def load(self, file_hash: str, feature_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Stored results for a file, or None if it has not been analyzed in this form"""
+        entry_path = self._entry_path(file_hash, feature_name)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                results = json.load(f)['results']
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable result store entry {entry_path}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return results
+
+    def save(self, file_hash: str, feature_name: str, results: List[Dict[str, Any]]):
+        """Persist results for a file"""
+        entry = {
+            'prompt_version': self.prompt_version,
+            'feature_name': feature_name,
+            'content_hash': file_hash,
+            'results': results
+        }
+        try:
+            write_json_atomic(self._entry_path(file_hash, feature_name), entry)
+        except Exception as e:
+            logger.warning(f"Could not save result store entry for {feature_name}: {e}")
@@ -0,0 +1,137 @@
+"""
+Source Chunker - Split large source files along top-level boundaries
+
+Finds top-level class and function boundaries (ast for Python, brace depth
+for C-like languages, indentation for the rest) and packs the resulting
+units into chunks that fit a character budget.
+"""
+
+import ast
+from pathlib import Path
+from typing import List
+
+BRACE_LANGUAGES = {'.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php'}
+
+class SourceChunk:
+    """A contiguous range of lines from a source file"""
+    def __init__(self, start_line: int, end_line: int, text: str):
+        self.start_line = start_line
+        self.end_line = end_line
+        self.text = text
+
+def _python_boundaries(content: str, lines: List[str]) -> List[int]:
+    """Start lines (0-based) of top-level Python statements"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return _indent_boundaries(lines)
+
+    starts = []
+    for node in tree.body:
+        decorators = getattr(node, 'decorator_list', [])
+        starts.append(min([node.lineno] + [d.lineno for d in decorators]) - 1)
+    return starts
+
+def _brace_boundaries(lines: List[str]) -> List[int]:
+    """Lines that start at brace depth zero, skipping strings and comments roughly"""
+    starts = [0]
+    depth = 0
+    in_block_comment = False
+
+    for index, line in enumerate(lines):
+        if depth == 0 and index > 0 and line.strip():
+            starts.append(index)
+
+        i = 0
+        quote = None
+        while i < len(line):
+            pair = line[i:i + 2]
+            char = line[i]
+            if in_block_comment:
+                if pair == '*/':
+                    in_block_comment = False
+                    i += 1
+            elif quote:
+                if char == '\\':
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif pair == '//':
+                break
+            elif pair == '/*':
+                in_block_comment = True
+                i += 1
+            elif char in '"\'`':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth = max(0, depth - 1)
+            i += 1
+
+    return starts
+
+def _indent_boundaries(lines: List[str]) -> List[int]:
+    """Non-blank lines at column zero that don't close a previous block"""
+    starts = [0]
+    for index, line in enumerate(lines):
+        if index and line and not line[0].isspace() and not line.startswith(('end', '}', ')', ']')):
+            starts.append(index)
+    return starts
+
+def find_unit_boundaries(file_path: str, content: str, lines: List[str]) -> List[int]:
+    """Sorted start lines of top-level units for a file's language"""
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.py':
+        starts = _python_boundaries(content, lines)
+    elif suffix in BRACE_LANGUAGES:
+        starts = _brace_boundaries(lines)
+    else:
+        starts = _indent_boundaries(lines)
+    return sorted(set([0] + starts))
+
+def split_into_chunks(file_path: str, content: str, max_chars: int) -> List[SourceChunk]:
+    """
+    Split source into chunks of whole top-level units up to max_chars each
+
+    Units larger than max_chars on their own are split by lines.
+    """
+    lines = content.split('\n')
+    starts = find_unit_boundaries(file_path, content, lines)
+    units = [(start, end) for start, end in zip(starts, starts[1:] + [len(lines)]) if start < end]
+
+    chunks = []
+    chunk_start = None
+    chunk_size = 0
+
+    def flush(end: int):
+        if chunk_start is not None and end > chunk_start:
+            chunks.append(SourceChunk(chunk_start + 1, end, '\n'.join(lines[chunk_start:end])))
+
+    for start, end in units:
+        unit_size = sum(len(line) + 1 for line in lines[start:end])
+
+        if unit_size > max_chars:
+            flush(start)
+            chunk_start, chunk_size = None, 0
+            # Oversized unit: fall back to line-based splitting
+            piece_start, piece_size = start, 0
+            for index in range(start, end):
+                line_size = len(lines[index]) + 1
+                if piece_size + line_size > max_chars and index > piece_start:
+                    chunks.append(SourceChunk(piece_start + 1, index, '\n'.join(lines[piece_start:index])))
+                    piece_start, piece_size = index, 0
+                piece_size += line_size
+            chunks.append(SourceChunk(piece_start + 1, end, '\n'.join(lines[piece_start:end])))
+            continue
+
+        if chunk_start is not None and chunk_size + unit_size > max_chars:
+            flush(start)
+            chunk_start, chunk_size = None, 0
+
+        if chunk_start is None:
+            chunk_start = start
+        chunk_size += unit_size
+
+    flush(len(lines))
+    return chunks
@@ -0,0 +1,145 @@
+"""
+Source Walker - Single-pass source discovery with ignore rules
+
+Walks a tree once with os.scandir, pruning version control, dependency and
+build directories plus anything matched by .gitignore files, and keeps the
+stat results so callers don't have to stat every file again.
+"""
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Directories that never contain source worth analyzing
+DEFAULT_IGNORED_DIRS = {
+    '.git', '.hg', '.svn', 'node_modules', 'bower_components', 'venv', '.venv', 'env',
+    '__pycache__', '.mypy_cache', '.pytest_cache', '.ruff_cache', '.tox', '.nox',
+    'build', 'dist', 'target', 'out', '.next', '.nuxt', 'coverage', '.idea', '.vscode',
+    'vendor', 'site-packages', '.eggs'
+}
+
+class SourceFile:
+    """A discovered file with the stat data gathered during the walk"""
+    def __init__(self, path: str, size: int, mtime: float):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+
+class IgnoreRule:
+    """A single .gitignore pattern, relative to the directory it was declared in"""
+    def __init__(self, base: str, pattern: str):
+        self.base = base
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        # Patterns with an inner slash are anchored to the .gitignore directory
+        self.anchored = '/' in pattern
+        self.pattern = pattern.lstrip('/')
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + '/'):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        if self.anchored:
+            return fnmatch(rel_path, self.pattern) or fnmatch(rel_path, self.pattern.replace('**/', ''))
+        return fnmatch(name, self.pattern)
+
+def _load_gitignore(directory: str, base: str) -> List[IgnoreRule]:
+    """Read the rules of a .gitignore file if the directory has one"""
+    gitignore = os.path.join(directory, '.gitignore')
+    rules = []
+    try:
+        with open(gitignore, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    rules.append(IgnoreRule(base, line))
+    except OSError:
+        pass
+    return rules
+
+def _is_ignored(rules: List[IgnoreRule], rel_path: str, name: str, is_dir: bool) -> bool:
+    """Apply rules in order so later negations can re-include a path"""
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, name, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+def walk_source_files(root: str, extensions: Set[str],
+                      ignored_dirs: Optional[Set[str]] = None,
+                      use_gitignore: bool = True) -> Iterator[SourceFile]:
+    """
+    Yield every file under root whose suffix is in extensions, in one walk
+
+    Args:
+        root: Directory to walk
+        extensions: Lowercase suffixes to keep, e.g. {'.py', '.js'}
+        ignored_dirs: Directory names to prune, defaults to DEFAULT_IGNORED_DIRS
+        use_gitignore: Whether to honor .gitignore files found along the way
+
+    Yields:
+        SourceFile entries with size and mtime from the walk's stat calls
+    """
+    if ignored_dirs is None:
+        ignored_dirs = DEFAULT_IGNORED_DIRS
+
+    root_rules = _load_gitignore(root, '') if use_gitignore else []
+    stack: List[Tuple[str, str, List[IgnoreRule]]] = [(root, '', root_rules)]
+
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            logger.warning(f"Could not scan directory {directory}: {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    if name in ignored_dirs or _is_ignored(rules, rel_path, name, True):
+                        continue
+                    subdirs.append((entry.path, rel_path))
+                elif entry.is_file():
+                    suffix = os.path.splitext(name)[1].lower()
+                    if suffix not in extensions or _is_ignored(rules, rel_path, name, False):
+                        continue
+                    stat = entry.stat()
+                    yield SourceFile(entry.path, stat.st_size, stat.st_mtime)
+            except OSError:
+                continue
+
+        for sub_path, sub_rel in reversed(sorted(subdirs)):
+            sub_rules = rules + _load_gitignore(sub_path, sub_rel) if use_gitignore else rules
+            stack.append((sub_path, sub_rel, sub_rules))
+
+def discover_source_files(path: str, extensions: Set[str]) -> Dict[str, SourceFile]:
+    """Map each source file under a file or directory path to its walk metadata"""
+    path_obj = Path(path)
+    found = {}
+
+    if path_obj.is_file():
+        if path_obj.suffix.lower() in extensions:
+            stat = path_obj.stat()
+            found[str(path_obj)] = SourceFile(str(path_obj), stat.st_size, stat.st_mtime)
+    elif path_obj.is_dir():
+        for source_file in walk_source_files(str(path_obj), extensions):
+            # Normalize like Path.rglob would, e.g. drop a leading "./"
+            source_file.path = str(Path(source_file.path))
+            found[source_file.path] = source_file
+
+    return found
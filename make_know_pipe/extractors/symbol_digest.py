@@ -0,0 +1,199 @@
+"""
+Symbol Digest - Local AST pre-extraction for Python source files
+
+Parses a Python file into a compact digest of its classes, functions,
+signatures, docstrings, decorators, imports and call edges so the LLM can
+be given the structure of a file plus only its most relevant bodies.
+"""
+
+import ast
+from typing import Dict, List, Optional, Set
+
+class SymbolInfo:
+    """A class, function or method found in a module"""
+    def __init__(self, name: str, kind: str, signature: str, docstring: str,
+                 decorators: List[str], start_line: int, end_line: int, calls: Set[str]):
+        self.name = name
+        self.kind = kind  # "class", "function" or "method"
+        self.signature = signature
+        self.docstring = docstring
+        self.decorators = decorators
+        self.start_line = start_line
+        self.end_line = end_line
+        self.calls = calls
+
+    @property
+    def short_name(self) -> str:
+        return self.name.rsplit('.', 1)[-1]
+
+class SymbolDigest:
+    """Compact structural summary of a Python module"""
+    def __init__(self, module_doc: str, imports: List[str], symbols: List[SymbolInfo], lines: List[str]):
+        self.module_doc = module_doc
+        self.imports = imports
+        self.symbols = symbols
+        self.lines = lines
+
+    def to_text(self) -> str:
+        """Render the digest as an indented outline"""
+        parts = []
+        if self.module_doc:
+            parts.append(f'"""{self.module_doc}"""')
+        if self.imports:
+            parts.append(f"imports: {', '.join(self.imports)}")
+
+        for symbol in self.symbols:
+            indent = '    ' if symbol.kind == 'method' else ''
+            for decorator in symbol.decorators:
+                parts.append(f"{indent}@{decorator}")
+            parts.append(f"{indent}{symbol.signature}  [L{symbol.start_line}-{symbol.end_line}]")
+            if symbol.docstring:
+                parts.append(f'{indent}    """{symbol.docstring}"""')
+            if symbol.calls:
+                parts.append(f"{indent}    calls: {', '.join(sorted(symbol.calls))}")
+
+        return '\n'.join(parts)
+
+    def symbol_source(self, symbol: SymbolInfo) -> str:
+        """Source text of a symbol, decorators included"""
+        return '\n'.join(self.lines[symbol.start_line - 1:symbol.end_line])
+
+    def rank_symbols(self, keywords: List[str]) -> List[SymbolInfo]:
+        """Order functions and methods by likely relevance to the given keywords"""
+        callers: Dict[str, int] = {}
+        for symbol in self.symbols:
+            for call in symbol.calls:
+                callers[call] = callers.get(call, 0) + 1
+
+        def score(symbol: SymbolInfo) -> float:
+            name_lower = symbol.name.lower()
+            value = 2.0 * callers.get(symbol.short_name, 0)
+            value += 3.0 * sum(1 for keyword in keywords if keyword and keyword in name_lower)
+            value += 1.0 if symbol.docstring else 0.0
+            value += 1.0 if not symbol.short_name.startswith('_') else 0.0
+            return value
+
+        candidates = [s for s in self.symbols if s.kind != 'class']
+        return sorted(candidates, key=lambda s: (-score(s), s.start_line))
+
+    def build_context(self, keywords: List[str], body_budget: int) -> str:
+        """Digest followed by the bodies of the most relevant symbols within a character budget"""
+        sections = ["## Symbol Digest\n", self.to_text()]
+        selected = []
+        used = 0
+
+        for symbol in self.rank_symbols(keywords):
+            body = self.symbol_source(symbol)
+            if used + len(body) > body_budget:
+                continue
+            selected.append(symbol)
+            used += len(body)
+
+        if selected:
+            sections.append("\n\n## Selected Source\n")
+            for symbol in sorted(selected, key=lambda s: s.start_line):
+                sections.append(f"\n# {symbol.name} (L{symbol.start_line}-{symbol.end_line})\n")
+                sections.append(self.symbol_source(symbol))
+
+        return '\n'.join(sections)
+
+def _first_line(docstring: Optional[str]) -> str:
+    if not docstring:
+        return ''
+    return docstring.strip().split('\n', 1)[0].strip()
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+def _collect_calls(node: ast.AST) -> Set[str]:
+    calls = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            name = _call_name(child)
+            if name:
+                calls.add(name)
+    return calls
+
+def _function_signature(node: ast.AST) -> str:
+    prefix = 'async def' if isinstance(node, ast.AsyncFunctionDef) else 'def'
+    signature = f"{prefix} {node.name}({ast.unparse(node.args)})"
+    if node.returns is not None:
+        signature += f" -> {ast.unparse(node.returns)}"
+    return signature
+
+def _class_signature(node: ast.ClassDef) -> str:
+    bases = [ast.unparse(base) for base in node.bases]
+    bases.extend(ast.unparse(keyword) for keyword in node.keywords)
+    return f"class {node.name}({', '.join(bases)})" if bases else f"class {node.name}"
+
+def _symbol_start(node: ast.AST) -> int:
+    decorators = getattr(node, 'decorator_list', [])
+    return min([node.lineno] + [d.lineno for d in decorators])
+
+def _collect_imports(tree: ast.Module) -> List[str]:
+    imports = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = '.' * node.level + (node.module or '')
+            imports.extend(f"{module}.{alias.name}" if module else alias.name for alias in node.names)
+    return imports
+
+def build_python_digest(content: str) -> Optional[SymbolDigest]:
+    """Parse Python source into a SymbolDigest, or None if it does not parse"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    symbols = []
+    function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    for node in tree.body:
+        if isinstance(node, function_types):
+            symbols.append(SymbolInfo(
+                name=node.name,
+                kind='function',
+                signature=_function_signature(node),
+                docstring=_first_line(ast.get_docstring(node)),
+                decorators=[ast.unparse(d) for d in node.decorator_list],
+                start_line=_symbol_start(node),
+                end_line=node.end_lineno,
+                calls=_collect_calls(node)
+            ))
+        elif isinstance(node, ast.ClassDef):
+            symbols.append(SymbolInfo(
+                name=node.name,
+                kind='class',
+                signature=_class_signature(node),
+                docstring=_first_line(ast.get_docstring(node)),
+                decorators=[ast.unparse(d) for d in node.decorator_list],
+                start_line=_symbol_start(node),
+                end_line=node.end_lineno,
+                calls=set()
+            ))
+            for child in node.body:
+                if isinstance(child, function_types):
+                    symbols.append(SymbolInfo(
+                        name=f"{node.name}.{child.name}",
+                        kind='method',
+                        signature=_function_signature(child),
+                        docstring=_first_line(ast.get_docstring(child)),
+                        decorators=[ast.unparse(d) for d in child.decorator_list],
+                        start_line=_symbol_start(child),
+                        end_line=child.end_lineno,
+                        calls=_collect_calls(child)
+                    ))
+
+    return SymbolDigest(
+        module_doc=_first_line(ast.get_docstring(tree)),
+        imports=_collect_imports(tree),
+        symbols=symbols,
+        lines=content.split('\n')
+    )
@@ -0,0 +1,204 @@
+"""
+Vector Graphics - Local text extraction from SVG and draw.io diagrams
+
+Vector diagrams already contain their labels and connections as XML, so a
+fast local pass turns them into a compact graph description that can go
+through the text path instead of a vision call.
+"""
+
+import base64
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+import xml.etree.ElementTree as ET
+import logging
+
+logger = logging.getLogger(__name__)
+
+VECTOR_EXTENSIONS = {'.svg', '.drawio'}
+
+NUMBER_PATTERN = re.compile(r'-?\d*\.?\d+(?:e-?\d+)?')
+TRANSLATE_PATTERN = re.compile(r'translate\(\s*(-?[\d.]+)(?:[\s,]+(-?[\d.]+))?\s*\)')
+CONNECTOR_HINT = re.compile(r'edge|arrow|connector|link|line', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+def _float(value: Optional[str], default: float = 0.0) -> float:
+    match = NUMBER_PATTERN.search(value or '')
+    return float(match.group()) if match else default
+
+def _clean(text: Optional[str]) -> str:
+    return ' '.join(TAG_PATTERN.sub(' ', unquote(text or '')).split())
+
+class _Box:
+    def __init__(self, x: float, y: float, width: float, height: float):
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self.labels: List[str] = []
+
+    def contains(self, x: float, y: float, margin: float = 0.0) -> bool:
+        return (self.x - margin <= x <= self.x + self.width + margin
+                and self.y - margin <= y <= self.y + self.height + margin)
+
+    @property
+    def name(self) -> str:
+        return ' / '.join(self.labels)
+
+def describe_svg(svg_path: str, max_items: int = 200) -> str:
+    """Describe an SVG's labels, groups, boxes and connectors as compact text"""
+    labels: List[Tuple[str, float, float]] = []
+    boxes: List[_Box] = []
+    connectors: List[Tuple[float, float, float, float]] = []
+    groups: List[Tuple[str, List[str]]] = []
+    titles: List[str] = []
+
+    offsets = [(0.0, 0.0)]
+    group_stack: List[Tuple[str, List[str]]] = []
+    size = ''
+
+    for event, element in ET.iterparse(svg_path, events=('start', 'end')):
+        tag = _local(element.tag)
+
+        if event == 'start':
+            dx, dy = offsets[-1]
+            match = TRANSLATE_PATTERN.search(element.get('transform', ''))
+            if match:
+                dx += float(match.group(1))
+                dy += float(match.group(2) or 0)
+            offsets.append((dx, dy))
+            if tag == 'svg' and not size:
+                size = f"{element.get('width', '?')}x{element.get('height', '?')}"
+            elif tag == 'g':
+                group_stack.append((element.get('id') or element.get('class') or '', []))
+            continue
+
+        dx, dy = offsets.pop()
+        if tag == 'text':
+            text = _clean(''.join(element.itertext()))
+            if text:
+                labels.append((text, _float(element.get('x')) + dx, _float(element.get('y')) + dy))
+                if group_stack:
+                    group_stack[-1][1].append(text)
+        elif tag in ('title', 'desc'):
+            text = _clean(element.text)
+            if text:
+                titles.append(text)
+        elif tag == 'rect':
+            boxes.append(_Box(_float(element.get('x')) + dx, _float(element.get('y')) + dy,
+                              _float(element.get('width')), _float(element.get('height'))))
+        elif tag in ('circle', 'ellipse'):
+            rx = _float(element.get('r') or element.get('rx'))
+            ry = _float(element.get('r') or element.get('ry'))
+            boxes.append(_Box(_float(element.get('cx')) + dx - rx, _float(element.get('cy')) + dy - ry, 2 * rx, 2 * ry))
+        elif tag == 'line':
+            connectors.append((_float(element.get('x1')) + dx, _float(element.get('y1')) + dy,
+                               _float(element.get('x2')) + dx, _float(element.get('y2')) + dy))
+        elif tag in ('path', 'polyline'):
+            is_connector = (element.get('marker-end') or element.get('marker-start')
+                            or CONNECTOR_HINT.search(element.get('class', '') + element.get('id', ''))
+                            or tag == 'polyline')
+            points = NUMBER_PATTERN.findall(element.get('d') or element.get('points') or '')
+            if is_connector and len(points) >= 4:
+                connectors.append((float(points[0]) + dx, float(points[1]) + dy,
+                                   float(points[-2]) + dx, float(points[-1]) + dy))
+        elif tag == 'g' and group_stack:
+            name, texts = group_stack.pop()
+            if texts and name:
+                groups.append((name, texts))
+            if group_stack:
+                group_stack[-1][1].extend(texts)
+
+        # Free handled subtrees; tspans are kept until their parent text is read
+        if tag not in ('tspan', 'textPath', 'a'):
+            element.clear()
+
+    # Attach labels to the smallest box containing them to name diagram nodes
+    for text, x, y in labels:
+        containing = [b for b in boxes if b.contains(x, y)]
+        if containing:
+            min(containing, key=lambda b: b.width * b.height).labels.append(text)
+    nodes = [b for b in boxes if b.labels]
+
+    def node_at(x: float, y: float) -> str:
+        near = [b for b in nodes if b.contains(x, y, margin=15)]
+        if near:
+            return min(near, key=lambda b: b.width * b.height).name
+        if labels:
+            return min(labels, key=lambda label: (label[1] - x) ** 2 + (label[2] - y) ** 2)[0]
+        return f"({x:.0f},{y:.0f})"
+
+    edges = []
+    for x1, y1, x2, y2 in connectors:
+        source, target = node_at(x1, y1), node_at(x2, y2)
+        if source != target:
+            edges.append(f"{source} -> {target}")
+
+    parts = [f"SVG diagram: {Path(svg_path).name} ({size or 'unknown size'})"]
+    if titles:
+        parts.append("Title: " + '; '.join(titles[:5]))
+    if nodes:
+        parts.append(f"Nodes ({len(nodes)}):\n" + '\n'.join(f"- {b.name}" for b in nodes[:max_items]))
+    loose = [text for text, x, y in labels if not any(text in b.labels for b in nodes)]
+    if loose:
+        parts.append(f"Other labels ({len(loose)}): " + '; '.join(loose[:max_items]))
+    if groups:
+        parts.append("Groups:\n" + '\n'.join(f"- {name}: {', '.join(texts[:10])}" for name, texts in groups[:max_items]))
+    if edges:
+        parts.append(f"Connectors ({len(edges)}):\n" + '\n'.join(f"- {edge}" for edge in edges[:max_items]))
+    return '\n\n'.join(parts)
+
+def _drawio_diagrams(root: ET.Element) -> List[ET.Element]:
+    """Graph models of a draw.io file, inflating compressed diagrams (pages)"""
+    models = list(root.iter('mxGraphModel'))
+    for diagram in root.iter('diagram'):
+        data = (diagram.text or '').strip()
+        # Each page is stored either as a child model or as compressed text
+        if data and diagram.find('mxGraphModel') is None:
+            try:
+                xml_text = unquote(zlib.decompress(base64.b64decode(data), -15).decode('utf-8'))
+                models.append(ET.fromstring(xml_text))
+            except Exception as e:
+                logger.warning(f"Could not inflate draw.io diagram: {e}")
+    return models
+
+def describe_drawio(drawio_path: str, max_items: int = 200) -> str:
+    """Describe a draw.io diagram's vertices and edges as compact text"""
+    root = ET.parse(drawio_path).getroot()
+    names: Dict[str, str] = {}
+    edges = []
+    nodes = []
+
+    for model in _drawio_diagrams(root):
+        cells = list(model.iter('mxCell'))
+        for cell in cells:
+            value = _clean(cell.get('value'))
+            if cell.get('vertex') == '1' and value:
+                names[cell.get('id')] = value
+                nodes.append(value)
+        for cell in cells:
+            if cell.get('edge') == '1':
+                source = names.get(cell.get('source'), cell.get('source') or '?')
+                target = names.get(cell.get('target'), cell.get('target') or '?')
+                label = _clean(cell.get('value'))
+                edges.append(f"{source} -> {target}" + (f" ({label})" if label else ''))
+
+    parts = [f"draw.io diagram: {Path(drawio_path).name}"]
+    if nodes:
+        parts.append(f"Nodes ({len(nodes)}):\n" + '\n'.join(f"- {n}" for n in nodes[:max_items]))
+    if edges:
+        parts.append(f"Connectors ({len(edges)}):\n" + '\n'.join(f"- {e}" for e in edges[:max_items]))
+    return '\n\n'.join(parts)
+
+def describe_vector_file(path: str) -> Optional[str]:
+    """Text description of a supported vector diagram, None if it can't be parsed"""
+    try:
+        if Path(path).suffix.lower() == '.drawio':
+            return describe_drawio(path)
+        return describe_svg(path)
+    except (ET.ParseError, OSError) as e:
+        logger.warning(f"Could not parse vector diagram {path}: {e}")
+        return None
@@ -5,4 +5,9 @@ Make Know Pipe Generators
 - tutorial_generator: Create "how to build X" guides
 - pattern_generator: Generate reusable code patterns
 - gotcha_generator: Document common pitfalls and solutions
+- insight_index: BM25 ranked lookup of related insights
+- guide_writer: Batched atomic writes of generated guides
+- output_manifest: Input hashes per guide for incremental regeneration
+- guide_templates: Precompiled markdown templates for guides
+- library_index: On-disk BM25 search index over the knowledge library
 """
\ No newline at end of file
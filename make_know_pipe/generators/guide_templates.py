@@ -0,0 +1,275 @@
+"""
+Guide Templates - Precompiled markdown templates for generated guides
+
+Templates are parsed once at import into literal and field segments.
+Literals are interned so every guide shares the same boilerplate strings,
+and rendering appends segments to a list buffer that the caller joins once.
+"""
+
+import re
+import sys
+from typing import List, Optional, Tuple
+
+FIELD_PATTERN = re.compile(r'\{\{|\}\}|\{(\w+)\}')
+
+class Template:
+    """A template compiled into (literal, field) segments; {{ and }} escape braces"""
+
+    def __init__(self, source: str):
+        self.segments: List[Tuple[str, Optional[str]]] = []
+        literal: List[str] = []
+        position = 0
+        for match in FIELD_PATTERN.finditer(source):
+            literal.append(source[position:match.start()])
+            position = match.end()
+            if match.group(1) is None:
+                literal.append(match.group()[0])
+                continue
+            self.segments.append((sys.intern(''.join(literal)), match.group(1)))
+            literal = []
+        literal.append(source[position:])
+        self.segments.append((sys.intern(''.join(literal)), None))
+
+    def render_into(self, buffer: List[str], **values: str):
+        """Append the rendered template to a buffer"""
+        for literal, field in self.segments:
+            if literal:
+                buffer.append(literal)
+            if field:
+                buffer.append(values[field])
+
+    def render(self, **values: str) -> str:
+        buffer: List[str] = []
+        self.render_into(buffer, **values)
+        return ''.join(buffer)
+
+def render_list(buffer: List[str], items: List[str], prefix: str = "- ", suffix: str = "\n"):
+    """Append one line per item"""
+    for item in items:
+        buffer.append(prefix)
+        buffer.append(item)
+        buffer.append(suffix)
+
+HOW_TO_BUILD_HEAD = Template("""# {title}
+
+*Generated from real implementation analysis*
+
+## Overview
+
+This guide shows you how to build a {feature} system based on analysis of a real, working implementation. It includes architectural decisions, step-by-step implementation, common pitfalls, and best practices.
+
+## Table of Contents
+
+1. [System Architecture](#system-architecture)
+2. [Prerequisites](#prerequisites)
+3. [Step-by-Step Implementation](#step-by-step-implementation)
+4. [Key Implementation Patterns](#key-implementation-patterns)
+5. [Common Pitfalls to Avoid](#common-pitfalls-to-avoid)
+6. [Testing Strategy](#testing-strategy)
+7. [Deployment Considerations](#deployment-considerations)
+8. [Further Reading](#further-reading)
+
+## System Architecture
+
+""")
+
+PREREQUISITES = sys.intern("""## Prerequisites
+
+Before implementing this system, ensure you have:
+
+### Technical Requirements
+""")
+
+KNOWLEDGE_PREREQUISITES = sys.intern("""
+### Knowledge Prerequisites
+- Understanding of web application architecture
+- Basic knowledge of databases and APIs
+- Familiarity with the chosen technology stack
+
+## Step-by-Step Implementation
+
+""")
+
+KEY_PATTERNS_HEAD = sys.intern("""## Key Implementation Patterns
+
+The following patterns were identified in the analyzed system:
+
+""")
+
+PITFALLS_HEAD = sys.intern("""## Common Pitfalls to Avoid
+
+Based on analysis of the real implementation, here are common issues to watch out for:
+
+""")
+
+TESTING_AND_DEPLOYMENT = sys.intern("""## Testing Strategy
+
+Implement comprehensive testing to ensure system reliability:
+
+### Unit Testing
+- Test individual components and functions
+- Mock external dependencies
+- Aim for 80%+ code coverage
+
+### Integration Testing
+- Test component interactions
+- Verify database operations
+- Test API endpoints end-to-end
+
+### Performance Testing
+- Load test critical paths
+- Monitor memory usage
+- Benchmark response times
+
+## Deployment Considerations
+
+### Infrastructure Requirements
+""")
+
+DEFAULT_INFRASTRUCTURE = sys.intern("""- Consider containerization (Docker)
+- Set up proper logging and monitoring
+- Configure environment-specific settings
+- Plan for scalability and load balancing
+""")
+
+SECURITY_AND_FURTHER_READING = sys.intern("""
+### Security Considerations
+- Implement proper authentication and authorization
+- Validate and sanitize all inputs
+- Use HTTPS for all communications
+- Regular security audits and updates
+
+## Further Reading
+
+### Related Patterns
+""")
+
+HOW_TO_BUILD_FOOTER = Template("""
+### Architecture Documentation
+- [System Architecture Overview](../architecture/system_overview.md)
+- [Common Gotchas](../gotchas/common_pitfalls.md)
+
+---
+
+*This guide was generated from analysis of a real {feature} implementation. The patterns and approaches described here have been proven to work in production environments.*
+
+**Generated on:** {date}
+""")
+
+PATTERN_GUIDE = Template("""# {name}
+
+*Implementation pattern from {feature} system*
+
+## Overview
+
+{description}
+
+## When to Use This Pattern
+
+This pattern is useful when you need to:
+- Implement similar functionality to {feature}
+- Follow established architectural patterns
+- Ensure consistent implementation approaches
+
+## Implementation Guide
+
+{implementation_guide}
+
+## Code Example
+
+```python
+{code_example}
+```
+
+## Key Benefits
+
+- **Reusability**: This pattern can be adapted for similar use cases  
+- **Maintainability**: Follows established conventions
+- **Reliability**: Based on proven, working implementation
+
+## Variations
+
+Consider these variations based on your specific needs:
+- Adapt the pattern for different programming languages
+- Modify for different scale requirements
+- Integrate with different frameworks or libraries
+
+## Testing This Pattern
+
+When implementing this pattern, ensure you test:
+- Core functionality works as expected
+- Error cases are handled properly
+- Performance meets requirements
+- Integration with other components is seamless
+
+## Related Patterns
+
+This pattern works well with other patterns from the {feature} system.
+
+---
+
+*Extracted from: `{source}`*
+*Generated on: {date}*
+""")
+
+ARCHITECTURE_HEAD = Template("""# {title}
+
+*Architectural insights extracted from documentation analysis*
+
+## Overview
+
+This guide documents the architectural decisions and design patterns identified in the system documentation.
+
+""")
+
+ARCHITECTURE_FOOTER = Template("""
+---
+
+*Generated from {count} documentation sources*
+*Generated on: {date}*
+""")
+
+GOTCHA_HEAD = Template("""# {title}
+
+*Pitfalls and gotchas identified from real system analysis*
+
+## Overview
+
+This guide documents common pitfalls, gotchas, and issues identified through analysis of real implementations. Use this to avoid common mistakes when building similar systems.
+
+""")
+
+GOTCHA_FOOTER = Template("""## General Best Practices
+
+Based on the analysis, follow these best practices to avoid common issues:
+
+### Error Handling
+- Always implement comprehensive error handling
+- Log errors with sufficient context for debugging
+- Provide meaningful error messages to users
+
+### Performance
+- Monitor system performance in production
+- Implement proper caching strategies
+- Optimize database queries and API calls
+
+### Security
+- Validate all user inputs
+- Implement proper authentication and authorization
+- Keep dependencies updated and secure
+
+### Testing
+- Write comprehensive tests for all functionality
+- Test error scenarios and edge cases
+- Implement automated testing in CI/CD pipeline
+
+### Monitoring
+- Set up proper logging and monitoring
+- Implement health checks and alerts
+- Monitor key business metrics
+
+---
+
+*Generated from analysis of logs, documentation, and code patterns*
+*Generated on: {date}*
+""")
@@ -0,0 +1,146 @@
+"""
+Guide Writer - Batched, atomic output stage for generated guides
+
+Collects rendered guides into batches and writes each batch on a worker
+thread. Every file is written to a temp file in its target directory and
+moved into place with os.replace after an fsync of that file, plus one
+directory sync per batch, so a crash never leaves a half-written guide in
+the knowledge library.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _file_mode(path: Path, new_file_mode: int) -> int:
+    """Permission bits for a guide about to replace path: the old file's, else new_file_mode"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return new_file_mode
+
+def _sync_directory(directory: Path):
+    """Persist renames in a directory where the platform allows it"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class GuideWriter:
+    """Write guides in batches on a thread pool through temp file + os.replace"""
+
+    def __init__(self, batch_size: int = 64, max_workers: int = 4, durable: bool = True):
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.durable = durable  # Fsync each file before it replaces an existing one
+        # The umask can only be read by setting it, which is process-wide: read it once here, not in workers
+        umask = os.umask(0)
+        os.umask(umask)
+        self.new_file_mode = 0o666 & ~umask
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.pending: List[Tuple[Path, str]] = []
+        self.in_flight: List[asyncio.Future] = []
+        self.written = 0
+        self.failed = 0
+        self.failed_paths: Set[Path] = set()  # Guides that never reached disk this run
+        self.counter_lock = threading.Lock()
+
+    async def write(self, path: Path, content: str):
+        """Queue a file; a full batch is handed to a worker thread"""
+        self.pending.append((path, content))
+        if len(self.pending) >= self.batch_size:
+            self._dispatch()
+        # Drop finished batches so the list does not grow with the library
+        self.in_flight = [future for future in self.in_flight if not future.done()]
+        if len(self.in_flight) >= self.max_workers * 2:
+            await asyncio.wait(self.in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+    async def flush(self):
+        """Write any queued files and wait for every batch to land"""
+        self._dispatch()
+        # Other writers may queue batches while this one waits
+        while self.in_flight:
+            batches, self.in_flight = self.in_flight, []
+            await asyncio.gather(*batches)
+
+    def reset(self):
+        """Clear the counters before a new run"""
+        with self.counter_lock:
+            self.written = 0
+            self.failed = 0
+            self.failed_paths = set()
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def _dispatch(self):
+        if not self.pending:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        batch, self.pending = self.pending, []
+        loop = asyncio.get_running_loop()
+        self.in_flight.append(loop.run_in_executor(self.executor, self._write_batch, batch))
+
+    def _count(self, written: int = 0, failed: Optional[Path] = None):
+        with self.counter_lock:
+            self.written += written
+            if failed is not None:
+                self.failed += 1
+                self.failed_paths.add(failed)
+
+    def _write_batch(self, batch: List[Tuple[Path, str]]):
+        """Write and fsync temp files, move them all into place, then sync their directories"""
+        staged: List[Tuple[str, Path]] = []
+        for path, content in batch:
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                        if self.durable:
+                            f.flush()
+                            os.fsync(f.fileno())
+                    # mkstemp creates 0600; guides keep normal file permissions
+                    os.chmod(tmp_path, _file_mode(path, self.new_file_mode))
+                except Exception:
+                    os.unlink(tmp_path)
+                    raise
+                staged.append((tmp_path, path))
+            except Exception as e:
+                logger.error(f"Error writing guide {path}: {e}")
+                self._count(failed=path)
+
+        directories: Set[Path] = set()
+        for tmp_path, path in staged:
+            try:
+                os.replace(tmp_path, path)
+                directories.add(path.parent)
+                self._count(written=1)
+                logger.info(f"Generated tutorial: {path}")
+            except OSError as e:
+                logger.error(f"Error writing guide {path}: {e}")
+                self._count(failed=path)
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        if self.durable:
+            for directory in directories:
+                _sync_directory(directory)
@@ -0,0 +1,129 @@
+"""
+Insight Index - BM25 ranked lookup over extracted insights
+
+Builds an inverted index once over documentation and multimodal insights so
+related-content lookup is a ranked query instead of a substring scan of
+every insight for every feature. A query term also matches indexed terms
+that contain it ("auth" finds "authentication", "oauth"), keeping the
+recall of the substring scan.
+"""
+
+import heapq
+import math
+import re
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from ..extractors.doc_processor import DocumentationInsight
+from ..extractors.multimodal_processor import MultimodalInsight
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class BM25Index:
+    """Inverted index with Okapi BM25 ranking"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_lengths: List[int] = []
+        self.items: List[Any] = []
+        self.total_length = 0
+        self.expansions: Dict[str, List[str]] = {}  # Query term -> indexed terms containing it
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Any, text: str) -> int:
+        """Index an item under the terms of its text, returning its doc id"""
+        doc_id = len(self.items)
+        terms = tokenize(text)
+
+        term_counts: Dict[str, int] = {}
+        for term in terms:
+            term_counts[term] = term_counts.get(term, 0) + 1
+
+        for term, count in term_counts.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+
+        self.expansions = {}
+        self.items.append(item)
+        self.doc_lengths.append(len(terms))
+        self.total_length += len(terms)
+        return doc_id
+
+    def _expand(self, term: str) -> List[str]:
+        """Indexed terms containing a query term, scanned once per term"""
+        if term not in self.expansions:
+            self.expansions[term] = [indexed for indexed in self.postings if term in indexed]
+        return self.expansions[term]
+
+    def search(self, query: str, top_k: Optional[int] = 10) -> List[Tuple[Any, float]]:
+        """Return the top-k (item, score) pairs for a query, best first; top_k None returns every match"""
+        if not self.items:
+            return []
+
+        doc_count = len(self.items)
+        avg_length = self.total_length / doc_count or 1.0
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            # Each document counts its best-scoring variant of a query term once
+            term_scores: Dict[int, float] = {}
+            for indexed in self._expand(term):
+                postings = self.postings[indexed]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, freq in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                    score = idf * freq * (self.k1 + 1) / (freq + norm)
+                    if score > term_scores.get(doc_id, 0.0):
+                        term_scores[doc_id] = score
+            for doc_id, score in term_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        rank = lambda entry: (entry[1], -entry[0])
+        if top_k is None:
+            best = sorted(scores.items(), key=rank, reverse=True)
+        else:
+            best = heapq.nlargest(top_k, scores.items(), key=rank)
+        return [(self.items[doc_id], score) for doc_id, score in best]
+
+class InsightIndex:
+    """BM25 indexes over documentation and multimodal insights"""
+
+    def __init__(self):
+        self.documentation = BM25Index()
+        self.multimodal = BM25Index()
+
+    def add_documentation(self, insights: Iterable[DocumentationInsight]):
+        """Index documentation insights by title and content"""
+        for insight in insights:
+            self.documentation.add(insight, insight.title + ' ' + insight.content)
+
+    def add_multimodal(self, insights: Iterable[MultimodalInsight]):
+        """Index multimodal insights by their insight and implementation notes"""
+        for insight in insights:
+            self.multimodal.add(insight, ' '.join(insight.insights + insight.implementation_notes))
+
+    @classmethod
+    def build(cls,
+              doc_insights: Dict[str, List[DocumentationInsight]],
+              multimodal_insights: Dict[str, List[MultimodalInsight]]) -> 'InsightIndex':
+        """Build an index over all extracted insights"""
+        index = cls()
+        for insights in doc_insights.values():
+            index.add_documentation(insights)
+        for insights in multimodal_insights.values():
+            index.add_multimodal(insights)
+        return index
+
+    def related_documentation(self, feature_name: str, top_k: Optional[int] = None) -> List[DocumentationInsight]:
+        """Documentation insights ranked by relevance to a feature"""
+        return [item for item, _ in self.documentation.search(feature_name.replace('_', ' '), top_k)]
+
+    def related_multimodal(self, feature_name: str, top_k: Optional[int] = None) -> List[MultimodalInsight]:
+        """Multimodal insights ranked by relevance to a feature"""
+        return [item for item, _ in self.multimodal.search(feature_name.replace('_', ' '), top_k)]
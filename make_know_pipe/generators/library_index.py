@@ -0,0 +1,308 @@
+"""
+Library Index - On-disk search index shipped with the knowledge library
+
+Keeps a BM25 inverted index of every guide in knowledge_library/.search/,
+split into segments. Each segment has a lexicon of term -> (postings offset,
+document frequency), one JSON line of postings per term and one JSON line
+of metadata (title, section offsets) per guide. A catalog maps each guide to
+its live segment entry.
+
+Updates tokenize only guides whose size or mtime changed into a new segment
+and retire their old entries; segments are compacted once there are too
+many. Queries read the catalog, the lexicons and the postings lines of their
+terms, never the guide files.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".search"
+INDEX_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+STRUCTURE_PATTERN = re.compile(r'^[ \t]*(?:```|#{1,6}[ \t]).*$', re.MULTILINE)
+
+def _write_atomic(path: Path, text: str):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+def analyze_guide(content: str) -> Tuple[str, List[List], Dict[str, List[int]], int]:
+    """
+    Tokenize a guide by section
+
+    Returns:
+        Title, sections as [char offset, heading], term -> [frequency, best section], term count
+    """
+    title = ''
+    sections: List[List] = [[0, '']]
+    bounds = [0]
+    in_code = False
+
+    # Only fence and heading lines matter for structure
+    for match in STRUCTURE_PATTERN.finditer(content):
+        line = match.group()
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        heading = None if in_code else HEADING_PATTERN.match(line.strip())
+        if heading:
+            if not title and len(heading.group(1)) == 1:
+                title = heading.group(2)
+            sections.append([match.start(), heading.group(2)])
+            bounds.append(match.start())
+    bounds.append(len(content))
+
+    # term -> [frequency, best section, count in best section]
+    totals: Dict[str, List[int]] = {}
+    length = 0
+    for section in range(len(sections)):
+        counts = Counter(TOKEN_PATTERN.findall(content[bounds[section]:bounds[section + 1]].lower()))
+        for term, count in counts.items():
+            entry = totals.get(term)
+            if entry is None:
+                totals[term] = [count, section, count]
+            else:
+                entry[0] += count
+                if count > entry[2]:
+                    entry[1] = section
+                    entry[2] = count
+            length += count
+
+    return title, sections, {term: entry[:2] for term, entry in totals.items()}, length
+
+class SearchHit:
+    """A ranked guide with the section that best matches the query"""
+    def __init__(self, path: str, title: str, score: float, section: str, offset: int):
+        self.path = path
+        self.title = title
+        self.score = score
+        self.section = section
+        self.offset = offset
+
+    def to_dict(self) -> Dict:
+        return {'path': self.path, 'title': self.title, 'score': round(self.score, 4),
+                'section': self.section, 'offset': self.offset}
+
+class LibraryIndex:
+    """Incrementally updated, segmented BM25 index over a knowledge library's guides"""
+
+    def __init__(self, library_dir: str, max_segments: int = 8, k1: float = 1.5, b: float = 0.75):
+        self.library_dir = Path(library_dir)
+        self.index_dir = self.library_dir / INDEX_DIRNAME
+        self.catalog_path = self.index_dir / 'catalog.json'
+        self.max_segments = max_segments
+        self.k1 = k1
+        self.b = b
+        self.catalog: Optional[Dict] = None
+        self.lexicons: Dict[str, Dict] = {}
+
+    def _load_catalog(self) -> Dict:
+        if self.catalog is None:
+            try:
+                with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                    catalog = json.load(f)
+                if catalog.get('version') != INDEX_VERSION:
+                    raise ValueError(f"index version {catalog.get('version')}")
+            except FileNotFoundError:
+                catalog = None
+            except Exception as e:
+                logger.warning(f"Rebuilding unreadable search index {self.index_dir}: {e}")
+                catalog = None
+            self.catalog = catalog or {'version': INDEX_VERSION, 'next_segment': 1, 'segments': [], 'docs': {}}
+        return self.catalog
+
+    def _segment_path(self, segment: str, kind: str) -> Path:
+        return self.index_dir / f"{segment}.{kind}"
+
+    # Building
+
+    def update(self, guide_paths: Optional[Iterable[str]] = None) -> int:
+        """
+        Bring the index in line with the library
+
+        Args:
+            guide_paths: Guide paths relative to the library; every .md file when omitted
+
+        Returns:
+            Number of guides that were (re)tokenized
+        """
+        if guide_paths is None:
+            guide_paths = [path.relative_to(self.library_dir).as_posix()
+                           for path in self.library_dir.rglob('*.md')
+                           if INDEX_DIRNAME not in path.parts]
+
+        catalog = self._load_catalog()
+        docs = catalog['docs']
+        live: Dict[str, os.stat_result] = {}
+        for rel_path in set(guide_paths):
+            try:
+                live[rel_path] = (self.library_dir / rel_path).stat()
+            except FileNotFoundError:
+                continue
+
+        changed = sorted(path for path, stat in live.items()
+                         if path not in docs
+                         or docs[path]['mtime'] != stat.st_mtime_ns or docs[path]['size'] != stat.st_size)
+        removed = [path for path in docs if path not in live]
+        if not changed and not removed and catalog['segments']:
+            return 0
+
+        for path in removed:
+            del docs[path]
+
+        # Too many segments: fold every live guide into a single new one
+        if len(catalog['segments']) + 1 > self.max_segments:
+            changed = sorted(live)
+            docs.clear()
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        if changed:
+            self._write_segment(catalog, changed, live)
+
+        # Retire segments that no longer hold a live guide, deleting them once the catalog moved on
+        used = {entry['segment'] for entry in docs.values()}
+        retired = [segment for segment in catalog['segments'] if segment not in used]
+        catalog['segments'] = [segment for segment in catalog['segments'] if segment in used]
+        _write_atomic(self.catalog_path, json.dumps(catalog, separators=(',', ':')))
+        for segment in retired:
+            for kind in ('lexicon.json', 'postings', 'docs.jsonl'):
+                try:
+                    self._segment_path(segment, kind).unlink()
+                except FileNotFoundError:
+                    pass
+        self.lexicons = {}
+        logger.info(f"Search index: {len(docs)} guides, {len(changed)} re-indexed, "
+                    f"{len(catalog['segments'])} segments")
+        return len(changed)
+
+    def _write_segment(self, catalog: Dict, paths: List[str], stats: Dict[str, os.stat_result]):
+        """Tokenize guides into a new segment and point the catalog at it"""
+        segment = f"seg-{catalog['next_segment']:06d}"
+        catalog['next_segment'] += 1
+
+        postings: Dict[str, List[int]] = {}
+        docs_lines = []
+        doc_offsets = []
+        offset = 0
+        for path in paths:
+            try:
+                content = (self.library_dir / path).read_text(encoding='utf-8', errors='ignore')
+            except OSError as e:
+                logger.warning(f"Could not index guide {path}: {e}")
+                catalog['docs'].pop(path, None)
+                continue
+
+            doc_id = len(docs_lines)
+            title, sections, terms, length = analyze_guide(content)
+            for term, (freq, section) in terms.items():
+                postings.setdefault(term, []).extend((doc_id, freq, section))
+
+            line = json.dumps({'path': path, 'title': title or Path(path).stem,
+                               'sections': sections}, ensure_ascii=False) + '\n'
+            docs_lines.append(line)
+            doc_offsets.append(offset)
+            offset += len(line.encode('utf-8'))
+
+            stat = stats[path]
+            catalog['docs'][path] = {'segment': segment, 'id': doc_id, 'length': length,
+                                     'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+
+        # Postings are flat [doc, frequency, section, ...] triples, one term per line
+        postings_lines = []
+        terms_table: Dict[str, List[int]] = {}
+        offset = 0
+        for term in sorted(postings):
+            line = json.dumps(postings[term], separators=(',', ':')) + '\n'
+            postings_lines.append(line)
+            terms_table[term] = [offset, len(postings[term]) // 3]
+            offset += len(line)
+
+        _write_atomic(self._segment_path(segment, 'docs.jsonl'), ''.join(docs_lines))
+        _write_atomic(self._segment_path(segment, 'postings'), ''.join(postings_lines))
+        _write_atomic(self._segment_path(segment, 'lexicon.json'), json.dumps(
+            {'doc_offsets': doc_offsets, 'terms': terms_table}, separators=(',', ':')))
+        catalog['segments'].append(segment)
+
+    # Querying
+
+    def _lexicon(self, segment: str) -> Dict:
+        if segment not in self.lexicons:
+            with open(self._segment_path(segment, 'lexicon.json'), 'r', encoding='utf-8') as f:
+                self.lexicons[segment] = json.load(f)
+        return self.lexicons[segment]
+
+    def search(self, query: str, top_k: int = 10) -> List[SearchHit]:
+        """Top-k guides for a query, best first, read from the index alone"""
+        catalog = self._load_catalog()
+        docs = catalog['docs']
+        if not docs:
+            logger.warning(f"No search index in {self.index_dir}; run an update first")
+            return []
+
+        # Live (segment, id) -> length; entries from retired segments are skipped
+        lengths = {(entry['segment'], entry['id']): entry['length'] for entry in docs.values()}
+        doc_count = len(docs)
+        avg_length = sum(lengths.values()) / doc_count or 1.0
+        query_terms = set(TOKEN_PATTERN.findall(query.lower()))
+
+        # Read each term's postings once per segment, counting live documents for IDF
+        matches: Dict[str, List[Tuple[Tuple[str, int], int, int]]] = {term: [] for term in query_terms}
+        for segment in catalog['segments']:
+            lexicon = self._lexicon(segment)
+            with open(self._segment_path(segment, 'postings'), 'rb') as postings_file:
+                for term in query_terms:
+                    entry = lexicon['terms'].get(term)
+                    if not entry:
+                        continue
+                    postings_file.seek(entry[0])
+                    flat = json.loads(postings_file.readline())
+                    for i in range(0, len(flat), 3):
+                        key = (segment, flat[i])
+                        if key in lengths:
+                            matches[term].append((key, flat[i + 1], flat[i + 2]))
+
+        scores: Dict[Tuple[str, int], float] = {}
+        sections: Dict[Tuple[str, int], Dict[int, float]] = {}
+        for term, postings in matches.items():
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for key, freq, section in postings:
+                norm = self.k1 * (1 - self.b + self.b * lengths[key] / avg_length)
+                score = idf * freq * (self.k1 + 1) / (freq + norm)
+                scores[key] = scores.get(key, 0.0) + score
+                doc_sections = sections.setdefault(key, {})
+                doc_sections[section] = doc_sections.get(section, 0.0) + score
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        hits = []
+        for (segment, doc_id), score in best:
+            with open(self._segment_path(segment, 'docs.jsonl'), 'rb') as docs_file:
+                docs_file.seek(self._lexicon(segment)['doc_offsets'][doc_id])
+                doc = json.loads(docs_file.readline())
+            doc_sections = sections[(segment, doc_id)]
+            offset, heading = doc['sections'][max(doc_sections, key=doc_sections.get)]
+            hits.append(SearchHit(doc['path'], doc['title'], score, heading, offset))
+        return hits
+
+def search_library(library_dir: str, query: str, top_k: int = 10) -> List[SearchHit]:
+    """Ranked search over a knowledge library's index"""
+    return LibraryIndex(library_dir).search(query, top_k)
@@ -0,0 +1,103 @@
+"""
+Output Manifest - Track which inputs produced each generated guide
+
+Maps every guide to a hash of the insights it was rendered from and the
+template version, so a run can skip guides whose inputs are unchanged and
+remove guides that are no longer produced.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+import logging
+
+from ..extractors.result_store import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".manifest.json"
+
+def _jsonable(obj: Any) -> Any:
+    """Serialize insight objects by their attributes"""
+    return getattr(obj, '__dict__', str(obj))
+
+def input_hash(*inputs: Any) -> str:
+    """Stable hash of the inputs a guide is rendered from"""
+    payload = json.dumps(inputs, default=_jsonable, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class OutputManifest:
+    """Guide key -> input hash and output path, persisted next to the library"""
+
+    def __init__(self, output_dir: Path, template_version: str):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILENAME
+        self.template_version = template_version
+        self.previous: Dict[str, Dict[str, str]] = {}
+        self.previous_version = None
+        self.current: Dict[str, Dict[str, str]] = {}
+        self.skipped = 0
+
+    def load(self) -> 'OutputManifest':
+        """Read the manifest of the previous run"""
+        self.current = {}
+        self.skipped = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.previous = {}
+            return self
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable output manifest {self.path}: {e}")
+            self.previous = {}
+            return self
+
+        self.previous = data.get('guides', {})
+        self.previous_version = data.get('template_version')
+        return self
+
+    def is_current(self, key: str, guide_hash: str) -> bool:
+        """True when the guide's inputs and template are unchanged and its file is still on disk"""
+        entry = self.previous.get(key)
+        if self.previous_version != self.template_version:
+            return False
+        if not entry or entry['hash'] != guide_hash or not (self.output_dir / entry['path']).exists():
+            return False
+        self.current[key] = entry
+        self.skipped += 1
+        return True
+
+    def record(self, key: str, guide_hash: str, relative_path: str):
+        """Record a guide written this run, by its path relative to the library"""
+        self.current[key] = {'hash': guide_hash, 'path': relative_path}
+
+    def forget(self, relative_paths: List[str]):
+        """Drop guides of this run that never reached disk, so the next run rewrites them"""
+        paths = set(relative_paths)
+        self.current = {key: entry for key, entry in self.current.items() if entry['path'] not in paths}
+
+    def remove_stale(self) -> List[str]:
+        """Delete guides from the previous run that this run no longer produces"""
+        live_paths = {entry['path'] for entry in self.current.values()}
+        removed = []
+        for entry in self.previous.values():
+            if entry['path'] in live_paths:
+                continue
+            stale_path = self.output_dir / entry['path']
+            try:
+                stale_path.unlink()
+                removed.append(entry['path'])
+                logger.info(f"Removed stale guide: {stale_path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove stale guide {stale_path}: {e}")
+        return removed
+
+    def save(self):
+        write_json_atomic(self.path, {
+            'template_version': self.template_version,
+            'guides': self.current
+        })
@@ -5,18 +5,38 @@ Generates educational .md files that teach others how to implement similar syste
 based on extracted knowledge from real codebases.
 """
 
+import asyncio
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from itertools import islice
 import logging
 
 from ..extractors.code_analyzer import CodePattern
 from ..extractors.doc_processor import DocumentationInsight
 from ..extractors.multimodal_processor import MultimodalInsight
+from .insight_index import InsightIndex
+from .guide_writer import GuideWriter
+from .output_manifest import OutputManifest, input_hash
+from . import guide_templates as templates
+from .library_index import LibraryIndex
 
 logger = logging.getLogger(__name__)
 
+# Bump when guide templates change so every guide is regenerated
+TEMPLATE_VERSION = "3"
+
+def _pattern_filename(feature_name: str, pattern_name: str) -> str:
+    """Pattern guide filename; patterns are per feature, so the same name under two features stays distinct"""
+    safe_feature = feature_name.lower().replace(' ', '_').replace('-', '_')
+    safe_name = pattern_name.lower().replace(' ', '_').replace('-', '_')
+    return f"{safe_feature}__{safe_name}.md"
+
+# Documentation insight types that get an architecture guide (app_* come from catalog map-reduce)
+ARCHITECTURE_DOC_TYPES = ['architecture', 'readme', 'app_categories', 'app_catalog']
+
 class TutorialGuide:
     """Represents a generated tutorial guide"""
     def __init__(self, title: str, filename: str, content: str, tutorial_type: str):
@@ -25,6 +45,25 @@ class TutorialGuide:
         self.content = content
         self.tutorial_type = tutorial_type
 
+class GuideJob:
+    """One guide to render: manifest key, input hash, output directory and renderer"""
+    def __init__(self, key: str, guide_hash: str, output_dir: Path, method_name: str, args: tuple):
+        self.key = key
+        self.guide_hash = guide_hash
+        self.output_dir = output_dir
+        self.method_name = method_name
+        self.args = args
+
+# Generator copy held by each rendering worker process
+_worker_generator: Optional['TutorialGenerator'] = None
+
+def _init_render_worker(generator: 'TutorialGenerator'):
+    global _worker_generator
+    _worker_generator = generator
+
+def _render_in_worker(calls: List[tuple]) -> List[Optional[TutorialGuide]]:
+    return [_worker_generator.render_sync(method_name, args) for method_name, args in calls]
+
 class TutorialGenerator:
     """Generate comprehensive tutorial guides from extracted knowledge"""
     
@@ -40,6 +79,33 @@ class TutorialGenerator:
         
         for dir_path in [self.how_to_build_dir, self.patterns_dir, self.architecture_dir, self.gotchas_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Date stamped on guides, fixed once per run
+        self.generated_on = datetime.now().strftime('%Y-%m-%d')
+        
+        # Ranked lookup of related insights, rebuilt for each generation run
+        self.insight_index = InsightIndex()
+        self.related_top_k: Optional[int] = None  # Cap on related insights per guide; None keeps every match
+        
+        # Batched atomic writes off the event loop
+        self.writer = GuideWriter()
+        
+        # Input hashes of the last run; unchanged guides are skipped
+        self.manifest = OutputManifest(self.output_dir, TEMPLATE_VERSION)
+        self.incremental = True
+        
+        # Search index shipped with the library, refreshed after every run
+        self.search_index = LibraryIndex(self.output_dir)
+        
+        # Large libraries render on a process pool
+        self.render_workers = os.cpu_count() or 1
+        self.process_render_threshold = 2000
+        self.render_batch_size = 100
+        
+        # Inputs seen so far in a streaming run
+        self.stream_patterns: Dict[str, List[CodePattern]] = {}
+        self.stream_doc_insights: Dict[str, List[DocumentationInsight]] = {}
+        self.stream_guides: List[TutorialGuide] = []
     
     async def generate_all_tutorials(self, 
                                    code_patterns: Dict[str, List[CodePattern]],
@@ -54,57 +120,219 @@ class TutorialGenerator:
             multimodal_insights: Insights from images, PDFs, logs
             
         Returns:
-            List of generated tutorial guides
+            Guides regenerated this run; unchanged ones are counted in unchanged_count
         """
         logger.info("Generating comprehensive tutorial guides")
         
-        generated_guides = []
+        self._begin_run()
         
-        # Generate "How to Build" guides for each major feature/system
-        for feature_name, patterns in code_patterns.items():
-            guide = await self._generate_how_to_build_guide(feature_name, patterns, doc_insights, multimodal_insights)
-            if guide:
-                generated_guides.append(guide)
-                await self._write_guide_to_file(guide, self.how_to_build_dir)
+        # Index all insights once so each guide does a ranked lookup instead of a full scan
+        self.insight_index = InsightIndex.build(doc_insights, multimodal_insights)
         
-        # Generate pattern documentation
-        for feature_name, patterns in code_patterns.items():
-            for pattern in patterns:
-                guide = await self._generate_pattern_guide(pattern, feature_name)
-                if guide:
-                    generated_guides.append(guide)
-                    await self._write_guide_to_file(guide, self.patterns_dir)
-        
-        # Generate architecture guides from documentation
-        for doc_type, insights in doc_insights.items():
-            if doc_type in ['architecture', 'readme']:
-                guide = await self._generate_architecture_guide(doc_type, insights)
-                if guide:
-                    generated_guides.append(guide)
-                    await self._write_guide_to_file(guide, self.architecture_dir)
-        
-        # Generate gotcha guides from all sources
-        gotcha_guide = await self._generate_gotcha_guide(code_patterns, doc_insights, multimodal_insights)
-        if gotcha_guide:
-            generated_guides.append(gotcha_guide)
-            await self._write_guide_to_file(gotcha_guide, self.gotchas_dir)
-        
-        logger.info(f"Generated {len(generated_guides)} tutorial guides")
+        # Collect every guide to produce; each is independent once extraction is done
+        jobs = (self._how_to_build_jobs(code_patterns)
+                + [job for feature_name, patterns in code_patterns.items()
+                   for job in self._pattern_jobs(feature_name, patterns)]
+                + self._architecture_jobs(doc_insights)
+                + [self._gotcha_job(code_patterns, doc_insights, multimodal_insights)])
+        
+        generated_guides = await self._render_jobs(self._changed_jobs(jobs))
+        
+        await self._finish_run(len(generated_guides))
         return generated_guides
     
+    def begin_stream(self):
+        """
+        Start a streaming run: guides are rendered as their inputs arrive
+        
+        Call add_patterns as each file's patterns are parsed, close_documentation
+        once documentation is processed, and finish_stream when extraction is done.
+        """
+        logger.info("Streaming tutorial guides as knowledge is extracted")
+        self._begin_run()
+        self.stream_patterns = {}
+        self.stream_doc_insights = {}
+        self.stream_guides = []
+    
+    async def add_patterns(self, feature_name: str, patterns: List[CodePattern]):
+        """Write pattern guides for newly parsed patterns right away"""
+        self.stream_patterns.setdefault(feature_name, []).extend(patterns)
+        self.stream_guides.extend(await self._render_jobs(self._changed_jobs(
+            self._pattern_jobs(feature_name, patterns))))
+        await self.writer.flush()
+    
+    async def close_documentation(self, doc_insights: Dict[str, List[DocumentationInsight]]):
+        """Documentation is complete: write the architecture guides"""
+        self.stream_doc_insights = doc_insights
+        self.stream_guides.extend(await self._render_jobs(self._changed_jobs(
+            self._architecture_jobs(doc_insights))))
+        await self.writer.flush()
+    
+    async def finish_stream(self, multimodal_insights: Dict[str, List[MultimodalInsight]]) -> List[TutorialGuide]:
+        """All inputs are closed: write the cross-cutting guides and finalize the run"""
+        code_patterns = self.stream_patterns
+        doc_insights = self.stream_doc_insights
+        self.insight_index = InsightIndex.build(doc_insights, multimodal_insights)
+        
+        jobs = self._how_to_build_jobs(code_patterns) + [
+            self._gotcha_job(code_patterns, doc_insights, multimodal_insights)]
+        self.stream_guides.extend(await self._render_jobs(self._changed_jobs(jobs)))
+        
+        await self._finish_run(len(self.stream_guides))
+        return self.stream_guides
+    
+    def _begin_run(self):
+        self.generated_on = datetime.now().strftime('%Y-%m-%d')
+        self.manifest.load()
+        self.writer.reset()
+        if not self.incremental:
+            self.manifest.previous_version = None  # Regenerate everything, still prune stale guides
+    
+    async def _finish_run(self, generated_count: int):
+        # Wait for every queued guide to be on disk before reporting
+        await self.writer.flush()
+        self.writer.close()
+        if self.writer.failed:
+            logger.warning(f"{self.writer.failed} guides could not be written")
+        
+        # Drop guides the inputs no longer produce, then record this run
+        removed = self.manifest.remove_stale()
+        # Failed writes leave the previous file in place but are not recorded as current
+        self.manifest.forget([f"{path.parent.name}/{path.name}" for path in self.writer.failed_paths])
+        try:
+            self.manifest.save()
+        except OSError as e:
+            logger.warning(f"Could not save output manifest: {e}")
+        
+        # Only guides rewritten this run are re-tokenized
+        try:
+            self.search_index.update(entry['path'] for entry in self.manifest.current.values())
+        except OSError as e:
+            logger.warning(f"Could not update search index: {e}")
+        
+        logger.info(f"Generated {generated_count} tutorial guides "
+                    f"({self.manifest.skipped} unchanged, {len(removed)} stale removed)")
+    
+    @property
+    def unchanged_count(self) -> int:
+        """Guides of the last run that were current and not regenerated"""
+        return self.manifest.skipped
+    
+    def _how_to_build_jobs(self, code_patterns: Dict[str, List[CodePattern]]) -> List[GuideJob]:
+        """'How to Build' guides for each major feature/system; needs the insight index"""
+        jobs = []
+        for feature_name, patterns in code_patterns.items():
+            guide_hash = input_hash(patterns, self._find_related_documentation(feature_name),
+                                    self._find_related_multimodal(feature_name))
+            jobs.append(GuideJob(f"how_to_build:{feature_name}", guide_hash, self.how_to_build_dir,
+                                 '_generate_how_to_build_guide', (feature_name, patterns)))
+        return jobs
+    
+    def _pattern_jobs(self, feature_name: str, patterns: List[CodePattern]) -> List[GuideJob]:
+        """Pattern documentation, one guide per pattern"""
+        return [GuideJob(f"pattern:{feature_name}:{pattern.name}", input_hash(pattern, feature_name),
+                         self.patterns_dir, '_generate_pattern_guide', (pattern, feature_name))
+                for pattern in patterns]
+    
+    def _architecture_jobs(self, doc_insights: Dict[str, List[DocumentationInsight]]) -> List[GuideJob]:
+        """Architecture guides from documentation"""
+        return [GuideJob(f"architecture:{doc_type}", input_hash(insights), self.architecture_dir,
+                         '_generate_architecture_guide', (doc_type, insights))
+                for doc_type, insights in doc_insights.items() if doc_type in ARCHITECTURE_DOC_TYPES]
+    
+    def _gotcha_job(self, code_patterns: Dict[str, List[CodePattern]],
+                    doc_insights: Dict[str, List[DocumentationInsight]],
+                    multimodal_insights: Dict[str, List[MultimodalInsight]]) -> GuideJob:
+        """Gotcha guide from all sources"""
+        return GuideJob("gotchas", input_hash(code_patterns, doc_insights, multimodal_insights),
+                        self.gotchas_dir, '_generate_gotcha_guide',
+                        (code_patterns, doc_insights, multimodal_insights))
+    
+    def _changed_jobs(self, jobs: List[GuideJob]) -> List[GuideJob]:
+        """Jobs whose inputs changed since the last run"""
+        return [job for job in jobs if not self.manifest.is_current(job.key, job.guide_hash)]
+    
+    async def _render_jobs(self, jobs: List[GuideJob]) -> List[TutorialGuide]:
+        """Render guides, streaming each to the writer as it finishes; results keep job order"""
+        results: List[Optional[TutorialGuide]] = [None] * len(jobs)
+        owners: Dict[str, int] = {}  # Output path -> index of the job whose guide it holds
+        
+        async def finish(index: int, guide: Optional[TutorialGuide]):
+            if not guide:
+                return
+            job = jobs[index]
+            path = f"{job.output_dir.name}/{guide.filename}"
+            owner = owners.get(path)
+            # Workers finish in any order; the earliest job owns a shared path so the file is deterministic
+            if owner is not None and owner < index:
+                logger.warning(f"{job.key} renders to {path}, already written for {jobs[owner].key}; skipped")
+                return
+            if owner is not None:
+                logger.warning(f"{jobs[owner].key} renders to {path}, also written for {job.key}; replaced")
+                results[owner] = None
+                self.manifest.forget([path])
+                # Land the replaced file before queueing its replacement
+                await self.writer.flush()
+            owners[path] = index
+            results[index] = guide
+            await self._write_guide_to_file(guide, job.output_dir)
+            self.manifest.record(job.key, job.guide_hash, path)
+        
+        if len(jobs) < self.process_render_threshold or self.render_workers < 2:
+            # Rendering is pure string building: inline beats pool overhead for small libraries
+            for index, job in enumerate(jobs):
+                await finish(index, await getattr(self, job.method_name)(*job.args))
+        else:
+            loop = asyncio.get_running_loop()
+            workers = min(self.render_workers, len(jobs))
+            logger.info(f"Rendering {len(jobs)} guides on {workers} processes")
+            # Batches of guides per task amortize the cost of shipping results back
+            batches = [range(start, min(start + self.render_batch_size, len(jobs)))
+                       for start in range(0, len(jobs), self.render_batch_size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                     initargs=(self,)) as pool:
+                futures = {
+                    loop.run_in_executor(pool, _render_in_worker,
+                                         [(jobs[i].method_name, jobs[i].args) for i in batch]): batch
+                    for batch in batches
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        batch = futures[future]
+                        try:
+                            guides = future.result()
+                        except Exception as e:
+                            logger.warning(f"Rendering {len(batch)} guides in a worker failed, retrying inline: {e}")
+                            guides = [await getattr(self, jobs[i].method_name)(*jobs[i].args) for i in batch]
+                        for index, guide in zip(batch, guides):
+                            await finish(index, guide)
+        
+        return [guide for guide in results if guide]
+    
+    def render_sync(self, method_name: str, args: tuple) -> Optional[TutorialGuide]:
+        """Run one guide renderer outside the event loop"""
+        return asyncio.run(getattr(self, method_name)(*args))
+    
+    def __getstate__(self):
+        # Worker processes only render; writer threads and the manifest stay in the parent
+        state = self.__dict__.copy()
+        state.pop('writer', None)
+        state.pop('manifest', None)
+        return state
+    
     async def _generate_how_to_build_guide(self, 
                                          feature_name: str, 
-                                         patterns: List[CodePattern],
-                                         doc_insights: Dict[str, List[DocumentationInsight]],
-                                         multimodal_insights: Dict[str, List[MultimodalInsight]]) -> Optional[TutorialGuide]:
+                                         patterns: List[CodePattern]) -> Optional[TutorialGuide]:
         """Generate a comprehensive 'How to Build X' guide"""
         
         if not patterns:
             return None
         
         # Collect related insights from other sources
-        related_docs = self._find_related_documentation(feature_name, doc_insights)
-        related_multimodal = self._find_related_multimodal(feature_name, multimodal_insights)
+        related_docs = self._find_related_documentation(feature_name)
+        related_multimodal = self._find_related_multimodal(feature_name)
         
         # Generate comprehensive guide content
         content = self._create_how_to_build_content(feature_name, patterns, related_docs, related_multimodal)
@@ -127,57 +355,28 @@ class TutorialGenerator:
                                    related_multimodal: List[MultimodalInsight]) -> str:
         """Create comprehensive how-to-build content"""
         
-        title = f"How to Build {feature_name.replace('_', ' ').title()}"
-        
-        content = f"""# {title}
-
-*Generated from real implementation analysis*
-
-## Overview
-
-This guide shows you how to build a {feature_name.replace('_', ' ')} system based on analysis of a real, working implementation. It includes architectural decisions, step-by-step implementation, common pitfalls, and best practices.
-
-## Table of Contents
-
-1. [System Architecture](#system-architecture)
-2. [Prerequisites](#prerequisites)
-3. [Step-by-Step Implementation](#step-by-step-implementation)
-4. [Key Implementation Patterns](#key-implementation-patterns)
-5. [Common Pitfalls to Avoid](#common-pitfalls-to-avoid)
-6. [Testing Strategy](#testing-strategy)
-7. [Deployment Considerations](#deployment-considerations)
-8. [Further Reading](#further-reading)
-
-## System Architecture
-
-"""
+        feature = feature_name.replace('_', ' ')
+        out: List[str] = []
+        templates.HOW_TO_BUILD_HEAD.render_into(out, title=f"How to Build {feature.title()}", feature=feature)
         
         # Add architectural insights from documentation
         if related_docs:
-            content += "### Design Decisions\n\n"
+            out.append("### Design Decisions\n\n")
             for doc in related_docs:
                 if doc.architectural_insights:
-                    content += f"**From {doc.title}:**\n"
-                    for insight in doc.architectural_insights[:3]:  # Top 3 insights
-                        content += f"- {insight}\n"
-                    content += "\n"
+                    out.append(f"**From {doc.title}:**\n")
+                    templates.render_list(out, doc.architectural_insights[:3])  # Top 3 insights
+                    out.append("\n")
         
         # Add visual architecture if available
         for multimodal in related_multimodal:
-            if multimodal.content_type == 'image' and multimodal.insights:
-                content += f"### Visual Architecture Insights\n\n"
-                content += f"*From {multimodal.title}:*\n"
-                for insight in multimodal.insights[:2]:
-                    content += f"- {insight}\n"
-                content += "\n"
+            if multimodal.content_type in ('image', 'diagram') and multimodal.insights:
+                out.append(f"### Visual Architecture Insights\n\n*From {multimodal.title}:*\n")
+                templates.render_list(out, multimodal.insights[:2])
+                out.append("\n")
                 break
         
-        content += """## Prerequisites
-
-Before implementing this system, ensure you have:
-
-### Technical Requirements
-"""
+        out.append(templates.PREREQUISITES)
         
         # Extract technology requirements from patterns
         technologies = set()
@@ -190,211 +389,90 @@ Before implementing this system, ensure you have:
             elif '.java' in pattern.file_path:
                 technologies.add('Java')
         
-        for tech in sorted(technologies):
-            content += f"- {tech} development environment\n"
-        
-        content += """
-### Knowledge Prerequisites
-- Understanding of web application architecture
-- Basic knowledge of databases and APIs
-- Familiarity with the chosen technology stack
-
-## Step-by-Step Implementation
-
-"""
+        templates.render_list(out, sorted(technologies), suffix=" development environment\n")
+        out.append(templates.KNOWLEDGE_PREREQUISITES)
         
         # Generate implementation steps from patterns
         for i, pattern in enumerate(patterns[:5], 1):  # Top 5 patterns
-            content += f"### Step {i}: {pattern.name}\n\n"
-            content += f"{pattern.description}\n\n"
+            out.append(f"### Step {i}: {pattern.name}\n\n{pattern.description}\n\n")
             
             if pattern.implementation_guide:
-                content += "**Implementation Approach:**\n"
-                # Extract implementation guidance from the pattern
-                guide_lines = pattern.implementation_guide.split('\n')
-                for line in guide_lines[:10]:  # First 10 lines
-                    if line.strip() and not line.strip().startswith('#'):
-                        content += f"- {line.strip()}\n"
-                content += "\n"
+                out.append("**Implementation Approach:**\n")
+                # First 10 lines, skipping headings; the rest of the guide is never split
+                steps = [line.strip() for line in pattern.implementation_guide.split('\n', 10)[:10]]
+                templates.render_list(out, [line for line in steps if line and not line.startswith('#')])
+                out.append("\n")
             
             if pattern.code_example and len(pattern.code_example.strip()) > 20:
-                content += "**Code Example:**\n\n"
-                content += f"```python\n{pattern.code_example}\n```\n\n"
+                out.append(f"**Code Example:**\n\n```python\n{pattern.code_example}\n```\n\n")
         
-        content += """## Key Implementation Patterns
-
-The following patterns were identified in the analyzed system:
-
-"""
+        out.append(templates.KEY_PATTERNS_HEAD)
         
         # Document key patterns
         for pattern in patterns:
-            content += f"### {pattern.name}\n\n"
-            content += f"**Purpose:** {pattern.description}\n\n"
-            content += f"**Implementation Location:** `{Path(pattern.file_path).name}`\n\n"
+            out.append(f"### {pattern.name}\n\n**Purpose:** {pattern.description}\n\n"
+                       f"**Implementation Location:** `{Path(pattern.file_path).name}`\n\n")
             
             if pattern.implementation_guide:
                 # Extract key guidance points
-                guide_lines = [line.strip() for line in pattern.implementation_guide.split('\n') 
-                              if line.strip() and not line.startswith('#')]
-                if guide_lines:
-                    content += "**Key Points:**\n"
-                    for line in guide_lines[:3]:  # Top 3 points
-                        content += f"- {line}\n"
-                    content += "\n"
-        
-        content += """## Common Pitfalls to Avoid
-
-Based on analysis of the real implementation, here are common issues to watch out for:
-
-"""
+                points = list(islice((line.strip() for line in pattern.implementation_guide.split('\n')
+                                      if line.strip() and not line.startswith('#')), 3))
+                if points:
+                    out.append("**Key Points:**\n")
+                    templates.render_list(out, points)  # Top 3 points
+                    out.append("\n")
+        
+        out.append(templates.PITFALLS_HEAD)
         
         # Add gotchas from multimodal sources (especially logs)
         for multimodal in related_multimodal:
             if multimodal.gotchas:
-                content += f"### Issues from {multimodal.content_type.title()} Analysis\n\n"
-                for gotcha in multimodal.gotchas[:3]:  # Top 3 gotchas
-                    content += f"- **{gotcha}**\n"
-                content += "\n"
+                out.append(f"### Issues from {multimodal.content_type.title()} Analysis\n\n")
+                templates.render_list(out, multimodal.gotchas[:3], prefix="- **", suffix="**\n")  # Top 3 gotchas
+                out.append("\n")
         
         # Add implementation guidance from docs
         for doc in related_docs:
             if doc.implementation_guidance:
-                content += f"### Guidance from {doc.title}\n\n"
-                for guidance in doc.implementation_guidance[:3]:
-                    content += f"- {guidance}\n"
-                content += "\n"
+                out.append(f"### Guidance from {doc.title}\n\n")
+                templates.render_list(out, doc.implementation_guidance[:3])
+                out.append("\n")
         
-        content += """## Testing Strategy
-
-Implement comprehensive testing to ensure system reliability:
-
-### Unit Testing
-- Test individual components and functions
-- Mock external dependencies
-- Aim for 80%+ code coverage
-
-### Integration Testing
-- Test component interactions
-- Verify database operations
-- Test API endpoints end-to-end
-
-### Performance Testing
-- Load test critical paths
-- Monitor memory usage
-- Benchmark response times
-
-## Deployment Considerations
-
-### Infrastructure Requirements
-"""
+        out.append(templates.TESTING_AND_DEPLOYMENT)
         
         # Add deployment insights from documentation
         deployment_docs = [doc for doc in related_docs if doc.doc_type in ['deployment', 'setup']]
         if deployment_docs:
             for doc in deployment_docs:
                 if doc.implementation_guidance:
-                    for guidance in doc.implementation_guidance:
-                        content += f"- {guidance}\n"
+                    templates.render_list(out, doc.implementation_guidance)
         else:
-            content += """- Consider containerization (Docker)
-- Set up proper logging and monitoring
-- Configure environment-specific settings
-- Plan for scalability and load balancing
-"""
+            out.append(templates.DEFAULT_INFRASTRUCTURE)
         
-        content += """
-### Security Considerations
-- Implement proper authentication and authorization
-- Validate and sanitize all inputs
-- Use HTTPS for all communications
-- Regular security audits and updates
-
-## Further Reading
-
-### Related Patterns
-"""
+        out.append(templates.SECURITY_AND_FURTHER_READING)
         
         # Link to related pattern files
         for pattern in patterns:
-            safe_pattern_name = pattern.name.lower().replace(' ', '_').replace('-', '_')
-            content += f"- [{pattern.name}](../patterns/{safe_pattern_name}.md)\n"
+            out.append(f"- [{pattern.name}](../patterns/{_pattern_filename(feature_name, pattern.name)})\n")
         
-        content += f"""
-### Architecture Documentation
-- [System Architecture Overview](../architecture/system_overview.md)
-- [Common Gotchas](../gotchas/common_pitfalls.md)
-
----
-
-*This guide was generated from analysis of a real {feature_name.replace('_', ' ')} implementation. The patterns and approaches described here have been proven to work in production environments.*
-
-**Generated on:** {datetime.now().strftime('%Y-%m-%d')}
-"""
+        templates.HOW_TO_BUILD_FOOTER.render_into(out, feature=feature, date=self.generated_on)
         
-        return content
+        return ''.join(out)
     
     async def _generate_pattern_guide(self, pattern: CodePattern, feature_name: str) -> Optional[TutorialGuide]:
         """Generate a detailed pattern guide"""
         
-        safe_name = pattern.name.lower().replace(' ', '_').replace('-', '_')
-        filename = f"{safe_name}.md"
+        filename = _pattern_filename(feature_name, pattern.name)
         
-        content = f"""# {pattern.name}
-
-*Implementation pattern from {feature_name.replace('_', ' ')} system*
-
-## Overview
-
-{pattern.description}
-
-## When to Use This Pattern
-
-This pattern is useful when you need to:
-- Implement similar functionality to {feature_name.replace('_', ' ')}
-- Follow established architectural patterns
-- Ensure consistent implementation approaches
-
-## Implementation Guide
-
-{pattern.implementation_guide}
-
-## Code Example
-
-```python
-{pattern.code_example}
-```
-
-## Key Benefits
-
-- **Reusability**: This pattern can be adapted for similar use cases  
-- **Maintainability**: Follows established conventions
-- **Reliability**: Based on proven, working implementation
-
-## Variations
-
-Consider these variations based on your specific needs:
-- Adapt the pattern for different programming languages
-- Modify for different scale requirements
-- Integrate with different frameworks or libraries
-
-## Testing This Pattern
-
-When implementing this pattern, ensure you test:
-- Core functionality works as expected
-- Error cases are handled properly
-- Performance meets requirements
-- Integration with other components is seamless
-
-## Related Patterns
-
-This pattern works well with other patterns from the {feature_name.replace('_', ' ')} system.
-
----
-
-*Extracted from: `{Path(pattern.file_path).name}`*
-*Generated on: {datetime.now().strftime('%Y-%m-%d')}*
-"""
+        content = templates.PATTERN_GUIDE.render(
+            name=pattern.name,
+            feature=feature_name.replace('_', ' '),
+            description=pattern.description,
+            implementation_guide=pattern.implementation_guide,
+            code_example=pattern.code_example,
+            source=Path(pattern.file_path).name,
+            date=self.generated_on
+        )
         
         return TutorialGuide(
             title=pattern.name,
@@ -412,42 +490,28 @@ This pattern works well with other patterns from the {feature_name.replace('_',
         filename = f"{doc_type}_architecture.md"
         title = f"{doc_type.replace('_', ' ').title()} Architecture Guide"
         
-        content = f"""# {title}
-
-*Architectural insights extracted from documentation analysis*
-
-## Overview
-
-This guide documents the architectural decisions and design patterns identified in the system documentation.
-
-"""
+        out: List[str] = []
+        templates.ARCHITECTURE_HEAD.render_into(out, title=title)
         
         for insight in insights:
-            content += f"## {insight.title}\n\n"
+            out.append(f"## {insight.title}\n\n")
             
             if insight.architectural_insights:
-                content += "### Architectural Decisions\n\n"
-                for arch_insight in insight.architectural_insights:
-                    content += f"- {arch_insight}\n"
-                content += "\n"
+                out.append("### Architectural Decisions\n\n")
+                templates.render_list(out, insight.architectural_insights)
+                out.append("\n")
             
             if insight.implementation_guidance:
-                content += "### Implementation Guidance\n\n"
-                for guidance in insight.implementation_guidance:
-                    content += f"- {guidance}\n"
-                content += "\n"
+                out.append("### Implementation Guidance\n\n")
+                templates.render_list(out, insight.implementation_guidance)
+                out.append("\n")
         
-        content += f"""
----
-
-*Generated from {len(insights)} documentation sources*
-*Generated on: {datetime.now().strftime('%Y-%m-%d')}*
-"""
+        templates.ARCHITECTURE_FOOTER.render_into(out, count=str(len(insights)), date=self.generated_on)
         
         return TutorialGuide(
             title=title,
             filename=filename,
-            content=content,
+            content=''.join(out),
             tutorial_type="architecture"
         )
     
@@ -460,15 +524,8 @@ This guide documents the architectural decisions and design patterns identified
         filename = "common_pitfalls.md"
         title = "Common Pitfalls and Gotchas"
         
-        content = f"""# {title}
-
-*Pitfalls and gotchas identified from real system analysis*
-
-## Overview
-
-This guide documents common pitfalls, gotchas, and issues identified through analysis of real implementations. Use this to avoid common mistakes when building similar systems.
-
-"""
+        out: List[str] = []
+        templates.GOTCHA_HEAD.render_into(out, title=title)
         
         # Add gotchas from multimodal sources (especially logs)
         log_gotchas = []
@@ -478,10 +535,10 @@ This guide documents common pitfalls, gotchas, and issues identified through ana
                     log_gotchas.extend(insight.gotchas)
         
         if log_gotchas:
-            content += "## Production Issues (From Log Analysis)\n\n"
+            out.append("## Production Issues (From Log Analysis)\n\n")
             for i, gotcha in enumerate(log_gotchas[:10], 1):
-                content += f"### {i}. {gotcha}\n\n"
-                content += "**How to avoid:** Implement proper error handling and monitoring for this scenario.\n\n"
+                out.append(f"### {i}. {gotcha}\n\n"
+                           "**How to avoid:** Implement proper error handling and monitoring for this scenario.\n\n")
         
         # Add gotchas from other multimodal sources
         other_gotchas = []
@@ -491,91 +548,27 @@ This guide documents common pitfalls, gotchas, and issues identified through ana
                     other_gotchas.extend(insight.gotchas)
         
         if other_gotchas:
-            content += "## Implementation Gotchas\n\n"
-            for gotcha in other_gotchas[:5]:
-                content += f"- **{gotcha}**\n"
-            content += "\n"
+            out.append("## Implementation Gotchas\n\n")
+            templates.render_list(out, other_gotchas[:5], prefix="- **", suffix="**\n")
+            out.append("\n")
         
-        content += """## General Best Practices
-
-Based on the analysis, follow these best practices to avoid common issues:
-
-### Error Handling
-- Always implement comprehensive error handling
-- Log errors with sufficient context for debugging
-- Provide meaningful error messages to users
-
-### Performance
-- Monitor system performance in production
-- Implement proper caching strategies
-- Optimize database queries and API calls
-
-### Security
-- Validate all user inputs
-- Implement proper authentication and authorization
-- Keep dependencies updated and secure
-
-### Testing
-- Write comprehensive tests for all functionality
-- Test error scenarios and edge cases
-- Implement automated testing in CI/CD pipeline
-
-### Monitoring
-- Set up proper logging and monitoring
-- Implement health checks and alerts
-- Monitor key business metrics
-
----
-
-*Generated from analysis of logs, documentation, and code patterns*
-*Generated on: {datetime.now().strftime('%Y-%m-%d')}*
-"""
+        templates.GOTCHA_FOOTER.render_into(out, date=self.generated_on)
         
         return TutorialGuide(
             title=title,
             filename=filename,
-            content=content,
+            content=''.join(out),
             tutorial_type="gotchas"
         )
     
-    def _find_related_documentation(self, feature_name: str, doc_insights: Dict[str, List[DocumentationInsight]]) -> List[DocumentationInsight]:
-        """Find documentation insights related to a feature"""
-        related = []
-        feature_keywords = feature_name.lower().split('_')
-        
-        for doc_type, insights in doc_insights.items():
-            for insight in insights:
-                # Check if insight is related to the feature
-                insight_text = (insight.title + ' ' + insight.content).lower()
-                if any(keyword in insight_text for keyword in feature_keywords):
-                    related.append(insight)
-        
-        return related
+    def _find_related_documentation(self, feature_name: str) -> List[DocumentationInsight]:
+        """Find documentation insights related to a feature, best match first"""
+        return self.insight_index.related_documentation(feature_name, self.related_top_k)
     
-    def _find_related_multimodal(self, feature_name: str, multimodal_insights: Dict[str, List[MultimodalInsight]]) -> List[MultimodalInsight]:
-        """Find multimodal insights related to a feature"""
-        related = []
-        feature_keywords = feature_name.lower().split('_')
-        
-        for content_type, insights in multimodal_insights.items():
-            for insight in insights:
-                # Check if insight is related to the feature
-                all_insights_text = ' '.join(insight.insights + insight.implementation_notes).lower()
-                if any(keyword in all_insights_text for keyword in feature_keywords):
-                    related.append(insight)
-        
-        return related
+    def _find_related_multimodal(self, feature_name: str) -> List[MultimodalInsight]:
+        """Find multimodal insights related to a feature, best match first"""
+        return self.insight_index.related_multimodal(feature_name, self.related_top_k)
     
     async def _write_guide_to_file(self, guide: TutorialGuide, output_dir: Path):
-        """Write a tutorial guide to file"""
-        try:
-            output_path = output_dir / guide.filename
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(guide.content)
-            
-            logger.info(f"Generated tutorial: {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error writing guide {guide.filename}: {e}")
-            raise
\ No newline at end of file
+        """Queue a tutorial guide for a batched atomic write"""
+        await self.writer.write(output_dir / guide.filename, guide.content)
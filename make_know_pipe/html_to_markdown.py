@@ -2,130 +2,602 @@
 """
 Simple HTML to Markdown Converter
 Converts HTML content to clean Markdown format
+
+A single pass over the stdlib html.parser tokenizer emits markdown as tags
+and text arrive, so the cost is linear in the input and large exports can
+be fed in chunks without holding the whole document. The trade-off is
+speed on small, well-formed pages: the tokenizer runs in Python, so such a
+page converts at about a third of the speed of the old regex chain (about
+0.6 s vs 0.2 s for the 1 MB synthetic benchmark page), in exchange for no
+backtracking blowups on large or malformed input.
+
+Inputs that are already Markdown (no HTML document structure) are left
+untouched rather than converted in place, which would collapse their lines.
 """
 
+import glob
+import os
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+CHUNK_SIZE = 1 << 16
+HTML_EXTENSIONS = ('.html', '.htm')
+SNIFF_SIZE = 1 << 16
+
+# Structural tags that mark a document as HTML; Markdown rarely opens with these
+HTML_MARKERS = re.compile(r'<(?:!doctype\s+html|html|head|body|div|p|table|ul|ol|h[1-6]|section|article)[\s>/]',
+                          re.IGNORECASE)
+
+HEADINGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+INLINE_MARKERS = {'strong': '**', 'b': '**', 'em': '*', 'i': '*'}
+SKIPPED = {'script', 'style', 'noscript', 'template', 'title'}
+PARAGRAPH_BLOCKS = {'p', 'blockquote', 'pre', 'table', 'ul', 'ol', 'hr', 'dl'}
+LINE_BLOCKS = {'div', 'section', 'article', 'header', 'footer', 'nav', 'main', 'aside',
+               'figure', 'figcaption', 'dt', 'dd', 'address', 'details', 'summary'}
+
+HEADER = """# Developer Documentation
+
+*Converted from HTML to Markdown*
+
+---
+
+"""
+
+class MarkdownConverter(HTMLParser):
+    """Incremental HTML to Markdown converter; feed() chunks, close() at the end"""
+
+    def __init__(self, write: Optional[Callable[[str], None]] = None):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.write = write or self.parts.append
+
+        # Line state: blank lines owed before the next text, a collapsed space owed, line prefixes
+        self.started = False
+        self.line_start = True
+        self.breaks = 0
+        self.space = False
+        self.prefixes: List[str] = []
+        self.item_empty = False  # A bullet was just written; the item's first block starts on its line
+
+        self.skip_depth = 0
+        self.lists: List[List] = []  # [tag, next number, item open]
+        self.links: List[Optional[str]] = []
+        self.in_time = False
+
+        self.pre_depth = 0
+        self.pre_fence = ''  # Opening fence not yet written, waiting for a language
+        self.pre_first = False
+        self.pre_newline = False  # Trailing newline held back so the closing fence follows the code
+
+        # Rows are the only buffered unit: a table needs the column count before its separator
+        self.table_depth = 0
+        self.row: Optional[List[str]] = None
+        self.cell: Optional[List[str]] = None
+        self.header_cell = False
+        self.rows_written = 0
+
+    # Output
+
+    def _out(self, text: str):
+        if self.cell is not None:
+            self.cell.append(text)
+        else:
+            self.write(text)
+
+    def _start_text(self):
+        """Write owed line breaks or a collapsed space before inline content"""
+        if self.cell is not None:
+            if self.space and self.cell:
+                self.cell.append(' ')
+            self.space = False
+            return
+        self.item_empty = False
+        if self.breaks and self.started:
+            prefix = ''.join(self.prefixes)
+            self.write('\n' + (prefix.rstrip() + '\n') * (self.breaks - 1) + prefix)
+            self.line_start = False
+        elif self.line_start:
+            self.write(''.join(self.prefixes))
+            self.line_start = False
+        elif self.space:
+            self.write(' ')
+        self.breaks = 0
+        self.space = False
+        self.started = True
+
+    def _block(self, blank_lines: int):
+        """End the current line; blank_lines is 2 for a paragraph break, 1 for a line break"""
+        if self.cell is not None:
+            self.space = True
+            return
+        self.space = False
+        # Breaks already written by _flush_breaks still count
+        if self.started and not self.item_empty and not self.line_start:
+            self.breaks = max(self.breaks, blank_lines)
+
+    def _flush_breaks(self):
+        """Write owed line breaks with the current prefix before the prefix changes"""
+        if self.breaks and self.started:
+            self.write('\n' + (''.join(self.prefixes).rstrip() + '\n') * (self.breaks - 1))
+            self.line_start = True
+            self.breaks = 0
+
+    # Tokenizer callbacks
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED:
+            self.skip_depth += 1
+            return
+        if self.skip_depth:
+            return
+        attributes = dict(attrs)
+
+        if self.pre_depth:
+            if tag == 'pre':
+                self.pre_depth += 1
+            elif tag == 'code' and self.pre_fence:
+                for css_class in (attributes.get('class') or '').split():
+                    if css_class.startswith(('language-', 'lang-')):
+                        self.pre_fence = '```' + css_class.split('-', 1)[1]
+            return
+
+        if tag in HEADINGS:
+            self._block(2)
+            self._start_text()
+            self._out('#' * HEADINGS[tag] + ' ')
+        elif tag == 'li':
+            self._open_item()
+        elif tag in ('ul', 'ol'):
+            self._block(1 if self.lists else 2)
+            self.lists.append([tag, int(attributes.get('start') or 1), False])
+        elif tag == 'pre' and self.cell is None:
+            self._block(2)
+            self.pre_depth = 1
+            self.pre_fence = '```'
+            self.pre_first = True
+        elif tag == 'blockquote':
+            self._block(2)
+            self._flush_breaks()
+            self.prefixes.append('> ')
+        elif tag in ('table', 'tr', 'td', 'th'):
+            self._table_start(tag)
+        elif tag in PARAGRAPH_BLOCKS:
+            self._block(2)
+            if tag == 'hr':
+                self._start_text()
+                self._out('---')
+                self._block(2)
+        elif tag in LINE_BLOCKS:
+            self._block(1)
+        elif tag == 'br':
+            self._block(1)
+        elif tag in INLINE_MARKERS:
+            self._start_text()
+            self._out(INLINE_MARKERS[tag])
+        elif tag == 'code':
+            self._start_text()
+            self._out('`')
+        elif tag == 'a':
+            href = attributes.get('href')
+            self.links.append(href)
+            if href:
+                self._start_text()
+                self._out('[')
+        elif tag == 'img':
+            src = attributes.get('src')
+            if src:
+                self._start_text()
+                self._out(f"![{attributes.get('alt') or ''}]({src})")
+        elif tag == 'time':
+            datetime = attributes.get('datetime')
+            if datetime:
+                self._start_text()
+                self._out(f"**Date: {datetime}**")
+                self.in_time = True
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in ('br', 'hr', 'img'):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if self.skip_depth:
+            return
+
+        if self.pre_depth:
+            if tag == 'pre':
+                self.pre_depth -= 1
+                if not self.pre_depth:
+                    self._close_pre()
+            return
+
+        if tag in HEADINGS:
+            self._block(2)
+        elif tag == 'li':
+            self._close_item()
+        elif tag in ('ul', 'ol'):
+            if self.lists:
+                self._close_item()
+                self.lists.pop()
+            self._block(1 if self.lists else 2)
+        elif tag == 'blockquote':
+            self._block(2)
+            if '> ' in self.prefixes:
+                del self.prefixes[len(self.prefixes) - 1 - self.prefixes[::-1].index('> ')]
+            self._flush_breaks()
+        elif tag in ('table', 'tr', 'td', 'th'):
+            self._table_end(tag)
+        elif tag in PARAGRAPH_BLOCKS:
+            self._block(2)
+        elif tag in LINE_BLOCKS:
+            self._block(1)
+        elif tag in INLINE_MARKERS:
+            self._out(INLINE_MARKERS[tag])
+        elif tag == 'code':
+            self._out('`')
+        elif tag == 'a':
+            href = self.links.pop() if self.links else None
+            if href:
+                self._out(f"]({href})")
+        elif tag == 'time':
+            self.in_time = False
+
+    def handle_data(self, data):
+        if self.skip_depth or self.in_time:
+            return
+        if self.pre_depth:
+            self._pre_text(data)
+            return
+        if data[:1].isspace():
+            self.space = True
+        words = data.split()
+        if not words:
+            return
+        self._start_text()
+        text = ' '.join(words)
+        self._out(text.replace('|', '\\|') if self.cell is not None else text)
+        self.space = data[-1].isspace()
+
+    # Lists
+
+    def _open_item(self):
+        if not self.lists:
+            self.lists.append(['ul', 1, False])
+        self._close_item()
+        entry = self.lists[-1]
+        if entry[0] == 'ol':
+            bullet = f"{entry[1]}. "
+            entry[1] += 1
+        else:
+            bullet = '- '
+        self._block(1)
+        self._start_text()
+        self._out(bullet)
+        self.item_empty = True
+        self.prefixes.append(' ' * len(bullet))
+        entry[2] = True
+
+    def _close_item(self):
+        if self.lists and self.lists[-1][2]:
+            self.prefixes.pop()
+            self.lists[-1][2] = False
+            self._block(1)
+
+    # Preformatted text
+
+    def _pre_text(self, data: str):
+        if self.pre_first:
+            # A newline straight after <pre> is not part of the content
+            if data.startswith('\n'):
+                data = data[1:]
+            if not data:
+                return
+            self.pre_first = False
+        if self.pre_fence:
+            self._start_text()
+            self._out(self.pre_fence + '\n' + ''.join(self.prefixes))
+            self.pre_fence = ''
+        if self.pre_newline:
+            data = '\n' + data
+        self.pre_newline = data.endswith('\n')
+        if self.pre_newline:
+            data = data[:-1]
+        prefix = ''.join(self.prefixes)
+        self._out(data.replace('\n', '\n' + prefix) if prefix else data)
+
+    def _close_pre(self):
+        if self.pre_fence:
+            self._start_text()
+            self._out(self.pre_fence + '\n' + ''.join(self.prefixes))
+            self.pre_fence = ''
+        self._out('\n' + ''.join(self.prefixes) + '```')
+        self.pre_newline = False
+        self.started = True
+        self.line_start = False
+        self._block(2)
+
+    # Tables
+
+    def _table_start(self, tag: str):
+        if tag == 'table':
+            self.table_depth += 1
+            if self.table_depth == 1:
+                self._block(2)
+                self.rows_written = 0
+            else:
+                self._block(1)
+            return
+        if self.table_depth != 1:
+            self._block(1)
+            return
+        if tag == 'tr':
+            self._flush_row()
+            self.row = []
+        else:
+            if self.row is None:
+                self.row = []
+            self._close_cell()
+            self.cell = []
+            self.header_cell = tag == 'th'
+            self.space = False
+
+    def _table_end(self, tag: str):
+        if tag == 'table':
+            if self.table_depth == 1:
+                self._flush_row()
+                self._block(2)
+            else:
+                self._block(1)
+            self.table_depth = max(0, self.table_depth - 1)
+        elif self.table_depth != 1:
+            self._block(1)
+        elif tag == 'tr':
+            self._flush_row()
+        else:
+            self._close_cell()
+
+    def _close_cell(self):
+        if self.cell is None:
+            return
+        text = ''.join(self.cell)
+        self.row.append(f"**{text}**" if self.header_cell and text else text)
+        self.cell = None
+        self.space = False
+
+    def _flush_row(self):
+        """Write a finished row, adding the separator under the first one"""
+        self._close_cell()
+        if not self.row:
+            self.row = None
+            return
+        row, self.row = self.row, None
+        self._block(1)
+        self._start_text()
+        self._out('| ' + ' | '.join(row) + ' |')
+        if not self.rows_written:
+            self._block(1)
+            self._start_text()
+            self._out('|' + ' --- |' * len(row))
+        self.rows_written += 1
+        self._block(1)
+
+    def close(self):
+        """Flush buffered input and end the document with a newline"""
+        super().close()
+        if self.pre_depth:
+            self.pre_depth = 0
+            self._close_pre()
+        if self.table_depth:
+            self.table_depth = 1
+            self._table_end('table')
+        if self.started:
+            self.write('\n')
 
 def html_to_markdown(html_content):
     """Convert HTML content to Markdown"""
-    content = html_content
-    
-    # Remove CSS styles and scripts
-    content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-    
-    # Convert headings
-    content = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1', content, flags=re.DOTALL)
-    content = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1', content, flags=re.DOTALL)
-    content = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1', content, flags=re.DOTALL)
-    content = re.sub(r'<h4[^>]*>(.*?)</h4>', r'#### \1', content, flags=re.DOTALL)
-    content = re.sub(r'<h5[^>]*>(.*?)</h5>', r'##### \1', content, flags=re.DOTALL)
-    content = re.sub(r'<h6[^>]*>(.*?)</h6>', r'###### \1', content, flags=re.DOTALL)
-    
-    # Convert paragraphs
-    content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', content, flags=re.DOTALL)
-    
-    # Convert lists
-    content = re.sub(r'<ul[^>]*>', '', content)
-    content = re.sub(r'</ul>', '\n', content)
-    content = re.sub(r'<ol[^>]*>', '', content)
-    content = re.sub(r'</ol>', '\n', content)
-    content = re.sub(r'<li[^>]*>(.*?)</li>', r'- \1', content, flags=re.DOTALL)
-    
-    # Convert links
-    content = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', content, flags=re.DOTALL)
-    
-    # Convert emphasis
-    content = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', content, flags=re.DOTALL)
-    content = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', content, flags=re.DOTALL)
-    content = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', content, flags=re.DOTALL)
-    content = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', content, flags=re.DOTALL)
-    
-    # Convert code
-    content = re.sub(r'<code[^>]*>(.*?)</code>', r'`\1`', content, flags=re.DOTALL)
-    content = re.sub(r'<pre[^>]*>(.*?)</pre>', r'```\n\1\n```', content, flags=re.DOTALL)
-    
-    # Convert time elements
-    content = re.sub(r'<time[^>]*datetime="([^"]*)"[^>]*>[^<]*</time>', r'**Date: \1**', content)
-    
-    # Convert tables (basic)
-    content = re.sub(r'<table[^>]*>', '\n', content)
-    content = re.sub(r'</table>', '\n', content)
-    content = re.sub(r'<tr[^>]*>', '', content)
-    content = re.sub(r'</tr>', '\n', content)
-    content = re.sub(r'<th[^>]*>(.*?)</th>', r'| **\1** ', content, flags=re.DOTALL)
-    content = re.sub(r'<td[^>]*>(.*?)</td>', r'| \1 ', content, flags=re.DOTALL)
-    
-    # Remove remaining HTML tags
-    content = re.sub(r'<[^>]+>', '', content)
-    
-    # Clean up HTML entities
-    entities = {
-        '&nbsp;': ' ',
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&mdash;': '—',
-        '&ndash;': '–',
-        '&hellip;': '…'
-    }
-    
-    for entity, replacement in entities.items():
-        content = content.replace(entity, replacement)
-    
-    # Clean up whitespace
-    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-    content = re.sub(r'^\s+', '', content, flags=re.MULTILINE)
-    content = content.strip()
-    
-    return content
+    converter = MarkdownConverter()
+    for start in range(0, len(html_content), CHUNK_SIZE):
+        converter.feed(html_content[start:start + CHUNK_SIZE])
+    converter.close()
+    return ''.join(converter.parts).strip()
+
+def convert_stream(source: TextIO, write: Callable[[str], None], chunk_size: int = CHUNK_SIZE) -> int:
+    """Convert HTML read from a file object in chunks, returning the characters read"""
+    converter = MarkdownConverter(write)
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        converter.feed(chunk)
+    converter.close()
+    return total
+
+def looks_like_html(path: str) -> bool:
+    """True when the start of a file contains HTML document structure"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return HTML_MARKERS.search(f.read(SNIFF_SIZE)) is not None
+
+def _target_mode(path: str) -> int:
+    """Permission bits for a file about to replace path"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def convert_to(input_file, output_file, header: str = HEADER) -> Tuple[int, int]:
+    """
+    Stream one HTML file into a Markdown file, replacing it atomically
+
+    Returns:
+        Characters read and characters written
+    """
+    # Write next to the target and move into place, so converting in place is safe
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.tmp-', suffix='.md')
+    written = [len(header)]
+    try:
+        # Wrapped first so the descriptor is closed even when the input cannot be opened
+        with os.fdopen(fd, 'w', encoding='utf-8') as target, \
+                open(input_file, 'r', encoding='utf-8', errors='replace') as source:
+            target.write(header)
+
+            def write(text):
+                written[0] += len(text)
+                target.write(text)
+
+            original_size = convert_stream(source, write)
+        # mkstemp creates 0600; keep the replaced file's mode, else the umask default
+        os.chmod(tmp_path, _target_mode(output_file))
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return original_size, written[0]
 
 def convert_file(input_file, output_file=None):
     """Convert HTML file to Markdown"""
     if output_file is None:
         output_file = input_file
-    
+
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
+        if not input_file.lower().endswith(HTML_EXTENSIONS) and not looks_like_html(input_file):
+            print(f"Skipping {input_file}: already Markdown")
+            return True
         print(f"Converting {input_file}...")
-        print(f"Original size: {len(html_content)} characters")
-        
-        markdown_content = html_to_markdown(html_content)
-        
-        # Add header
-        header = """# Developer Documentation
-
-*Converted from HTML to Markdown*
-
----
-
-"""
-        
-        final_content = header + markdown_content
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_content)
-        
-        print(f"Converted size: {len(final_content)} characters")
+        original_size, converted_size = convert_to(input_file, output_file)
+        print(f"Original size: {original_size} characters")
+        print(f"Converted size: {converted_size} characters")
         print(f"✅ Conversion completed: {output_file}")
-        
+
     except Exception as e:
         print(f"Error: {e}")
         return False
-    
+
     return True
 
+# Batch conversion
+
+def _convert_job(job: Tuple[str, str]) -> Tuple[str, int, Optional[str]]:
+    """Worker entry point: (input, output) -> (input, bytes read, error)"""
+    input_file, output_file = job
+    try:
+        # Sized before converting: an in-place job replaces the input
+        size = os.path.getsize(input_file)
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        convert_to(input_file, output_file, header='')
+        return input_file, size, None
+    except Exception as e:
+        return input_file, 0, str(e)
+
+def collect_inputs(patterns: List[str]) -> List[Tuple[str, str]]:
+    """Expand files, directories (recursively, *.html / *.htm) and globs into (file, root) pairs"""
+    inputs: Dict[str, str] = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for dirpath, _, filenames in os.walk(pattern):
+                for filename in filenames:
+                    if filename.lower().endswith(HTML_EXTENSIONS):
+                        inputs.setdefault(os.path.join(dirpath, filename), pattern)
+        elif os.path.isfile(pattern):
+            inputs.setdefault(pattern, os.path.dirname(pattern))
+        else:
+            matches = glob.glob(pattern, recursive=True)
+            if not matches:
+                print(f"⚠️  No files match {pattern}")
+            # Paths under the output directory mirror what follows the glob's fixed prefix
+            root = os.path.dirname(pattern.split('*', 1)[0].split('?', 1)[0].split('[', 1)[0])
+            for path in matches:
+                if os.path.isfile(path):
+                    inputs.setdefault(path, root)
+    return sorted(inputs.items())
+
+def output_path(input_file: str, root: str, output_dir: Optional[str] = None) -> str:
+    """Markdown path for an input, beside it or mirrored under output_dir"""
+    base, extension = os.path.splitext(input_file)
+    target = input_file if extension.lower() == '.md' else base + '.md'
+    if output_dir:
+        target = os.path.join(output_dir, os.path.relpath(target, root or '.'))
+    return target
+
+def convert_batch(patterns: List[str], output_dir: Optional[str] = None,
+                  workers: Optional[int] = None, force: bool = False) -> Dict:
+    """
+    Convert many HTML files in parallel on a process pool
+
+    Outputs newer than their inputs are skipped unless force is set. Inputs
+    without an HTML extension (e.g. a .md holding an export) are converted
+    only while they still contain HTML, so in-place runs are idempotent.
+
+    Returns:
+        Summary with converted, skipped and failed counts, bytes read and elapsed seconds
+    """
+    start = time.perf_counter()
+    jobs = []
+    skipped = 0
+    for input_file, root in collect_inputs(patterns):
+        if not input_file.lower().endswith(HTML_EXTENSIONS) and not looks_like_html(input_file):
+            skipped += 1
+            continue
+        target = output_path(input_file, root, output_dir)
+        if not force and target != input_file and os.path.exists(target) \
+                and os.path.getmtime(target) >= os.path.getmtime(input_file):
+            skipped += 1
+            continue
+        jobs.append((input_file, target))
+
+    # Largest files first so one big page does not finish last on an idle pool
+    jobs.sort(key=lambda job: os.path.getsize(job[0]), reverse=True)
+
+    converted = 0
+    failed = 0
+    total_bytes = 0
+
+    def record(result):
+        nonlocal converted, failed, total_bytes
+        input_file, size, error = result
+        if error:
+            failed += 1
+            print(f"❌ {input_file}: {error}")
+        else:
+            converted += 1
+            total_bytes += size
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        for job in jobs:
+            record(_convert_job(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Small chunks keep big files spread across workers
+            for result in executor.map(_convert_job, jobs, chunksize=max(1, len(jobs) // (workers * 8))):
+                record(result)
+
+    return {
+        'converted': converted,
+        'skipped': skipped,
+        'failed': failed,
+        'bytes': total_bytes,
+        'seconds': time.perf_counter() - start,
+    }
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python html_to_markdown.py <input_file> [output_file]")
         sys.exit(1)
-    
+
     input_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    convert_file(input_file, output_file)
\ No newline at end of file
+
+    convert_file(input_file, output_file)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Query the Knowledge Library
+
+Ranked search over the generated guides using the index the generator keeps
+in knowledge_library/.search/, without reading the guide files.
+
+Usage:
+    python query.py "retry with exponential backoff" [top_k]
+    python query.py --rebuild
+"""
+
+import sys
+import time
+
+from generators.library_index import LibraryIndex
+
+LIBRARY_DIR = "./knowledge_library"
+
+def main():
+    if len(sys.argv) < 2:
+        print('Usage: python query.py "<query>" [top_k]')
+        print("       python query.py --rebuild")
+        sys.exit(1)
+    
+    index = LibraryIndex(LIBRARY_DIR)
+    
+    if sys.argv[1] == '--rebuild':
+        reindexed = index.update()
+        print(f"✅ Indexed {reindexed} guides in {index.index_dir}")
+        return
+    
+    query = sys.argv[1]
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    
+    start = time.perf_counter()
+    hits = index.search(query, top_k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    if not hits:
+        print(f"No guides match '{query}'")
+        return
+    
+    for rank, hit in enumerate(hits, 1):
+        print(f"{rank:2}. {hit.title}  ({hit.score:.2f})")
+        print(f"    {hit.path}" + (f"  § {hit.section} @ {hit.offset}" if hit.section else ""))
+    print(f"\n{len(hits)} results in {elapsed_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Run Journal - Durable checkpoints for resumable pipeline runs
+
+Records each run's arguments, finished stage outputs and completed work
+units (one document, one JSON file) in SQLite in WAL mode. Every record is
+committed as it happens, so a run killed by a crash, quota exhaustion or
+Ctrl-C can be resumed by id and only redo unfinished work.
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_PATH = "./.cache/run_journal.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    args TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    output TEXT NOT NULL,
+    finished REAL NOT NULL,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE TABLE IF NOT EXISTS units (
+    run_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    output TEXT NOT NULL,
+    PRIMARY KEY (run_id, stage, unit)
+);
+"""
+
+class UnitLog:
+    """Completed work units of one stage; record() persists each unit as it finishes"""
+
+    def __init__(self, journal: 'RunJournal', stage: str, done: Dict[str, Any]):
+        self.journal = journal
+        self.stage = stage
+        self.done = done
+        self.restored = len(done)
+
+    def __contains__(self, unit: str) -> bool:
+        return unit in self.done
+
+    def get(self, unit: str, default: Any = None) -> Any:
+        return self.done.get(unit, default)
+
+    def record(self, unit: str, output: Any):
+        self.done[unit] = output
+        self.journal._execute(
+            "INSERT OR REPLACE INTO units (run_id, stage, unit, output) VALUES (?, ?, ?, ?)",
+            (self.journal.run_id, self.stage, unit, json.dumps(output))
+        )
+
+class RunJournal:
+    """SQLite (WAL) journal of runs, their finished stages and completed units"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync survives process crashes; only an OS crash can lose the last commits
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.run_id: Optional[str] = None
+
+    def _execute(self, sql: str, params: Tuple = ()):
+        with self.connection:
+            self.connection.execute(sql, params)
+
+    def start(self, args: Dict[str, Any]) -> str:
+        """Open a new run, returning its id"""
+        self.run_id = time.strftime('%Y%m%d-%H%M%S') + '-' + uuid.uuid4().hex[:6]
+        now = time.time()
+        self._execute("INSERT INTO runs (run_id, args, status, started, updated) VALUES (?, ?, 'running', ?, ?)",
+                      (self.run_id, json.dumps(args), now, now))
+        return self.run_id
+
+    def resume(self, run_id: str) -> Dict[str, Any]:
+        """Reopen a run, returning the arguments it was started with"""
+        row = self.connection.execute("SELECT args, status FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run id: {run_id}")
+        self.run_id = run_id
+        self._execute("UPDATE runs SET status = 'running', updated = ? WHERE run_id = ?", (time.time(), run_id))
+        logger.info(f"Resuming run {run_id} (was {row[1]})")
+        return json.loads(row[0])
+
+    def latest_run(self, status: str = 'completed', **args: Any) -> Optional[str]:
+        """Most recent other run with the given status whose arguments include args"""
+        rows = self.connection.execute("SELECT run_id, args FROM runs WHERE status = ? ORDER BY started DESC",
+                                       (status,)).fetchall()
+        for run_id, stored in rows:
+            stored = json.loads(stored)
+            if run_id != self.run_id and all(stored.get(key) == value for key, value in args.items()):
+                return run_id
+        return None
+
+    def carry_units(self, from_run_id: str, stages: Iterable[str], exclude: Set[str]) -> int:
+        """Copy another run's completed units of the given stages into this run, except excluded units"""
+        carried = 0
+        with self.connection:
+            for stage in stages:
+                rows = self.connection.execute("SELECT unit, output FROM units WHERE run_id = ? AND stage = ?",
+                                               (from_run_id, stage)).fetchall()
+                for unit, output in rows:
+                    if unit in exclude:
+                        continue
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO units (run_id, stage, unit, output) VALUES (?, ?, ?, ?)",
+                        (self.run_id, stage, unit, output))
+                    carried += 1
+        return carried
+
+    def stage_output(self, stage: str) -> Tuple[bool, Any]:
+        """(True, output) for a stage this run already finished, else (False, None)"""
+        row = self.connection.execute("SELECT output FROM stages WHERE run_id = ? AND stage = ?",
+                                      (self.run_id, stage)).fetchone()
+        return (True, json.loads(row[0])) if row else (False, None)
+
+    def record_stage(self, stage: str, output: Any):
+        self._execute("INSERT OR REPLACE INTO stages (run_id, stage, output, finished) VALUES (?, ?, ?, ?)",
+                      (self.run_id, stage, json.dumps(output), time.time()))
+
+    def units(self, stage: str) -> UnitLog:
+        """Unit log for a stage, preloaded with the units this run already completed"""
+        rows = self.connection.execute("SELECT unit, output FROM units WHERE run_id = ? AND stage = ?",
+                                       (self.run_id, stage)).fetchall()
+        return UnitLog(self, stage, {unit: json.loads(output) for unit, output in rows})
+
+    def close(self, status: Optional[str] = None):
+        """Record the run's final status and checkpoint the WAL into the database file"""
+        if self.connection is None:
+            return
+        try:
+            if status and self.run_id:
+                self._execute("UPDATE runs SET status = ?, updated = ? WHERE run_id = ?",
+                              (status, time.time(), self.run_id))
+            self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not finalize run journal {self.path}: {e}")
+        finally:
+            self.connection.close()
+            self.connection = None
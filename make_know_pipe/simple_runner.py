@@ -10,6 +10,7 @@ import asyncio
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 import logging
 
 # Set up logging
@@ -25,12 +26,17 @@ from extractors.code_analyzer import CodeAnalyzer
 from extractors.doc_processor import DocProcessor
 from extractors.multimodal_processor import MultimodalProcessor
 from generators.tutorial_generator import TutorialGenerator
+from stage_graph import StageGraph
 
 class MakeKnowPipe:
     """Main orchestrator for the knowledge extraction pipeline"""
     
-    def __init__(self, source_analysis_file: str = "./intake/SOURCE_ANALYSIS.md"):
+    def __init__(self, source_analysis_file: str = "./intake/SOURCE_ANALYSIS.md", stream: bool = False,
+                 llm_stage_limit: int = 3, base_revision: Optional[str] = None):
         self.source_analysis_file = Path(source_analysis_file)
+        self.base_revision = base_revision  # Git revision of the last run; only changed symbols are re-analyzed
+        self.stream = stream  # Write guides as knowledge is extracted instead of after all phases
+        self.llm_stage_limit = llm_stage_limit  # LLM-bound stages allowed to run at once
         self.llm_router = LLMRouter()
         
         # Initialize processors
@@ -66,46 +72,18 @@ class MakeKnowPipe:
                 logger.error("❌ Could not parse source analysis configuration")
                 return False
             
-            # Phase 1: Extract knowledge from all sources
-            logger.info("🔍 Phase 1: Extracting knowledge from sources...")
-            
-            # Extract from code
-            logger.info("💻 Analyzing source code...")
-            code_patterns = {}
-            if config.get('code_sources'):
-                code_patterns = await self.code_analyzer.extract_implementation_patterns(
-                    config['code_sources']
-                )
-                logger.info(f"Found patterns in {len(code_patterns)} feature areas")
-            
-            # Extract from documentation
-            logger.info("📚 Processing documentation...")
-            doc_insights = {}
-            if config.get('doc_sources'):
-                doc_insights = await self.doc_processor.extract_documentation_knowledge(
-                    config['doc_sources']
-                )
-                logger.info(f"Extracted insights from {len(doc_insights)} document types")
-            
-            # Extract from multimodal sources
-            logger.info("🎨 Processing images, PDFs, and logs...")
-            multimodal_insights = {}
-            if config.get('multimodal_sources'):
-                multimodal_insights = await self.multimodal_processor.process_multimodal_sources(
-                    config['multimodal_sources']
-                )
-                logger.info(f"Processed {len(multimodal_insights)} types of multimodal content")
-            
-            # Phase 2: Generate tutorial library
-            logger.info("📝 Phase 2: Generating tutorial library...")
-            
-            generated_guides = await self.tutorial_generator.generate_all_tutorials(
-                code_patterns, doc_insights, multimodal_insights
-            )
+            # Sources are independent stages; guides wait on all three
+            graph = self._build_graph(config)
+            results = await graph.run()
+            code_patterns = results['code_patterns']
+            doc_insights = results['doc_insights']
+            multimodal_insights = results['multimodal_insights']
+            generated_guides = results['guides']
             
             # Summary
             logger.info("✅ Make Know Pipe completed successfully!")
-            logger.info(f"📊 Generated {len(generated_guides)} tutorial guides")
+            logger.info(f"📊 Generated {len(generated_guides)} tutorial guides "
+                        f"({self.tutorial_generator.unchanged_count} unchanged)")
             
             # Display results
             self._display_results(generated_guides, code_patterns, doc_insights, multimodal_insights)
@@ -117,6 +95,68 @@ class MakeKnowPipe:
             logger.exception("Full error details:")
             return False
     
+    def _build_graph(self, config: dict) -> StageGraph:
+        """Pipeline stages: code, docs and multimodal extraction run concurrently, then guides"""
+        generator = self.tutorial_generator
+        graph = StageGraph(limits={'llm': self.llm_stage_limit})
+        
+        if self.stream:
+            # Guides are written as knowledge is extracted
+            logger.info("🔍 Extracting knowledge and streaming guides...")
+            generator.begin_stream()
+        else:
+            logger.info("🔍 Phase 1: Extracting knowledge from sources...")
+        
+        async def extract_code():
+            if not config.get('code_sources'):
+                return {}
+            logger.info("💻 Analyzing source code...")
+            # In stream mode pattern guides are written as each file's patterns are parsed
+            code_patterns = await self.code_analyzer.extract_implementation_patterns(
+                config['code_sources'], base_revision=self.base_revision,
+                on_patterns=generator.add_patterns if self.stream else None
+            )
+            logger.info(f"Found patterns in {len(code_patterns)} feature areas")
+            return code_patterns
+        
+        async def extract_docs():
+            doc_insights = {}
+            if config.get('doc_sources'):
+                logger.info("📚 Processing documentation...")
+                doc_insights = await self.doc_processor.extract_documentation_knowledge(
+                    config['doc_sources']
+                )
+                logger.info(f"Extracted insights from {len(doc_insights)} document types")
+            if self.stream:
+                await generator.close_documentation(doc_insights)
+            return doc_insights
+        
+        async def extract_multimodal():
+            if not config.get('multimodal_sources'):
+                return {}
+            logger.info("🎨 Processing images, PDFs, and logs...")
+            multimodal_insights = await self.multimodal_processor.process_multimodal_sources(
+                config['multimodal_sources']
+            )
+            logger.info(f"Processed {len(multimodal_insights)} types of multimodal content")
+            return multimodal_insights
+        
+        async def generate_guides(code_patterns, doc_insights, multimodal_insights):
+            if self.stream:
+                # How-to-build and gotcha guides draw on every source, so they are written last
+                logger.info("📝 Finalizing cross-cutting guides...")
+                return await generator.finish_stream(multimodal_insights)
+            logger.info("📝 Phase 2: Generating tutorial library...")
+            return await generator.generate_all_tutorials(
+                code_patterns, doc_insights, multimodal_insights
+            )
+        
+        graph.add('code_patterns', extract_code, uses=['llm'])
+        graph.add('doc_insights', extract_docs, uses=['llm'])
+        graph.add('multimodal_insights', extract_multimodal, uses=['llm'])
+        graph.add('guides', generate_guides, inputs=['code_patterns', 'doc_insights', 'multimodal_insights'])
+        return graph
+    
     async def _parse_source_analysis(self) -> dict:
         """Parse the SOURCE_ANALYSIS.md file to extract configuration"""
         try:
@@ -227,6 +267,8 @@ class MakeKnowPipe:
                 print(f"     - {guide.title}")
             if len(type_guides) > 3:
                 print(f"     - ... and {len(type_guides) - 3} more")
+        if self.tutorial_generator.unchanged_count:
+            print(f"   • Unchanged since the last run: {self.tutorial_generator.unchanged_count} guides")
         
         print(f"\n📁 OUTPUT LOCATION:")
         print(f"   {self.tutorial_generator.output_dir.absolute()}")
@@ -246,12 +288,21 @@ async def main():
     print("-" * 50)
     
     # Check for source analysis file
+    args = [arg for arg in sys.argv[1:] if arg != '--stream']
+    base_revision = None
+    if '--base' in args:
+        position = args.index('--base')
+        base_revision = args[position + 1] if position + 1 < len(args) else None
+        args = args[:position] + args[position + 2:]
+        if not base_revision:
+            print("Usage: python simple_runner.py [analysis_file] [--stream] [--base <git revision>]")
+            sys.exit(1)
     source_analysis_path = "./intake/SOURCE_ANALYSIS.md"
-    if len(sys.argv) > 1:
-        source_analysis_path = sys.argv[1]
+    if args:
+        source_analysis_path = args[0]
     
     # Initialize and run pipeline
-    pipeline = MakeKnowPipe(source_analysis_path)
+    pipeline = MakeKnowPipe(source_analysis_path, stream='--stream' in sys.argv, base_revision=base_revision)
     success = await pipeline.run_full_pipeline()
     
     if success:
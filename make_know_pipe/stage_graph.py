@@ -0,0 +1,131 @@
+"""
+Stage Graph - Concurrent scheduler for pipeline stages
+
+A pipeline is declared as stages with named inputs. Each stage starts as
+soon as the stages it reads from have finished, so independent branches
+run side by side and wall time tends toward the longest branch. Stages may
+name shared resources (e.g. 'llm') whose limits cap how many of them run
+at once. With a run journal, stages that carry a codec are checkpointed:
+a resumed run restores their outputs instead of running them again.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+StageFn = Callable[..., Awaitable[Any]]
+# (encode, decode) between a stage's result and the JSON stored in a run journal
+Codec = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
+
+class Stage:
+    """A unit of pipeline work; run receives its inputs' results as keyword arguments"""
+
+    def __init__(self, name: str, run: StageFn, inputs: Sequence[str] = (), uses: Sequence[str] = (),
+                 codec: Optional[Codec] = None):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.uses = sorted(set(uses))  # Acquired in a fixed order so stages never deadlock
+        self.codec = codec
+        self.seconds = 0.0
+
+class StageGraph:
+    """DAG of stages run concurrently within shared resource limits"""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, max_concurrency: Optional[int] = None,
+                 journal=None):
+        self.stages: Dict[str, Stage] = {}
+        self.limits = dict(limits or {})
+        self.max_concurrency = max_concurrency
+        self.journal = journal  # RunJournal checkpointing stages that have a codec
+        self.results: Dict[str, Any] = {}
+
+    def add(self, name: str, run: StageFn, inputs: Sequence[str] = (), uses: Sequence[str] = (),
+            codec: Optional[Codec] = None) -> 'StageGraph':
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = Stage(name, run, inputs, uses, codec)
+        return self
+
+    def order(self) -> List[str]:
+        """Stages in dependency order; raises ValueError on unknown inputs or cycles"""
+        for stage in self.stages.values():
+            unknown = [name for name in stage.inputs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} reads unknown stages: {', '.join(unknown)}")
+
+        remaining = {name: len(stage.inputs) for name, stage in self.stages.items()}
+        readers: Dict[str, List[str]] = {name: [] for name in self.stages}
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                readers[name].append(stage.name)
+
+        ready = [name for name, count in remaining.items() if count == 0]
+        ordered = []
+        while ready:
+            name = ready.pop()
+            ordered.append(name)
+            for reader in readers[name]:
+                remaining[reader] -= 1
+                if remaining[reader] == 0:
+                    ready.append(reader)
+        if len(ordered) != len(self.stages):
+            cyclic = sorted(set(self.stages) - set(ordered))
+            raise ValueError(f"Stage graph has a cycle through: {', '.join(cyclic)}")
+        return ordered
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every stage, returning stage name -> result; the first failure cancels the rest"""
+        self.order()
+        self.results = {}
+        semaphores = {resource: asyncio.Semaphore(limit) for resource, limit in self.limits.items()}
+        slots = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage):
+            if stage.inputs:
+                await asyncio.gather(*(tasks[name] for name in stage.inputs))
+            checkpointed = self.journal is not None and stage.codec is not None
+            if checkpointed:
+                finished, output = self.journal.stage_output(stage.name)
+                if finished:
+                    self.results[stage.name] = stage.codec[1](output)
+                    logger.info(f"Stage {stage.name} restored from run journal")
+                    return self.results[stage.name]
+            held = [semaphores[resource] for resource in stage.uses if resource in semaphores]
+            if slots:
+                held.insert(0, slots)
+            for semaphore in held:
+                await semaphore.acquire()
+            try:
+                start = time.perf_counter()
+                result = await stage.run(**{name: self.results[name] for name in stage.inputs})
+                stage.seconds = time.perf_counter() - start
+            finally:
+                for semaphore in reversed(held):
+                    semaphore.release()
+            self.results[stage.name] = result
+            if checkpointed:
+                self.journal.record_stage(stage.name, stage.codec[0](result))
+            logger.info(f"Stage {stage.name} finished in {stage.seconds:.1f}s")
+            return result
+
+        start = time.perf_counter()
+        # Tasks are created before any runs, so every stage can await its inputs' tasks
+        for name, stage in self.stages.items():
+            tasks[name] = asyncio.ensure_future(run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        elapsed = time.perf_counter() - start
+        busy = sum(stage.seconds for stage in self.stages.values())
+        logger.info(f"Ran {len(self.stages)} stages in {elapsed:.1f}s ({busy:.1f}s of stage time)")
+        return self.results